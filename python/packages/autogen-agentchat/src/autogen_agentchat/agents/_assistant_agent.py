@@ -1,12 +1,14 @@
 import asyncio
 import json
 import logging
+import time
 import warnings
 from typing import (
     Any,
     AsyncGenerator,
     Awaitable,
     Callable,
+    Coroutine,
     Dict,
     List,
     Mapping,
@@ -32,7 +34,7 @@
     ModelFamily,
     SystemMessage,
 )
-from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench, Workbench
+from autogen_core.tools import BaseTool, FunctionTool, StaticStreamWorkbench, StreamWorkbench, ToolResult, Workbench
 from pydantic import BaseModel
 from typing_extensions import Self
 
@@ -49,6 +51,7 @@
     StructuredMessageFactory,
     TextMessage,
     ThoughtEvent,
+    ToolCallExecutionChunkEvent,
     ToolCallExecutionEvent,
     ToolCallRequestEvent,
     ToolCallSummaryMessage,
@@ -77,6 +80,11 @@ class AssistantAgentConfig(BaseModel):
     tool_call_summary_format: str
     metadata: Dict[str, str] | None = None
     structured_message_factory: ComponentModel | None = None
+    tool_call_quorum: int | None = None
+    tool_call_quorum_grace_period: float = 0.0
+    tool_call_timeout: float | Dict[str, float] | None = None
+    tool_call_turn_timeout: float | None = None
+    max_concurrent_tool_calls: int | None = None
 
 
 class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
@@ -135,7 +143,10 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
         - When `reflect_on_tool_use` is True, the another model inference is made using the tool calls and results, and final response is returned as a :class:`~autogen_agentchat.messages.TextMessage` or a :class:`~autogen_agentchat.messages.StructuredMessage` (when using structured output) in :attr:`~autogen_agentchat.base.Response.chat_message`.
         - `reflect_on_tool_use` is set to `True` by default when `output_content_type` is set.
         - `reflect_on_tool_use` is set to `False` by default when `output_content_type` is not set.
+    * If a tool streams partial results, i.e., it is a :class:`~autogen_core.tools.BaseStreamTool` or is provided by a :class:`~autogen_core.tools.StreamWorkbench`, the partial results are yielded as :class:`~autogen_agentchat.messages.ToolCallExecutionChunkEvent` from :meth:`on_messages_stream` while the tool runs. These events are not included in :attr:`~autogen_agentchat.base.Response.inner_messages`.
     * If the model returns multiple tool calls, they will be executed concurrently. To disable parallel tool calls you need to configure the model client. For example, set `parallel_tool_calls=False` for :class:`~autogen_ext.models.openai.OpenAIChatCompletionClient` and :class:`~autogen_ext.models.openai.AzureOpenAIChatCompletionClient`.
+    * To avoid waiting on slow tools, set `tool_call_quorum` so the agent moves on to reflection or summary once that many of the concurrent tool calls have completed. Calls that are still running after `tool_call_quorum_grace_period` seconds are cancelled and reported as error results.
+    * To keep a hung tool from blocking the agent, set `tool_call_timeout` for individual calls or `tool_call_turn_timeout` for all calls from one model response. Calls that time out are reported as error results, and :attr:`~autogen_agentchat.messages.ToolCallExecutionEvent.durations` records how long each call took. Use `max_concurrent_tool_calls` to limit how many tool calls run at once.
 
     .. tip::
 
@@ -226,12 +237,32 @@ class AssistantAgent(BaseChatAgent, Component[AssistantAgentConfig]):
 
         memory (Sequence[Memory] | None, optional): The memory store to use for the agent. Defaults to `None`.
         metadata (Dict[str, str] | None, optional): Optional metadata for tracking.
+        tool_call_quorum (int | None, optional): The number of tool calls from a single model response that must
+            complete before the agent moves on. Once the quorum is reached, the agent waits at most
+            `tool_call_quorum_grace_period` seconds for the remaining calls, then cancels any that are still running
+            and reports them as error results, so the reflection or summary is built from the calls that finished.
+            Handoff calls are always awaited. If `None` (the default), the agent waits for all tool calls.
+        tool_call_quorum_grace_period (float, optional): The number of seconds to keep waiting for the remaining
+            tool calls after the `tool_call_quorum` is reached. Calls that finish within this period are merged
+            into the results. Defaults to 0.
+        tool_call_timeout (float | Dict[str, float] | None, optional): The maximum number of seconds a single tool
+            call may run. Either a single value for all tools, or a mapping from tool name to timeout for
+            individual tools; tools not in the mapping have no timeout. A call that times out is reported as an
+            error result while the other calls proceed. Handoff calls are never timed out. Defaults to `None`.
+        tool_call_turn_timeout (float | None, optional): The maximum number of seconds to wait for all tool calls
+            from a single model response. Calls still running at the deadline are cancelled and reported as
+            error results. Handoff calls are not cancelled and are awaited past the deadline. Defaults to `None`.
+        max_concurrent_tool_calls (int | None, optional): The maximum number of tool calls from a single model
+            response that run at the same time. The remaining calls wait for a free slot. If `None` (the default),
+            all calls run concurrently.
 
     Raises:
         ValueError: If tool names are not unique.
         ValueError: If handoff names are not unique.
         ValueError: If handoff names are not unique from tool names.
         ValueError: If maximum number of tool iterations is less than 1.
+        ValueError: If `tool_call_quorum` is less than 1 or `tool_call_quorum_grace_period` is negative.
+        ValueError: If a tool call timeout is not positive or `max_concurrent_tool_calls` is less than 1.
 
     Examples:
 
@@ -676,6 +707,11 @@ def __init__(
         output_content_type_format: str | None = None,
         memory: Sequence[Memory] | None = None,
         metadata: Dict[str, str] | None = None,
+        tool_call_quorum: int | None = None,
+        tool_call_quorum_grace_period: float = 0.0,
+        tool_call_timeout: float | Dict[str, float] | None = None,
+        tool_call_turn_timeout: float | None = None,
+        max_concurrent_tool_calls: int | None = None,
     ):
         super().__init__(name=name, description=description)
         self._metadata = metadata or {}
@@ -754,7 +790,7 @@ def __init__(
             else:
                 self._workbench = [workbench]
         else:
-            self._workbench = [StaticWorkbench(self._tools)]
+            self._workbench = [StaticStreamWorkbench(self._tools)]
 
         if model_context is not None:
             self._model_context = model_context
@@ -780,6 +816,20 @@ def __init__(
             )
         self._tool_call_summary_format = tool_call_summary_format
         self._tool_call_summary_formatter = tool_call_summary_formatter
+        if tool_call_quorum is not None and tool_call_quorum < 1:
+            raise ValueError("The tool call quorum must be at least 1.")
+        if tool_call_quorum_grace_period < 0:
+            raise ValueError("The tool call quorum grace period must not be negative.")
+        self._tool_call_quorum = tool_call_quorum
+        self._tool_call_quorum_grace_period = tool_call_quorum_grace_period
+        timeouts = tool_call_timeout.values() if isinstance(tool_call_timeout, dict) else [tool_call_timeout]
+        if any(timeout is not None and timeout <= 0 for timeout in [*timeouts, tool_call_turn_timeout]):
+            raise ValueError("Tool call timeouts must be positive.")
+        if max_concurrent_tool_calls is not None and max_concurrent_tool_calls < 1:
+            raise ValueError("The maximum number of concurrent tool calls must be at least 1.")
+        self._tool_call_timeout = tool_call_timeout
+        self._tool_call_turn_timeout = tool_call_turn_timeout
+        self._max_concurrent_tool_calls = max_concurrent_tool_calls
         self._is_running = False
 
     @property
@@ -830,6 +880,11 @@ async def on_messages_stream(
         tool_call_summary_formatter = self._tool_call_summary_formatter
         output_content_type = self._output_content_type
         format_string = self._output_content_type_format
+        tool_call_quorum = self._tool_call_quorum
+        tool_call_quorum_grace_period = self._tool_call_quorum_grace_period
+        tool_call_timeout = self._tool_call_timeout
+        tool_call_turn_timeout = self._tool_call_turn_timeout
+        max_concurrent_tool_calls = self._max_concurrent_tool_calls
 
         # STEP 1: Add new user/handoff messages to the model context
         await self._add_messages_to_context(
@@ -901,6 +956,11 @@ async def on_messages_stream(
             tool_call_summary_formatter=tool_call_summary_formatter,
             output_content_type=output_content_type,
             format_string=format_string,
+            tool_call_quorum=tool_call_quorum,
+            tool_call_quorum_grace_period=tool_call_quorum_grace_period,
+            tool_call_timeout=tool_call_timeout,
+            tool_call_turn_timeout=tool_call_turn_timeout,
+            max_concurrent_tool_calls=max_concurrent_tool_calls,
         ):
             yield output_event
 
@@ -1005,6 +1065,11 @@ async def _process_model_result(
         tool_call_summary_formatter: Callable[[FunctionCall, FunctionExecutionResult], str] | None,
         output_content_type: type[BaseModel] | None,
         format_string: str | None = None,
+        tool_call_quorum: int | None = None,
+        tool_call_quorum_grace_period: float = 0.0,
+        tool_call_timeout: float | Dict[str, float] | None = None,
+        tool_call_turn_timeout: float | None = None,
+        max_concurrent_tool_calls: int | None = None,
     ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | Response, None]:
         """
         Handle final or partial responses from model_result, including tool calls, handoffs,
@@ -1051,24 +1116,52 @@ async def _process_model_result(
         yield tool_call_msg
 
         # STEP 4B: Execute tool calls
-        executed_calls_and_results = await asyncio.gather(
-            *[
-                cls._execute_tool_call(
-                    tool_call=call,
+        # Partial results from streaming tools are put on the queue and yielded while the calls run.
+        stream: asyncio.Queue[BaseAgentEvent | BaseChatMessage | None] = asyncio.Queue()
+
+        durations: Dict[str, float] = {}
+
+        async def _execute_tool_calls(
+            function_calls: List[FunctionCall],
+        ) -> List[Tuple[FunctionCall, FunctionExecutionResult]]:
+            try:
+                return await cls._execute_tool_calls(
+                    function_calls=function_calls,
                     workbench=workbench,
                     handoff_tools=handoff_tools,
                     agent_name=agent_name,
                     cancellation_token=cancellation_token,
+                    stream=stream,
+                    tool_call_quorum=tool_call_quorum,
+                    tool_call_quorum_grace_period=tool_call_quorum_grace_period,
+                    tool_call_timeout=tool_call_timeout,
+                    tool_call_turn_timeout=tool_call_turn_timeout,
+                    max_concurrent_tool_calls=max_concurrent_tool_calls,
+                    durations=durations,
                 )
-                for call in model_result.content
-            ]
-        )
+            finally:
+                # Signal the end of the stream, also when a tool call raises.
+                stream.put_nowait(None)
+
+        task = asyncio.create_task(_execute_tool_calls(model_result.content))
+        try:
+            while True:
+                event = await stream.get()
+                if event is None:
+                    break
+                yield event
+            executed_calls_and_results = await task
+        finally:
+            # Do not leave the tool calls running if the caller stops consuming the stream.
+            if not task.done():
+                task.cancel()
         exec_results = [result for _, result in executed_calls_and_results]
 
         # Yield ToolCallExecutionEvent
         tool_call_result_msg = ToolCallExecutionEvent(
             content=exec_results,
             source=agent_name,
+            durations=durations,
         )
         event_logger.debug(tool_call_result_msg)
         await model_context.add_message(FunctionExecutionResultMessage(content=exec_results))
@@ -1295,6 +1388,132 @@ def default_tool_call_summary_formatter(call: FunctionCall, result: FunctionExec
             inner_messages=inner_messages,
         )
 
+    @classmethod
+    async def _execute_tool_calls(
+        cls,
+        function_calls: List[FunctionCall],
+        workbench: Sequence[Workbench],
+        handoff_tools: List[BaseTool[Any, Any]],
+        agent_name: str,
+        cancellation_token: CancellationToken,
+        stream: asyncio.Queue[BaseAgentEvent | BaseChatMessage | None] | None = None,
+        tool_call_quorum: int | None = None,
+        tool_call_quorum_grace_period: float = 0.0,
+        tool_call_timeout: float | Dict[str, float] | None = None,
+        tool_call_turn_timeout: float | None = None,
+        max_concurrent_tool_calls: int | None = None,
+        durations: Dict[str, float] | None = None,
+    ) -> List[Tuple[FunctionCall, FunctionExecutionResult]]:
+        """Execute the tool calls concurrently and return the results in the order of the calls.
+
+        If `tool_call_quorum` is set, stop waiting once that many calls have completed,
+        plus up to `tool_call_quorum_grace_period` seconds for the rest. Calls still running
+        after that, or after `tool_call_turn_timeout` seconds, are cancelled and reported as
+        error results. Handoff calls are never cancelled. The wall-clock duration of each finished call is recorded in `durations`."""
+        handoff_tool_names = {tool.name for tool in handoff_tools}
+        semaphore = asyncio.Semaphore(max_concurrent_tool_calls) if max_concurrent_tool_calls is not None else None
+
+        async def _run_tool_call(call: FunctionCall) -> Tuple[FunctionCall, FunctionExecutionResult]:
+            def _execute() -> Coroutine[Any, Any, Tuple[FunctionCall, FunctionExecutionResult]]:
+                return cls._execute_tool_call(
+                    tool_call=call,
+                    workbench=workbench,
+                    handoff_tools=handoff_tools,
+                    agent_name=agent_name,
+                    cancellation_token=cancellation_token,
+                    stream=stream,
+                )
+
+            # Handoffs are cheap and must always complete, so they bypass the limits.
+            if call.name in handoff_tool_names:
+                return await _execute()
+            if isinstance(tool_call_timeout, dict):
+                timeout = tool_call_timeout.get(call.name)
+            else:
+                timeout = tool_call_timeout
+            if semaphore is not None:
+                await semaphore.acquire()
+            start = time.perf_counter()
+            try:
+                return await asyncio.wait_for(_execute(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return (
+                    call,
+                    FunctionExecutionResult(
+                        content=f"Error: tool call timed out after {timeout} seconds.",
+                        call_id=call.id,
+                        is_error=True,
+                        name=call.name,
+                    ),
+                )
+            finally:
+                if durations is not None:
+                    durations[call.id] = time.perf_counter() - start
+                if semaphore is not None:
+                    semaphore.release()
+
+        tasks = [asyncio.create_task(_run_tool_call(call)) for call in function_calls]
+        if tool_call_turn_timeout is None and (tool_call_quorum is None or tool_call_quorum >= len(tasks)):
+            return list(await asyncio.gather(*tasks))
+
+        handoff_tasks = [
+            task for call, task in zip(function_calls, tasks, strict=True) if call.name in handoff_tool_names
+        ]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + tool_call_turn_timeout if tool_call_turn_timeout is not None else None
+        cancelled_reason = f"Error: tool call cancelled after {tool_call_quorum} other tool call(s) completed."
+        try:
+            if tool_call_quorum is None or tool_call_quorum >= len(tasks):
+                await asyncio.wait(tasks, timeout=tool_call_turn_timeout)
+            else:
+                completed = 0
+                for next_completed in asyncio.as_completed(tasks, timeout=tool_call_turn_timeout):
+                    await next_completed
+                    completed += 1
+                    if completed >= tool_call_quorum:
+                        break
+                # Stragglers get the grace period to finish.
+                remaining = [task for task in tasks if not task.done()]
+                grace_period = tool_call_quorum_grace_period
+                if deadline is not None:
+                    grace_period = min(grace_period, max(deadline - loop.time(), 0.0))
+                if remaining and grace_period > 0:
+                    await asyncio.wait(remaining, timeout=grace_period)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            pending = [task for task in tasks if not task.done() and task not in handoff_tasks]
+            if deadline is not None and loop.time() >= deadline:
+                cancelled_reason = (
+                    f"Error: tool call did not complete within the turn timeout of {tool_call_turn_timeout} seconds."
+                )
+            for task in pending:
+                task.cancel()
+            if pending:
+                # Let the cancelled calls unwind before reading the results.
+                await asyncio.wait(pending)
+            # Handoffs are never cancelled, so they are awaited past the quorum and the turn timeout.
+            if handoff_tasks:
+                await asyncio.wait(handoff_tasks)
+
+        results: List[Tuple[FunctionCall, FunctionExecutionResult]] = []
+        for call, task in zip(function_calls, tasks, strict=True):
+            if task.cancelled():
+                results.append(
+                    (
+                        call,
+                        FunctionExecutionResult(
+                            content=cancelled_reason,
+                            call_id=call.id,
+                            is_error=True,
+                            name=call.name,
+                        ),
+                    )
+                )
+            else:
+                results.append(task.result())
+        return results
+
     @staticmethod
     async def _execute_tool_call(
         tool_call: FunctionCall,
@@ -1302,8 +1521,15 @@ async def _execute_tool_call(
         handoff_tools: List[BaseTool[Any, Any]],
         agent_name: str,
         cancellation_token: CancellationToken,
+        stream: asyncio.Queue[BaseAgentEvent | BaseChatMessage | None] | None = None,
     ) -> Tuple[FunctionCall, FunctionExecutionResult]:
-        """Execute a single tool call and return the result."""
+        """Execute a single tool call and return the result.
+
+        If the tool is provided by a :class:`~autogen_core.tools.StreamWorkbench` and
+        a ``stream`` queue is given, partial results are put on the queue as
+        :class:`~autogen_agentchat.messages.ToolCallExecutionChunkEvent` messages
+        while the tool runs. Agent events and chat messages streamed by the tool
+        (e.g., from a nested agent) are put on the queue as-is."""
         # Load the arguments from the tool call.
         try:
             arguments = json.loads(tool_call.arguments)
@@ -1339,12 +1565,41 @@ async def _execute_tool_call(
         for wb in workbench:
             tools = await wb.list_tools()
             if any(t["name"] == tool_call.name for t in tools):
-                result = await wb.call_tool(
-                    name=tool_call.name,
-                    arguments=arguments,
-                    cancellation_token=cancellation_token,
-                    call_id=tool_call.id,
-                )
+                if isinstance(wb, StreamWorkbench) and stream is not None:
+                    tool_result: ToolResult | None = None
+                    async for item in wb.call_tool_stream(
+                        name=tool_call.name,
+                        arguments=arguments,
+                        cancellation_token=cancellation_token,
+                        call_id=tool_call.id,
+                    ):
+                        if isinstance(item, ToolResult):
+                            tool_result = item
+                        elif isinstance(item, BaseAgentEvent | BaseChatMessage):
+                            await stream.put(item)
+                        else:
+                            if isinstance(item, BaseModel):
+                                chunk = item.model_dump_json()
+                            else:
+                                chunk = str(item)
+                            await stream.put(
+                                ToolCallExecutionChunkEvent(
+                                    content=chunk,
+                                    call_id=tool_call.id,
+                                    name=tool_call.name,
+                                    source=agent_name,
+                                )
+                            )
+                    if tool_result is None:
+                        raise RuntimeError(f"Tool {tool_call.name} did not produce a final result.")
+                    result = tool_result
+                else:
+                    result = await wb.call_tool(
+                        name=tool_call.name,
+                        arguments=arguments,
+                        cancellation_token=cancellation_token,
+                        call_id=tool_call.id,
+                    )
                 return (
                     tool_call,
                     FunctionExecutionResult(
@@ -1369,6 +1624,13 @@ async def on_reset(self, cancellation_token: CancellationToken) -> None:
         """Reset the assistant agent to its initialization state."""
         await self._model_context.clear()
 
+    async def close(self) -> None:
+        """Release the resources of the tools of the agent, e.g., the pooled connections of HTTP tools.
+        Workbenches passed to the agent are not stopped, as they may be shared with other agents."""
+        if self._tools:
+            for workbench in self._workbench:
+                await workbench.stop()
+
     async def save_state(self) -> Mapping[str, Any]:
         """Save the current state of the assistant agent."""
         model_context_state = await self._model_context.save_state()
@@ -1410,6 +1672,11 @@ def _to_config(self) -> AssistantAgentConfig:
             if self._structured_message_factory
             else None,
             metadata=self._metadata,
+            tool_call_quorum=self._tool_call_quorum,
+            tool_call_quorum_grace_period=self._tool_call_quorum_grace_period,
+            tool_call_timeout=self._tool_call_timeout,
+            tool_call_turn_timeout=self._tool_call_turn_timeout,
+            max_concurrent_tool_calls=self._max_concurrent_tool_calls,
         )
 
     @classmethod
@@ -1440,4 +1707,9 @@ def _from_config(cls, config: AssistantAgentConfig) -> Self:
             output_content_type=output_content_type,
             output_content_type_format=format_string,
             metadata=config.metadata,
+            tool_call_quorum=config.tool_call_quorum,
+            tool_call_quorum_grace_period=config.tool_call_quorum_grace_period,
+            tool_call_timeout=config.tool_call_timeout,
+            tool_call_turn_timeout=config.tool_call_turn_timeout,
+            max_concurrent_tool_calls=config.max_concurrent_tool_calls,
         )
@@ -10,6 +10,7 @@
     BaseChatMessage,
     ModelClientStreamingChunkEvent,
     TextMessage,
+    ToolCallExecutionChunkEvent,
 )
 from ..state import BaseState
 
@@ -192,8 +193,8 @@ async def run_stream(
                     yield TaskResult(messages=output_messages)
                 else:
                     yield message
-                    if isinstance(message, ModelClientStreamingChunkEvent):
-                        # Skip the model client streaming chunk events.
+                    if isinstance(message, ModelClientStreamingChunkEvent | ToolCallExecutionChunkEvent):
+                        # Skip the streaming chunk events.
                         continue
                     output_messages.append(message)
 
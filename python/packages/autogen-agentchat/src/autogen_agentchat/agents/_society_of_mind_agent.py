@@ -19,6 +19,7 @@
     HandoffMessage,
     ModelClientStreamingChunkEvent,
     TextMessage,
+    ToolCallExecutionChunkEvent,
 )
 from ._base_chat_agent import BaseChatAgent
 
@@ -201,8 +202,8 @@ async def on_messages_stream(
                     # Skip the task messages.
                     continue
                 yield inner_msg
-                if isinstance(inner_msg, ModelClientStreamingChunkEvent):
-                    # Skip the model client streaming chunk events.
+                if isinstance(inner_msg, ModelClientStreamingChunkEvent | ToolCallExecutionChunkEvent):
+                    # Skip the streaming chunk events.
                     continue
                 inner_messages.append(inner_msg)
         assert result is not None
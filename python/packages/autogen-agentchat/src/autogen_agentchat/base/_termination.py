@@ -1,6 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Sequence
+from contextvars import ContextVar
+from typing import Dict, List, Sequence, Tuple, Type
 
 from autogen_core import Component, ComponentBase, ComponentModel
 from pydantic import BaseModel
@@ -12,6 +13,22 @@
 class TerminatedException(BaseException): ...
 
 
+# The rendered text of the messages being evaluated by a composite termination condition,
+# keyed by message id, so that the text of a message is rendered once for all the conditions.
+_message_texts: ContextVar[Dict[int, str] | None] = ContextVar("_message_texts", default=None)
+
+
+def _message_text(message: BaseAgentEvent | BaseChatMessage) -> str:
+    """Return :meth:`to_text` of the message, cached while a composite condition is evaluated."""
+    texts = _message_texts.get()
+    if texts is None:
+        return message.to_text()
+    text = texts.get(id(message))
+    if text is None:
+        text = texts[id(message)] = message.to_text()
+    return text
+
+
 class TerminationCondition(ABC, ComponentBase[BaseModel]):
     """A stateful condition that determines when a conversation should be terminated.
 
@@ -76,6 +93,22 @@ async def reset(self) -> None:
         """Reset the termination condition."""
         ...
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        """The message types the condition inspects, or None if it inspects all messages.
+
+        Composite conditions skip a condition when none of the messages are of these types,
+        as the condition would neither change its state nor terminate. A condition that does
+        not depend on the messages returns an empty tuple and is evaluated only when it is
+        :attr:`pending`. Defaults to None."""
+        return None
+
+    @property
+    def pending(self) -> bool:
+        """Whether the condition may terminate regardless of the messages, e.g., because a
+        timeout has elapsed or termination was requested externally. Defaults to False."""
+        return False
+
     def __and__(self, other: "TerminationCondition") -> "TerminationCondition":
         """Combine two termination conditions with an AND operation."""
         return AndTerminationCondition(self, other)
@@ -85,6 +118,44 @@ def __or__(self, other: "TerminationCondition") -> "TerminationCondition":
         return OrTerminationCondition(self, other)
 
 
+def _is_relevant(condition: TerminationCondition, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> bool:
+    """Whether calling the condition with the messages may change its state or terminate."""
+    message_types = condition.message_types
+    if message_types is None or condition.pending:
+        return True
+    return bool(message_types) and any(isinstance(message, message_types) for message in messages)
+
+
+def _union_message_types(
+    conditions: Sequence[TerminationCondition],
+) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+    message_types: List[Type[BaseAgentEvent | BaseChatMessage]] = []
+    for condition in conditions:
+        if condition.message_types is None:
+            return None
+        message_types.extend(t for t in condition.message_types if t not in message_types)
+    return tuple(message_types)
+
+
+async def _evaluate(
+    conditions: Sequence[TerminationCondition], messages: Sequence[BaseAgentEvent | BaseChatMessage]
+) -> List[StopMessage | None]:
+    """Evaluate the conditions concurrently on the messages. Conditions that are not relevant
+    to the messages are skipped and yield None, and the text of each message is rendered once."""
+    token = _message_texts.set({}) if _message_texts.get() is None else None
+    try:
+        relevant = [i for i, condition in enumerate(conditions) if _is_relevant(condition, messages)]
+        results: List[StopMessage | None] = [None] * len(conditions)
+        for i, stop_message in zip(
+            relevant, await asyncio.gather(*[conditions[i](messages) for i in relevant]), strict=True
+        ):
+            results[i] = stop_message
+    finally:
+        if token is not None:
+            _message_texts.reset(token)
+    return results
+
+
 class AndTerminationConditionConfig(BaseModel):
     conditions: List[ComponentModel]
 
@@ -102,12 +173,20 @@ def __init__(self, *conditions: TerminationCondition) -> None:
     def terminated(self) -> bool:
         return all(condition.terminated for condition in self._conditions)
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return _union_message_types([condition for condition in self._conditions if not condition.terminated])
+
+    @property
+    def pending(self) -> bool:
+        return any(condition.pending for condition in self._conditions if not condition.terminated)
+
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self.terminated:
             raise TerminatedException("Termination condition has already been reached.")
         # Check all remaining conditions.
-        stop_messages = await asyncio.gather(
-            *[condition(messages) for condition in self._conditions if not condition.terminated]
+        stop_messages = await _evaluate(
+            [condition for condition in self._conditions if not condition.terminated], messages
         )
         # Collect stop messages.
         for stop_message in stop_messages:
@@ -153,10 +232,18 @@ def __init__(self, *conditions: TerminationCondition) -> None:
     def terminated(self) -> bool:
         return any(condition.terminated for condition in self._conditions)
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return _union_message_types(self._conditions)
+
+    @property
+    def pending(self) -> bool:
+        return any(condition.pending for condition in self._conditions)
+
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self.terminated:
             raise RuntimeError("Termination condition has already been reached")
-        stop_messages = await asyncio.gather(*[condition(messages) for condition in self._conditions])
+        stop_messages = await _evaluate(self._conditions, messages)
         stop_messages_filter = [stop_message for stop_message in stop_messages if stop_message is not None]
         if len(stop_messages_filter) > 0:
             content = ", ".join(stop_message.content for stop_message in stop_messages_filter)
@@ -1,12 +1,13 @@
 import asyncio
 import time
-from typing import Awaitable, Callable, List, Sequence
+from typing import Awaitable, Callable, List, Sequence, Tuple, Type
 
 from autogen_core import Component
 from pydantic import BaseModel
 from typing_extensions import Self
 
 from ..base import TerminatedException, TerminationCondition
+from ..base._termination import _message_text
 from ..messages import (
     BaseAgentEvent,
     BaseChatMessage,
@@ -34,6 +35,10 @@ def __init__(self) -> None:
     def terminated(self) -> bool:
         return self._terminated
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return (StopMessage,)
+
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self._terminated:
             raise TerminatedException("Termination condition has already been reached")
@@ -136,7 +141,7 @@ async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -
             if self._sources is not None and message.source not in self._sources:
                 continue
 
-            content = message.to_text()
+            content = _message_text(message)
             if self._termination_text in content:
                 self._terminated = True
                 return StopMessage(
@@ -329,6 +334,10 @@ def __init__(self, target: str) -> None:
     def terminated(self) -> bool:
         return self._terminated
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return (HandoffMessage,)
+
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self._terminated:
             raise TerminatedException("Termination condition has already been reached")
@@ -374,6 +383,14 @@ def __init__(self, timeout_seconds: float) -> None:
     def terminated(self) -> bool:
         return self._terminated
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return ()
+
+    @property
+    def pending(self) -> bool:
+        return not self._terminated and (time.monotonic() - self._start_time) >= self._timeout_seconds
+
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self._terminated:
             raise TerminatedException("Termination condition has already been reached")
@@ -432,6 +449,14 @@ def __init__(self) -> None:
     def terminated(self) -> bool:
         return self._terminated
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return ()
+
+    @property
+    def pending(self) -> bool:
+        return self._setted and not self._terminated
+
     def set(self) -> None:
         """Set the termination condition to terminated."""
         self._setted = True
@@ -534,6 +559,10 @@ def __init__(self, source: str | None = None) -> None:
     def terminated(self) -> bool:
         return self._terminated
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return (TextMessage,)
+
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self._terminated:
             raise TerminatedException("Termination condition has already been reached")
@@ -585,6 +614,10 @@ def __init__(self, function_name: str) -> None:
     def terminated(self) -> bool:
         return self._terminated
 
+    @property
+    def message_types(self) -> Tuple[Type[BaseAgentEvent | BaseChatMessage], ...] | None:
+        return (ToolCallExecutionEvent,)
+
     async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
         if self._terminated:
             raise TerminatedException("Termination condition has already been reached")
@@ -484,12 +484,38 @@ class ToolCallExecutionEvent(BaseAgentEvent):
     content: List[FunctionExecutionResult]
     """The tool call results."""
 
+    durations: Dict[str, float] = {}
+    """The wall-clock execution time of each tool call in seconds, keyed by call ID.
+    Calls that were cancelled before they started have no entry."""
+
     type: Literal["ToolCallExecutionEvent"] = "ToolCallExecutionEvent"
 
     def to_text(self) -> str:
         return str(self.content)
 
 
+class ToolCallExecutionChunkEvent(BaseAgentEvent):
+    """An event signaling a partial result from a tool call that is still executing.
+
+    It is produced when a tool streams its output through a
+    :class:`~autogen_core.tools.StreamWorkbench`. The complete result is
+    reported afterwards in a :class:`ToolCallExecutionEvent`."""
+
+    content: str
+    """A partial result from the tool call."""
+
+    call_id: str
+    """The ID of the tool call that produced the partial result."""
+
+    name: str
+    """The name of the tool that produced the partial result."""
+
+    type: Literal["ToolCallExecutionChunkEvent"] = "ToolCallExecutionChunkEvent"
+
+    def to_text(self) -> str:
+        return self.content
+
+
 class UserInputRequestedEvent(BaseAgentEvent):
     """An event signaling a that the user proxy has requested user input. Published prior to invoking the input callback."""
 
@@ -585,6 +611,7 @@ def __init__(self) -> None:
         self._message_types[HandoffMessage.__name__] = HandoffMessage
         self._message_types[ToolCallRequestEvent.__name__] = ToolCallRequestEvent
         self._message_types[ToolCallExecutionEvent.__name__] = ToolCallExecutionEvent
+        self._message_types[ToolCallExecutionChunkEvent.__name__] = ToolCallExecutionChunkEvent
         self._message_types[MemoryQueryEvent.__name__] = MemoryQueryEvent
         self._message_types[UserInputRequestedEvent.__name__] = UserInputRequestedEvent
         self._message_types[ModelClientStreamingChunkEvent.__name__] = ModelClientStreamingChunkEvent
@@ -641,6 +668,7 @@ def create(self, data: Mapping[str, Any]) -> BaseAgentEvent | BaseChatMessage:
 AgentEvent = Annotated[
     ToolCallRequestEvent
     | ToolCallExecutionEvent
+    | ToolCallExecutionChunkEvent
     | MemoryQueryEvent
     | UserInputRequestedEvent
     | ModelClientStreamingChunkEvent
@@ -667,6 +695,7 @@ def create(self, data: Mapping[str, Any]) -> BaseAgentEvent | BaseChatMessage:
     "StopMessage",
     "TextMessage",
     "ToolCallExecutionEvent",
+    "ToolCallExecutionChunkEvent",
     "ToolCallRequestEvent",
     "ToolCallSummaryMessage",
     "MemoryQueryEvent",
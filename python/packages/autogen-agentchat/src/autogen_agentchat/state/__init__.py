@@ -1,5 +1,6 @@
 """State management for agents, teams and termination conditions."""
 
+from ._checkpoint import CheckpointStore, FileCheckpointStore, InMemoryCheckpointStore, TeamCheckpointer
 from ._states import (
     AssistantAgentState,
     BaseGroupChatManagerState,
@@ -10,6 +11,7 @@
     SelectorManagerState,
     SocietyOfMindAgentState,
     SwarmManagerState,
+    TeamCheckpoint,
     TeamState,
 )
 
@@ -24,4 +26,9 @@
     "MagenticOneOrchestratorState",
     "TeamState",
     "SocietyOfMindAgentState",
+    "TeamCheckpoint",
+    "CheckpointStore",
+    "InMemoryCheckpointStore",
+    "FileCheckpointStore",
+    "TeamCheckpointer",
 ]
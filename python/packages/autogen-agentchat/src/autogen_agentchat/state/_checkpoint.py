@@ -0,0 +1,306 @@
+import asyncio
+import copy
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping
+
+from pydantic_core import to_jsonable_python
+
+from ._states import TeamCheckpoint, TeamState
+
+if TYPE_CHECKING:
+    from ..base import Team
+
+
+class CheckpointStore(ABC):
+    """A store of the checkpoints written by :class:`TeamCheckpointer`.
+
+    The checkpoints of a team are an append-only sequence of records identified by
+    a name. Compaction replaces all the records of a name with a single full checkpoint.
+    """
+
+    @abstractmethod
+    async def append(self, name: str, checkpoint: Mapping[str, Any]) -> None:
+        """Append a checkpoint to the records of `name`."""
+        ...
+
+    @abstractmethod
+    async def replace(self, name: str, checkpoint: Mapping[str, Any]) -> None:
+        """Replace all the records of `name` with a single checkpoint."""
+        ...
+
+    @abstractmethod
+    async def read(self, name: str) -> List[Mapping[str, Any]]:
+        """Read the records of `name` in the order they were written.
+        Returns an empty list if there are no records."""
+        ...
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """A checkpoint store that keeps the checkpoints in memory."""
+
+    def __init__(self) -> None:
+        self._records: Dict[str, List[Mapping[str, Any]]] = {}
+
+    async def append(self, name: str, checkpoint: Mapping[str, Any]) -> None:
+        self._records.setdefault(name, []).append(copy.deepcopy(checkpoint))
+
+    async def replace(self, name: str, checkpoint: Mapping[str, Any]) -> None:
+        self._records[name] = [copy.deepcopy(checkpoint)]
+
+    async def read(self, name: str) -> List[Mapping[str, Any]]:
+        return copy.deepcopy(self._records.get(name, []))
+
+
+class FileCheckpointStore(CheckpointStore):
+    """A checkpoint store that writes the checkpoints of each name to a JSON lines
+    file in a directory. Appending a checkpoint writes a single line, and compaction
+    atomically replaces the file. A partially written last line, e.g., after a crash,
+    is removed before the next checkpoint is appended.
+
+    Args:
+        directory (str): The directory of the checkpoint files. It is created if it does not exist.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, f"{name}.jsonl")
+
+    async def append(self, name: str, checkpoint: Mapping[str, Any]) -> None:
+        await asyncio.to_thread(self._append, self._path(name), checkpoint)
+
+    async def replace(self, name: str, checkpoint: Mapping[str, Any]) -> None:
+        path = self._path(name)
+        await asyncio.to_thread(self._write, path + ".tmp", "w", checkpoint)
+        os.replace(path + ".tmp", path)
+
+    async def read(self, name: str) -> List[Mapping[str, Any]]:
+        return await asyncio.to_thread(self._read, self._path(name))
+
+    @classmethod
+    def _append(cls, path: str, checkpoint: Mapping[str, Any]) -> None:
+        if os.path.exists(path):
+            cls._truncate_partial_line(path)
+        cls._write(path, "a", checkpoint)
+
+    @staticmethod
+    def _truncate_partial_line(path: str) -> None:
+        """Remove the bytes after the last newline of the file, i.e., a partially written line."""
+        with open(path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                block = f.read(position - start)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _write(path: str, mode: str, checkpoint: Mapping[str, Any]) -> None:
+        with open(path, mode, encoding="utf-8") as f:
+            f.write(json.dumps(checkpoint, default=to_jsonable_python) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _read(path: str) -> List[Mapping[str, Any]]:
+        if not os.path.exists(path):
+            return []
+        records: List[Mapping[str, Any]] = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A partially written line, e.g., after a crash, is skipped.
+                    continue
+        return records
+
+
+class TeamCheckpointer:
+    """Write incremental checkpoints of a team to a :class:`CheckpointStore`.
+
+    Saving a full team state after every turn costs time and space proportional to
+    the length of the conversation, since the state includes the message thread of
+    the group chat manager and the model context of each agent. Instead, the checkpointer
+    compares the team state with the previous checkpoint and appends a delta checkpoint
+    with only the changes: the messages appended to lists, e.g., message threads and
+    model contexts, and the other fields that changed. Agents whose state did not change
+    are omitted, and each agent has a version counter that is incremented when it changes.
+
+    Every `compact_every` delta checkpoints, and on the first save, the checkpointer
+    writes a full checkpoint that replaces the previous records in the store.
+
+    The team state is obtained with :meth:`~autogen_agentchat.base.Team.save_state`, which
+    saves the agents of a group chat concurrently, and must be in the
+    :class:`~autogen_agentchat.state.TeamState` format.
+
+    Args:
+        team (Team): The team to checkpoint.
+        store (CheckpointStore): The store of the checkpoints.
+        name (str): The name of the checkpoints of the team in the store.
+        compact_every (int, optional): The number of delta checkpoints between full checkpoints. Defaults to 20.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_agentchat.agents import AssistantAgent
+            from autogen_agentchat.conditions import MaxMessageTermination
+            from autogen_agentchat.state import FileCheckpointStore, TeamCheckpointer
+            from autogen_agentchat.teams import RoundRobinGroupChat
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+            async def main() -> None:
+                model_client = OpenAIChatCompletionClient(model="gpt-4o")
+                agent1 = AssistantAgent("Assistant1", model_client=model_client)
+                agent2 = AssistantAgent("Assistant2", model_client=model_client)
+                team = RoundRobinGroupChat([agent1, agent2], termination_condition=MaxMessageTermination(3))
+                checkpointer = TeamCheckpointer(team, FileCheckpointStore("checkpoints"), name="session")
+
+                # Restore the team if it was checkpointed before.
+                await checkpointer.restore()
+                for task in ["Write a poem about the ocean.", "Make it shorter."]:
+                    await team.run(task=task)
+                    # Checkpoint the team after every run.
+                    await checkpointer.save()
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(self, team: "Team", store: CheckpointStore, name: str, compact_every: int = 20) -> None:
+        if compact_every < 1:
+            raise ValueError("compact_every must be at least 1.")
+        self._team = team
+        self._store = store
+        self._name = name
+        self._compact_every = compact_every
+        # The team state as of the last checkpoint, None if nothing was checkpointed.
+        self._agent_states: Dict[str, Any] | None = None
+        self._agent_versions: Dict[str, int] = {}
+        self._num_deltas = 0
+
+    @property
+    def agent_versions(self) -> Mapping[str, int]:
+        """The version of each agent state as of the last checkpoint."""
+        return dict(self._agent_versions)
+
+    async def save(self, full: bool = False) -> TeamCheckpoint:
+        """Checkpoint the team.
+
+        Args:
+            full (bool, optional): Whether to write a full checkpoint regardless of the compaction interval.
+                Defaults to False.
+
+        Returns:
+            TeamCheckpoint: The checkpoint that was written.
+        """
+        team_state = TeamState.model_validate(await self._team.save_state())
+        # Normalize the states to JSON-compatible values, so that they compare equal to stored states.
+        agent_states: Dict[str, Any] = to_jsonable_python(dict(team_state.agent_states))
+
+        if self._agent_states is None or full or self._num_deltas >= self._compact_every:
+            for name in agent_states:
+                if self._agent_states is None or self._agent_states.get(name) != agent_states[name]:
+                    self._agent_versions[name] = self._agent_versions.get(name, 0) + 1
+            checkpoint = TeamCheckpoint(full=True, agent_versions=dict(self._agent_versions), agent_states=agent_states)
+            await self._store.replace(self._name, checkpoint.model_dump())
+            self._num_deltas = 0
+        else:
+            agent_deltas: Dict[str, List[Mapping[str, Any]]] = {}
+            for name, state in agent_states.items():
+                delta: List[Mapping[str, Any]] = []
+                if name in self._agent_states:
+                    _diff(self._agent_states[name], state, [], delta)
+                else:
+                    delta.append({"op": "set", "path": [], "value": state})
+                if delta:
+                    agent_deltas[name] = delta
+                    self._agent_versions[name] = self._agent_versions.get(name, 0) + 1
+            checkpoint = TeamCheckpoint(
+                full=False, agent_versions=dict(self._agent_versions), agent_deltas=agent_deltas
+            )
+            await self._store.append(self._name, checkpoint.model_dump())
+            self._num_deltas += 1
+        self._agent_states = agent_states
+        return checkpoint
+
+    async def restore(self) -> bool:
+        """Load the team state from the latest full checkpoint in the store and the
+        delta checkpoints written after it.
+
+        Returns:
+            bool: Whether a checkpoint was found and loaded into the team.
+        """
+        records = [TeamCheckpoint.model_validate(record) for record in await self._store.read(self._name)]
+        start = max((i for i, record in enumerate(records) if record.full), default=None)
+        if start is None:
+            return False
+        agent_states: Dict[str, Any] = copy.deepcopy(dict(records[start].agent_states))
+        for record in records[start + 1 :]:
+            for name, delta in record.agent_deltas.items():
+                agent_states[name] = _apply(agent_states.get(name), delta)
+        await self._team.load_state(TeamState(agent_states=agent_states).model_dump())
+        self._agent_states = agent_states
+        self._agent_versions = dict(records[-1].agent_versions)
+        self._num_deltas = len(records) - start - 1
+        return True
+
+
+def _diff(old: Any, new: Any, path: List[str], delta: List[Mapping[str, Any]]) -> None:
+    """Append to `delta` the operations that change `old` into `new`.
+    Lists that only grew are recorded as an append of the new items."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in new.items():  # type: ignore[reportUnknownVariableType]
+            if key in old:
+                _diff(old[key], value, [*path, key], delta)
+            else:
+                delta.append({"op": "set", "path": [*path, key], "value": value})
+        for key in old:  # type: ignore[reportUnknownVariableType]
+            if key not in new:
+                delta.append({"op": "delete", "path": [*path, key]})
+    elif isinstance(old, list) and isinstance(new, list) and len(new) >= len(old) and new[: len(old)] == old:  # type: ignore[reportUnknownArgumentType]
+        if len(new) > len(old):  # type: ignore[reportUnknownArgumentType]
+            delta.append({"op": "append", "path": path, "value": new[len(old) :]})
+    elif old != new:
+        delta.append({"op": "set", "path": path, "value": new})
+
+
+def _apply(state: Any, delta: List[Mapping[str, Any]]) -> Any:
+    """Apply the operations computed by :func:`_diff` to `state`, in place when possible."""
+    for op in delta:
+        path: List[str] = op["path"]
+        if not path:
+            if op["op"] == "append":
+                state.extend(copy.deepcopy(op["value"]))
+            else:
+                state = copy.deepcopy(op["value"])
+            continue
+        parent = state
+        for key in path[:-1]:
+            parent = parent[key]
+        if op["op"] == "set":
+            parent[path[-1]] = copy.deepcopy(op["value"])
+        elif op["op"] == "append":
+            parent[path[-1]].extend(copy.deepcopy(op["value"]))
+        elif op["op"] == "delete":
+            del parent[path[-1]]
+        else:
+            raise ValueError(f"Unknown checkpoint operation: {op['op']}")
+    return state
@@ -24,6 +24,20 @@ class TeamState(BaseState):
     type: str = Field(default="TeamState")
 
 
+class TeamCheckpoint(BaseState):
+    """A checkpoint of a team written by :class:`~autogen_agentchat.state.TeamCheckpointer`.
+
+    A full checkpoint contains the state of every agent in `agent_states`. A delta
+    checkpoint contains, in `agent_deltas`, the changes to the state of each agent
+    that changed since the previous checkpoint."""
+
+    full: bool = Field(default=True)
+    agent_versions: Mapping[str, int] = Field(default_factory=dict)
+    agent_states: Mapping[str, Any] = Field(default_factory=dict)
+    agent_deltas: Mapping[str, List[Mapping[str, Any]]] = Field(default_factory=dict)
+    type: str = Field(default="TeamCheckpoint")
+
+
 class BaseGroupChatManagerState(BaseState):
     """Base state for all group chat managers."""
 
@@ -51,6 +65,7 @@ class SelectorManagerState(BaseGroupChatManagerState):
     """State for :class:`~autogen_agentchat.teams.SelectorGroupChat` manager."""
 
     previous_speaker: Optional[str] = Field(default=None)
+    previous_speakers: List[str] = Field(default_factory=list)
     type: str = Field(default="SelectorManagerState")
 
 
@@ -13,13 +13,14 @@
 )
 from ._group_chat._magentic_one import MagenticOneGroupChat
 from ._group_chat._round_robin_group_chat import RoundRobinGroupChat
-from ._group_chat._selector_group_chat import SelectorGroupChat
+from ._group_chat._selector_group_chat import SelectorGroupChat, SpeakerSelectionMetrics
 from ._group_chat._swarm_group_chat import Swarm
 
 __all__ = [
     "BaseGroupChat",
     "RoundRobinGroupChat",
     "SelectorGroupChat",
+    "SpeakerSelectionMetrics",
     "Swarm",
     "MagenticOneGroupChat",
     "DiGraphBuilder",
@@ -1,10 +1,12 @@
 import asyncio
 import uuid
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, AsyncGenerator, Callable, Dict, List, Mapping, Sequence
 
 from autogen_core import (
     AgentId,
+    AgentInstantiationContext,
     AgentRuntime,
     AgentType,
     CancellationToken,
@@ -23,8 +25,10 @@
     StopMessage,
     StructuredMessage,
     TextMessage,
+    ToolCallExecutionChunkEvent,
 )
 from ...state import TeamState
+from ._base_group_chat_manager import BaseGroupChatManager
 from ._chat_agent_container import ChatAgentContainer
 from ._events import (
     GroupChatPause,
@@ -34,14 +38,54 @@
     GroupChatTermination,
     SerializableException,
 )
+from ._message_thread import MessageThread
 from ._sequential_routed_agent import SequentialRoutedAgent
 
 
+class _TeamTemplate:
+    """The agent types registered in a runtime for a team template, shared by all
+    teams of the template. Each team is identified by its team ID, which is used as
+    the agent key, so the registered factories look up the team by the agent key."""
+
+    def __init__(self, team_class: type["BaseGroupChat"], group_chat_manager_name: str, participant_names: List[str]):
+        self.team_class = team_class
+        self.group_chat_manager_name = group_chat_manager_name
+        self.participant_names = participant_names
+        self.teams: weakref.WeakValueDictionary[str, BaseGroupChat] = weakref.WeakValueDictionary()
+        self.registered = False
+        self.lock = asyncio.Lock()
+
+    def matches(self, team: "BaseGroupChat") -> bool:
+        return (
+            type(team) is self.team_class
+            and team._group_chat_manager_name == self.group_chat_manager_name  # pyright: ignore[reportPrivateUsage]
+            and team._participant_names == self.participant_names  # pyright: ignore[reportPrivateUsage]
+        )
+
+    def current_team(self) -> "BaseGroupChat":
+        team_id = AgentInstantiationContext.current_agent_id().key
+        team = self.teams.get(team_id)
+        if team is None:
+            raise RuntimeError(f"Team {team_id} is not a member of the team template.")
+        return team
+
+
+# The team templates registered in each shared runtime, by template name.
+_team_templates: weakref.WeakKeyDictionary[AgentRuntime, Dict[str, _TeamTemplate]] = weakref.WeakKeyDictionary()
+
+
 class BaseGroupChat(Team, ABC, ComponentBase[BaseModel]):
     """The base class for group chat teams.
 
     To implement a group chat team, first create a subclass of :class:`BaseGroupChatManager` and then
     create a subclass of :class:`BaseGroupChat` that uses the group chat manager.
+
+    Teams that share a runtime can be created from a team template by setting `team_template`.
+    The agent types and subscriptions of a template are registered in the runtime once, by the first
+    team of the template, and every team is addressed by its own team ID as the agent key. Running a
+    team on a started shared runtime then only sends a :class:`GroupChatStart` message to its group
+    chat manager, so many concurrent teams can be served by one long-lived runtime.
+    Call :meth:`close` to remove the agents of a team from the runtime when it is no longer needed.
     """
 
     component_type = "team"
@@ -56,6 +100,9 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        team_template: str | None = None,
+        message_thread_window: int | None = None,
+        message_thread_spill_dir: str | None = None,
     ):
         if len(participants) == 0:
             raise ValueError("At least one participant is required.")
@@ -65,6 +112,10 @@ def __init__(
         self._base_group_chat_manager_class = group_chat_manager_class
         self._termination_condition = termination_condition
         self._max_turns = max_turns
+        if message_thread_window is not None and message_thread_window < 1:
+            raise ValueError("The message thread window must be at least 1.")
+        self._message_thread_window = message_thread_window
+        self._message_thread_spill_dir = message_thread_spill_dir
         self._message_factory = MessageFactory()
         if custom_message_types is not None:
             for message_type in custom_message_types:
@@ -86,6 +137,12 @@ def __init__(
         # So if you create two instances of group chat, there will be two teams with different IDs.
         self._team_id = str(uuid.uuid4())
 
+        # Teams of the same template share the agent and topic types in the runtime,
+        # and are distinguished by the team ID used as the agent key.
+        if team_template is not None and runtime is None:
+            raise ValueError("A team template requires a shared runtime.")
+        type_suffix = team_template if team_template is not None else self._team_id
+
         # Constants for the group chat team.
         # The names are used to identify the agents within the team.
         # The names may not be unique across different teams.
@@ -93,16 +150,14 @@ def __init__(
         self._participant_names: List[str] = [participant.name for participant in participants]
         self._participant_descriptions: List[str] = [participant.description for participant in participants]
         # The group chat topic type is used for broadcast communication among all participants and the group chat manager.
-        self._group_topic_type = f"group_topic_{self._team_id}"
+        self._group_topic_type = f"group_topic_{type_suffix}"
         # The group chat manager topic type is used for direct communication with the group chat manager.
-        self._group_chat_manager_topic_type = f"{self._group_chat_manager_name}_{self._team_id}"
+        self._group_chat_manager_topic_type = f"{self._group_chat_manager_name}_{type_suffix}"
         # The participant topic types are used for direct communication with each participant.
-        self._participant_topic_types: List[str] = [
-            f"{participant.name}_{self._team_id}" for participant in participants
-        ]
+        self._participant_topic_types: List[str] = [f"{participant.name}_{type_suffix}" for participant in participants]
         # The output topic type is used for emitting streaming messages from the group chat.
         # The group chat manager will relay the messages to the output message queue.
-        self._output_topic_type = f"output_topic_{self._team_id}"
+        self._output_topic_type = f"output_topic_{type_suffix}"
 
         # The queue for collecting the output messages.
         self._output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination] = (
@@ -119,6 +174,20 @@ def __init__(
             self._runtime = SingleThreadedAgentRuntime(ignore_unhandled_exceptions=False)
             self._embedded_runtime = True
 
+        # Join the team template in the runtime.
+        self._template: _TeamTemplate | None = None
+        if team_template is not None:
+            templates = _team_templates.setdefault(self._runtime, {})
+            self._template = templates.setdefault(
+                team_template, _TeamTemplate(type(self), self._group_chat_manager_name, self._participant_names)
+            )
+            if not self._template.matches(self):
+                raise ValueError(
+                    f"The team does not match the team template '{team_template}' registered in the runtime. "
+                    "Teams of the same template must have the same class, participant names and group chat manager name."
+                )
+            self._template.teams[self._team_id] = self
+
         # Flag to track if the group chat has been initialized.
         self._initialized = False
 
@@ -156,21 +225,94 @@ def _factory() -> ChatAgentContainer:
 
         return _factory
 
+    def _create_own_group_chat_manager_factory(self) -> Callable[[], SequentialRoutedAgent]:
+        factory = self._create_group_chat_manager_factory(
+            name=self._group_chat_manager_name,
+            group_topic_type=self._group_topic_type,
+            output_topic_type=self._output_topic_type,
+            participant_names=self._participant_names,
+            participant_topic_types=self._participant_topic_types,
+            participant_descriptions=self._participant_descriptions,
+            output_message_queue=self._output_message_queue,
+            termination_condition=self._termination_condition,
+            max_turns=self._max_turns,
+            message_factory=self._message_factory,
+        )
+        if self._message_thread_window is None:
+            return factory
+
+        def _factory() -> SequentialRoutedAgent:
+            manager = factory()
+            if isinstance(manager, BaseGroupChatManager):
+                manager.set_message_thread(
+                    MessageThread(
+                        self._message_factory,
+                        window=self._message_thread_window,
+                        spill_dir=self._message_thread_spill_dir,
+                    )
+                )
+            return manager
+
+        return _factory
+
     async def _init(self, runtime: AgentRuntime) -> None:
+        if self._template is None:
+            await self._register(
+                runtime,
+                participant_factories=[
+                    self._create_participant_factory(
+                        self._group_topic_type, self._output_topic_type, participant, self._message_factory
+                    )
+                    for participant in self._participants
+                ],
+                group_chat_manager_factory=self._create_own_group_chat_manager_factory(),
+            )
+        else:
+            await self._register_team_template(runtime, self._template)
+        self._initialized = True
+
+    async def _register_team_template(self, runtime: AgentRuntime, template: _TeamTemplate) -> None:
+        async with template.lock:
+            if template.registered:
+                return
+
+            # The factories create the agents of the team whose ID is the agent key.
+            def _participant_factory(index: int) -> Callable[[], ChatAgentContainer]:
+                def _factory() -> ChatAgentContainer:
+                    team = template.current_team()
+                    return team._create_participant_factory(
+                        team._group_topic_type,
+                        team._output_topic_type,
+                        team._participants[index],
+                        team._message_factory,
+                    )()
+
+                return _factory
+
+            def _group_chat_manager_factory() -> SequentialRoutedAgent:
+                return template.current_team()._create_own_group_chat_manager_factory()()
+
+            await self._register(
+                runtime,
+                participant_factories=[_participant_factory(i) for i in range(len(self._participants))],
+                group_chat_manager_factory=_group_chat_manager_factory,
+            )
+            template.registered = True
+
+    async def _register(
+        self,
+        runtime: AgentRuntime,
+        participant_factories: List[Callable[[], ChatAgentContainer]],
+        group_chat_manager_factory: Callable[[], SequentialRoutedAgent],
+    ) -> None:
         # Constants for the group chat manager.
         group_chat_manager_agent_type = AgentType(self._group_chat_manager_topic_type)
 
         # Register participants.
         # Use the participant topic type as the agent type.
-        for participant, agent_type in zip(self._participants, self._participant_topic_types, strict=True):
+        for factory, agent_type in zip(participant_factories, self._participant_topic_types, strict=True):
             # Register the participant factory.
-            await ChatAgentContainer.register(
-                runtime,
-                type=agent_type,
-                factory=self._create_participant_factory(
-                    self._group_topic_type, self._output_topic_type, participant, self._message_factory
-                ),
-            )
+            await ChatAgentContainer.register(runtime, type=agent_type, factory=factory)
             # Add subscriptions for the participant.
             # The participant should be able to receive messages from its own topic.
             await runtime.add_subscription(TypeSubscription(topic_type=agent_type, agent_type=agent_type))
@@ -181,18 +323,7 @@ async def _init(self, runtime: AgentRuntime) -> None:
         await self._base_group_chat_manager_class.register(
             runtime,
             type=group_chat_manager_agent_type.type,
-            factory=self._create_group_chat_manager_factory(
-                name=self._group_chat_manager_name,
-                group_topic_type=self._group_topic_type,
-                output_topic_type=self._output_topic_type,
-                participant_names=self._participant_names,
-                participant_topic_types=self._participant_topic_types,
-                participant_descriptions=self._participant_descriptions,
-                output_message_queue=self._output_message_queue,
-                termination_condition=self._termination_condition,
-                max_turns=self._max_turns,
-                message_factory=self._message_factory,
-            ),
+            factory=group_chat_manager_factory,
         )
         # Add subscriptions for the group chat manager.
         # The group chat manager should be able to receive messages from the its own topic.
@@ -210,8 +341,6 @@ async def _init(self, runtime: AgentRuntime) -> None:
             TypeSubscription(topic_type=self._output_topic_type, agent_type=group_chat_manager_agent_type.type)
         )
 
-        self._initialized = True
-
     async def run(
         self,
         *,
@@ -326,7 +455,8 @@ async def run_stream(
 
         .. note::
 
-            If an agent produces :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`,
+            If an agent produces :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`
+            or :class:`~autogen_agentchat.messages.ToolCallExecutionChunkEvent`,
             the message will be yielded in the stream but it will not be included in the
             :attr:`~autogen_agentchat.base.TaskResult.messages`.
 
@@ -519,8 +649,8 @@ async def stop_runtime() -> None:
                     stop_reason = message.message.content
                     break
                 yield message
-                if isinstance(message, ModelClientStreamingChunkEvent):
-                    # Skip the model client streaming chunk events.
+                if isinstance(message, ModelClientStreamingChunkEvent | ToolCallExecutionChunkEvent):
+                    # Skip the streaming chunk events.
                     continue
                 output_messages.append(message)
 
@@ -713,8 +843,8 @@ async def save_state(self) -> Mapping[str, Any]:
         """Save the state of the group chat team.
 
         The state is saved by calling the :meth:`~autogen_core.AgentRuntime.agent_save_state` method
-        on each participant and the group chat manager with their internal agent ID.
-        The state is returned as a nested dictionary: a dictionary with key `agent_states`,
+        on each participant and the group chat manager with their internal agent ID. The agents
+        are saved concurrently. The state is returned as a nested dictionary: a dictionary with key `agent_states`,
         which is a dictionary the agent names as keys and the state as values.
 
         .. code-block:: text
@@ -747,16 +877,15 @@ async def save_state(self) -> Mapping[str, Any]:
         # Store state of each agent by their name.
         # NOTE: we don't use the agent ID as the key here because we need to be able to decouple
         # the state of the agents from their identities in the agent runtime.
-        agent_states: Dict[str, Mapping[str, Any]] = {}
-        # Save the state of all participants.
-        for name, agent_type in zip(self._participant_names, self._participant_topic_types, strict=True):
-            agent_id = AgentId(type=agent_type, key=self._team_id)
-            # NOTE: We are using the runtime's save state method rather than the agent instance's
-            # save_state method because we want to support saving state of remote agents.
-            agent_states[name] = await self._runtime.agent_save_state(agent_id)
-        # Save the state of the group chat manager.
-        agent_id = AgentId(type=self._group_chat_manager_topic_type, key=self._team_id)
-        agent_states[self._group_chat_manager_name] = await self._runtime.agent_save_state(agent_id)
+        names = [*self._participant_names, self._group_chat_manager_name]
+        agent_types = [*self._participant_topic_types, self._group_chat_manager_topic_type]
+        # Save the state of all participants and the group chat manager concurrently.
+        # NOTE: We are using the runtime's save state method rather than the agent instance's
+        # save_state method because we want to support saving state of remote agents.
+        states = await asyncio.gather(
+            *[self._runtime.agent_save_state(AgentId(type=agent_type, key=self._team_id)) for agent_type in agent_types]
+        )
+        agent_states: Dict[str, Mapping[str, Any]] = dict(zip(names, states, strict=True))
         return TeamState(agent_states=agent_states).model_dump()
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
@@ -796,3 +925,24 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         finally:
             # Indicate that the team is no longer running.
             self._is_running = False
+
+    async def close(self) -> None:
+        """Remove the agents of the team from the runtime to release their memory.
+
+        This is useful for teams that share a long-lived runtime, e.g., teams created
+        from a team template, which would otherwise keep their agents in the runtime
+        after they are no longer used. The participants themselves are not closed.
+        If the team is run again, its agents are recreated without their previous state.
+
+        Only agents in a :class:`~autogen_core.SingleThreadedAgentRuntime` can be removed;
+        for other runtimes this is a no-op.
+
+        Raises:
+            RuntimeError: If the team is currently running.
+        """
+        if self._is_running:
+            raise RuntimeError("The team cannot be closed while it is running.")
+        if not isinstance(self._runtime, SingleThreadedAgentRuntime):
+            return
+        for agent_type in [*self._participant_topic_types, self._group_chat_manager_topic_type]:
+            await self._runtime.remove_agent_instance(AgentId(type=agent_type, key=self._team_id))
@@ -1,11 +1,12 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, List, Sequence
+from typing import Any, Dict, List, Mapping, Sequence
 
 from autogen_core import CancellationToken, DefaultTopicId, MessageContext, event, rpc
 
 from ...base import TerminationCondition
 from ...messages import BaseAgentEvent, BaseChatMessage, MessageFactory, SelectSpeakerEvent, StopMessage
+from ...state import BaseGroupChatManagerState
 from ._events import (
     GroupChatAgentResponse,
     GroupChatError,
@@ -18,6 +19,7 @@
     GroupChatTermination,
     SerializableException,
 )
+from ._message_thread import MessageThread
 from ._sequential_routed_agent import SequentialRoutedAgent
 
 
@@ -72,7 +74,7 @@ def __init__(
             name: topic_type for name, topic_type in zip(participant_names, participant_topic_types, strict=True)
         }
         self._participant_descriptions = participant_descriptions
-        self._message_thread: List[BaseAgentEvent | BaseChatMessage] = []
+        self._message_thread = MessageThread(message_factory)
         self._output_message_queue = output_message_queue
         self._termination_condition = termination_condition
         self._max_turns = max_turns
@@ -80,6 +82,9 @@ def __init__(
         self._message_factory = message_factory
         self._emit_team_events = emit_team_events
         self._active_speakers: List[str] = []
+        # The speakers selected for the current turn, in order, and the responses received so far.
+        self._turn_speakers: List[str] = []
+        self._pending_responses: Dict[str, List[BaseAgentEvent | BaseChatMessage]] = {}
 
     @rpc
     async def handle_start(self, message: GroupChatStart, ctx: MessageContext) -> None:
@@ -136,15 +141,22 @@ async def handle_agent_response(self, message: GroupChatAgentResponse, ctx: Mess
                     delta.append(inner_message)
             delta.append(message.agent_response.chat_message)
 
-            # Append the messages to the message thread.
-            await self.update_message_thread(delta)
-
             # Remove the agent from the active speakers list.
             self._active_speakers.remove(message.agent_name)
+            self._pending_responses[message.agent_name] = delta
             if len(self._active_speakers) > 0:
-                # If there are still active speakers, return without doing anything.
+                # If there are still active speakers, hold the response until all of them
+                # have responded, as concurrent speakers may respond in any order.
                 return
 
+            # Append the responses to the message thread in the order the speakers were selected,
+            # so the thread does not depend on which concurrent speaker finished first.
+            delta = []
+            for speaker_name in self._turn_speakers:
+                speaker_delta = self._pending_responses.pop(speaker_name)
+                await self.update_message_thread(speaker_delta)
+                delta.extend(speaker_delta)
+
             # Check if the conversation should be terminated.
             if await self._apply_termination_condition(delta, increment_turn_count=True):
                 # Stop the group chat.
@@ -171,6 +183,7 @@ async def _transition_to_next_speakers(self, cancellation_token: CancellationTok
             if speaker_name not in self._participant_name_to_topic_type:
                 raise RuntimeError(f"Speaker {speaker_name} not found in participant names.")
         await self._log_speaker_selection(speaker_names)
+        self._turn_speakers = list(speaker_names)
 
         # Send request to publish message to the next speakers
         for speaker_name in speaker_names:
@@ -285,6 +298,20 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
         """
         ...
 
+    def set_message_thread(self, message_thread: MessageThread) -> None:
+        """Replace the message thread, e.g., with one that keeps a bounded number of messages in memory.
+        This must be called before the group chat starts."""
+        self._message_thread.close()
+        self._message_thread = message_thread
+
+    def _dump_state(self, state: BaseGroupChatManagerState) -> Mapping[str, Any]:
+        """Dump the state with the message thread. The serialized messages are streamed from the
+        thread into the dumped state, rather than validated and copied by the state model, so the
+        spilled messages are neither loaded as messages nor held more than once."""
+        dumped = state.model_dump(exclude={"message_thread"})
+        dumped["message_thread"] = list(self._message_thread.dump())
+        return dumped
+
     async def update_message_thread(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> None:
         """Update the message thread with the new messages.
         This is called when the group chat receives a GroupChatStart or GroupChatAgentResponse event,
@@ -304,6 +331,8 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
         Returns:
             A list of topic types of the selected speakers.
             If only one speaker is selected, a single string is returned instead of a list.
+            Multiple speakers run concurrently, and their responses are added to the message thread
+            in the order of the list once all of them have responded.
         """
         ...
 
@@ -312,5 +341,9 @@ async def reset(self) -> None:
         """Reset the group chat manager."""
         ...
 
+    async def close(self) -> None:
+        self._message_thread.close()
+        await super().close()
+
     async def on_unhandled_message(self, message: Any, ctx: MessageContext) -> None:
         raise ValueError(f"Unhandled message in group chat manager: {type(message)}")
@@ -1,6 +1,7 @@
 import asyncio
 from collections import Counter, deque
-from typing import Any, Callable, Deque, Dict, List, Literal, Mapping, Sequence, Set, Union
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Literal, Mapping, Sequence, Set, Tuple, Union
 
 from autogen_core import AgentRuntime, CancellationToken, Component, ComponentModel
 from pydantic import BaseModel, Field, model_validator
@@ -93,6 +94,109 @@ class DiGraphNode(BaseModel):
     activation: Literal["all", "any"] = "all"
 
 
+class _StringMatcher:
+    """Finds which of a set of strings occur in a text.
+
+    With many strings, an Aho-Corasick automaton finds all of them in a single pass over
+    the text. With few strings, searching for each string is faster, as it runs in C.
+    """
+
+    # The minimum number of strings for which the automaton is used.
+    _MIN_AUTOMATON_PATTERNS = 8
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self._patterns = list(dict.fromkeys(patterns))
+        self._goto: List[Dict[str, int]] = []
+        self._output: List[Set[str]] = []
+        if len(self._patterns) < self._MIN_AUTOMATON_PATTERNS:
+            return
+        # Build the trie of the patterns.
+        self._goto.append({})
+        self._output.append(set())
+        for pattern in self._patterns:
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._output.append(set())
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].add(pattern)
+        # Compute the failure links breadth-first, merging the outputs of the failure states.
+        self._fail = [0] * len(self._goto)
+        queue: Deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[str]:
+        """Return the strings that occur in the text."""
+        if not self._goto:
+            return {pattern for pattern in self._patterns if pattern in text}
+        found = set(self._output[0])
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found |= self._output[state]
+        return found
+
+
+class _GraphPlan:
+    """The execution plan of a :class:`DiGraph`, compiled once and shared by the
+    :class:`GraphFlowManager` of every :class:`GraphFlow` built from the graph.
+
+    The plan must be treated as immutable: managers copy the initial bookkeeping
+    state instead of modifying it.
+    """
+
+    def __init__(self, graph: "DiGraph") -> None:
+        graph.graph_validate()
+        self.has_cycles = graph.get_has_cycles()
+        self.node_names: Tuple[str, ...] = tuple(graph.nodes)
+        self.start_nodes: Tuple[str, ...] = tuple(graph.get_start_nodes())
+        self.activation: Mapping[str, Literal["any", "all"]] = MappingProxyType(
+            {name: node.activation for name, node in graph.nodes.items()}
+        )
+        self.num_parents: Mapping[str, int] = MappingProxyType(
+            {name: len(parents) for name, parents in graph.get_parents().items()}
+        )
+        # The outgoing edges of each node as (target, string condition, callable condition) tuples.
+        self.edges: Mapping[str, Tuple[Tuple[str, str | None, Callable[[BaseChatMessage], bool] | None], ...]] = (
+            MappingProxyType(
+                {
+                    name: tuple(
+                        (
+                            edge.target,
+                            edge.condition
+                            if edge.condition_function is None and isinstance(edge.condition, str)
+                            else None,
+                            edge.condition_function,
+                        )
+                        for edge in node.edges
+                    )
+                    for name, node in graph.nodes.items()
+                }
+            )
+        )
+        # A matcher for all the string conditions of the outgoing edges of each node, if it has any.
+        self.matchers: Mapping[str, _StringMatcher] = MappingProxyType(
+            {
+                name: _StringMatcher([condition for _, condition, _ in edges if condition is not None])
+                for name, edges in self.edges.items()
+                if any(condition is not None for _, condition, _ in edges)
+            }
+        )
+
+
 class DiGraph(BaseModel):
     """Defines a directed graph structure with nodes and edges.
     :class:`GraphFlow` uses this to determine execution order and conditions.
@@ -106,6 +210,14 @@ class DiGraph(BaseModel):
     nodes: Dict[str, DiGraphNode]  # Node name → DiGraphNode mapping
     default_start_node: str | None = None  # Default start node name
     _has_cycles: bool | None = None  # Cyclic graph flag
+    _plan: _GraphPlan | None = None  # Compiled execution plan
+
+    def _get_plan(self) -> _GraphPlan:
+        """Validate and compile the graph into an execution plan, once per graph.
+        The graph must not be modified after it is used by a :class:`GraphFlow`."""
+        if self._plan is None:
+            self._plan = _GraphPlan(self)
+        return self._plan
 
     def get_parents(self) -> Dict[str, List[str]]:
         """Compute a mapping of each node to its parent nodes."""
@@ -246,52 +358,54 @@ def __init__(
             max_turns=max_turns,
             message_factory=message_factory,
         )
-        graph.graph_validate()
-        if graph.get_has_cycles() and self._termination_condition is None and self._max_turns is None:
+        # The validated graph and its lookup tables are compiled once and shared by all managers of the graph.
+        self._plan = graph._get_plan()  # pyright: ignore[reportPrivateUsage]
+        if self._plan.has_cycles and self._termination_condition is None and self._max_turns is None:
             raise ValueError("A termination condition is required for cyclic graphs without a maximum turn limit.")
         self._graph = graph
-        # Lookup table for incoming edges for each node.
-        self._parents = graph.get_parents()
-        # Lookup table for outgoing edges for each node.
-        self._edges: Dict[str, List[DiGraphEdge]] = {n: node.edges for n, node in graph.nodes.items()}
-        # Activation lookup table for each node.
-        self._activation: Dict[str, Literal["any", "all"]] = {n: node.activation for n, node in graph.nodes.items()}
 
         # === Mutable states for the graph execution ===
         # Count the number of remaining parents to activate each node.
-        self._remaining: Counter[str] = Counter({n: len(p) for n, p in self._parents.items()})
+        self._remaining: Counter[str] = Counter(self._plan.num_parents)
         # Lookup table for nodes that have been enqueued through an any activation.
         # This is used to prevent re-adding the same node multiple times.
-        self._enqueued_any: Dict[str, bool] = {n: False for n in graph.nodes}
+        self._enqueued_any: Dict[str, bool] = dict.fromkeys(self._plan.node_names, False)
         # Ready queue for nodes that are ready to execute, starting with the start nodes.
-        self._ready: Deque[str] = deque([n for n in graph.get_start_nodes()])
+        self._ready: Deque[str] = deque(self._plan.start_nodes)
 
     async def update_message_thread(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> None:
         await super().update_message_thread(messages)
 
         # Find the node that ran in the current turn.
         message = messages[-1]
-        if message.source not in self._graph.nodes:
+        edges = self._plan.edges.get(message.source)
+        if edges is None:
             # Ignore messages from sources outside of the graph.
             return
         assert isinstance(message, BaseChatMessage)
-        source = message.source
+
+        # Match all the string conditions of the node against the message text at once,
+        # rendering the text only once.
+        matcher = self._plan.matchers.get(message.source)
+        matched = matcher.find(message.to_model_text()) if matcher is not None else set()
 
         # Propagate the update to the children of the node.
-        for edge in self._edges[source]:
-            # Use the new check_condition method that handles both string and callable conditions
-            if not edge.check_condition(message):
+        for target, condition, condition_function in edges:
+            if condition_function is not None:
+                if not condition_function(message):
+                    continue
+            elif condition is not None and condition not in matched:
                 continue
-            if self._activation[edge.target] == "all":
-                self._remaining[edge.target] -= 1
-                if self._remaining[edge.target] == 0:
+            if self._plan.activation[target] == "all":
+                self._remaining[target] -= 1
+                if self._remaining[target] == 0:
                     # If all parents are done, add to the ready queue.
-                    self._ready.append(edge.target)
+                    self._ready.append(target)
             else:
                 # If activation is any, add to the ready queue if not already enqueued.
-                if not self._enqueued_any[edge.target]:
-                    self._ready.append(edge.target)
-                    self._enqueued_any[edge.target] = True
+                if not self._enqueued_any[target]:
+                    self._ready.append(target)
+                    self._enqueued_any[target] = True
 
     async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str]:
         # Drain the ready queue for the next set of speakers.
@@ -300,10 +414,10 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
             speaker = self._ready.popleft()
             speakers.append(speaker)
             # Reset the bookkeeping for the node that were selected.
-            if self._activation[speaker] == "any":
+            if self._plan.activation[speaker] == "any":
                 self._enqueued_any[speaker] = False
             else:
-                self._remaining[speaker] = len(self._parents[speaker])
+                self._remaining[speaker] = self._plan.num_parents[speaker]
 
         # If there are no speakers, trigger the stop agent.
         if not speakers:
@@ -317,7 +431,7 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
     async def save_state(self) -> Mapping[str, Any]:
         """Save the execution state."""
         state = {
-            "message_thread": [message.dump() for message in self._message_thread],
+            "message_thread": list(self._message_thread.dump()),
             "current_turn": self._current_turn,
             "remaining": dict(self._remaining),
             "enqueued_any": dict(self._enqueued_any),
@@ -327,7 +441,7 @@ async def save_state(self) -> Mapping[str, Any]:
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         """Restore execution state from saved data."""
-        self._message_thread = [self._message_factory.create(msg) for msg in state["message_thread"]]
+        self._message_thread.load(state["message_thread"])
         self._current_turn = state["current_turn"]
         self._remaining = Counter(state["remaining"])
         self._enqueued_any = state["enqueued_any"]
@@ -339,9 +453,9 @@ async def reset(self) -> None:
         self._message_thread.clear()
         if self._termination_condition:
             await self._termination_condition.reset()
-        self._remaining = Counter({n: len(p) for n, p in self._parents.items()})
-        self._enqueued_any = {n: False for n in self._graph.nodes}
-        self._ready = deque([n for n in self._graph.get_start_nodes()])
+        self._remaining = Counter(self._plan.num_parents)
+        self._enqueued_any = dict.fromkeys(self._plan.node_names, False)
+        self._ready = deque(self._plan.start_nodes)
 
 
 class _StopAgent(BaseChatAgent):
@@ -366,6 +480,8 @@ class GraphFlowConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     graph: DiGraph  # The execution graph for agents
+    message_thread_window: int | None = None
+    message_thread_spill_dir: str | None = None
 
 
 class GraphFlow(BaseGroupChat, Component[GraphFlowConfig]):
@@ -408,6 +524,14 @@ class GraphFlow(BaseGroupChat, Component[GraphFlowConfig]):
         termination_condition (TerminationCondition, optional): Termination condition for the chat.
         max_turns (int, optional): Maximum number of turns before forcing termination.
         graph (DiGraph): Directed execution graph defining node flow and conditions.
+        team_template (str | None, optional): The name of a team template for teams that share the `runtime`.
+            Teams of the same template register their agents in the runtime only once and are run by
+            sending a single message, see :class:`BaseGroupChat`. Defaults to None.
+        message_thread_window (int | None, optional): The maximum number of messages of the group chat manager's
+            message thread kept in memory. Older messages are spilled to an append-only log file on disk
+            and read back lazily. Defaults to None, meaning all messages are kept in memory.
+        message_thread_spill_dir (str | None, optional): The directory for the message thread log file.
+            Defaults to None, meaning the system temporary directory.
 
     Raises:
         ValueError: If participant names are not unique, or if graph validation fails (e.g., cycles without exit).
@@ -605,6 +729,9 @@ def __init__(
         max_turns: int | None = None,
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
+        team_template: str | None = None,
+        message_thread_window: int | None = None,
+        message_thread_spill_dir: str | None = None,
     ) -> None:
         self._input_participants = participants
         self._input_termination_condition = termination_condition
@@ -626,6 +753,9 @@ def __init__(
             max_turns=max_turns,
             runtime=runtime,
             custom_message_types=custom_message_types,
+            team_template=team_template,
+            message_thread_window=message_thread_window,
+            message_thread_spill_dir=message_thread_spill_dir,
         )
         self._graph = graph
 
@@ -672,6 +802,8 @@ def _to_config(self) -> GraphFlowConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             graph=self._graph,
+            message_thread_window=self._message_thread_window,
+            message_thread_spill_dir=self._message_thread_spill_dir,
         )
 
     @classmethod
@@ -682,5 +814,10 @@ def _from_config(cls, config: GraphFlowConfig) -> Self:
             TerminationCondition.load_component(config.termination_condition) if config.termination_condition else None
         )
         return cls(
-            participants, graph=config.graph, termination_condition=termination_condition, max_turns=config.max_turns
+            participants,
+            graph=config.graph,
+            termination_condition=termination_condition,
+            max_turns=config.max_turns,
+            message_thread_window=config.message_thread_window,
+            message_thread_spill_dir=config.message_thread_spill_dir,
         )
@@ -29,6 +29,8 @@ class MagenticOneGroupChatConfig(BaseModel):
     max_stalls: int
     final_answer_prompt: str
     emit_team_events: bool = False
+    message_thread_window: int | None = None
+    message_thread_spill_dir: str | None = None
 
 
 class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig]):
@@ -51,6 +53,14 @@ class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig])
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        team_template (str | None, optional): The name of a team template for teams that share the `runtime`.
+            Teams of the same template register their agents in the runtime only once and are run by
+            sending a single message, see :class:`BaseGroupChat`. Defaults to None.
+        message_thread_window (int | None, optional): The maximum number of messages of the group chat manager's
+            message thread kept in memory. Older messages are spilled to an append-only log file on disk
+            and read back lazily. Defaults to None, meaning all messages are kept in memory.
+        message_thread_spill_dir (str | None, optional): The directory for the message thread log file.
+            Defaults to None, meaning the system temporary directory.
 
     Raises:
         ValueError: In orchestration logic if progress ledger does not have required keys or if next speaker is not valid.
@@ -110,6 +120,9 @@ def __init__(
         final_answer_prompt: str = ORCHESTRATOR_FINAL_ANSWER_PROMPT,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        team_template: str | None = None,
+        message_thread_window: int | None = None,
+        message_thread_spill_dir: str | None = None,
     ):
         super().__init__(
             participants,
@@ -120,6 +133,9 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            team_template=team_template,
+            message_thread_window=message_thread_window,
+            message_thread_spill_dir=message_thread_spill_dir,
         )
 
         # Validate the participants.
@@ -170,6 +186,8 @@ def _to_config(self) -> MagenticOneGroupChatConfig:
             max_stalls=self._max_stalls,
             final_answer_prompt=self._final_answer_prompt,
             emit_team_events=self._emit_team_events,
+            message_thread_window=self._message_thread_window,
+            message_thread_spill_dir=self._message_thread_spill_dir,
         )
 
     @classmethod
@@ -187,4 +205,6 @@ def _from_config(cls, config: MagenticOneGroupChatConfig) -> Self:
             max_stalls=config.max_stalls,
             final_answer_prompt=config.final_answer_prompt,
             emit_team_events=config.emit_team_events,
+            message_thread_window=config.message_thread_window,
+            message_thread_spill_dir=config.message_thread_spill_dir,
         )
@@ -96,6 +96,9 @@ def __init__(
         self._plan = ""
         self._n_rounds = 0
         self._n_stalls = 0
+        # The model context of the message thread, extended as messages are added to the thread.
+        self._context: List[LLMMessage] = []
+        self._context_length = 0
 
         # Produce a team description. Each agent sould appear on a single line.
         self._team_description = ""
@@ -219,7 +222,6 @@ async def validate_group_state(self, messages: List[BaseChatMessage] | None) ->
 
     async def save_state(self) -> Mapping[str, Any]:
         state = MagenticOneOrchestratorState(
-            message_thread=[msg.dump() for msg in self._message_thread],
             current_turn=self._current_turn,
             task=self._task,
             facts=self._facts,
@@ -227,11 +229,12 @@ async def save_state(self) -> Mapping[str, Any]:
             n_rounds=self._n_rounds,
             n_stalls=self._n_stalls,
         )
-        return state.model_dump()
+        return self._dump_state(state)
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         orchestrator_state = MagenticOneOrchestratorState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in orchestrator_state.message_thread]
+        self._message_thread.load(orchestrator_state.message_thread)
+        self._reset_context()
         self._current_turn = orchestrator_state.current_turn
         self._task = orchestrator_state.task
         self._facts = orchestrator_state.facts
@@ -246,6 +249,7 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
     async def reset(self) -> None:
         """Reset the group chat manager."""
         self._message_thread.clear()
+        self._reset_context()
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._n_rounds = 0
@@ -265,6 +269,7 @@ async def _reenter_outer_loop(self, cancellation_token: CancellationToken) -> No
             )
         # Reset partially the group chat manager
         self._message_thread.clear()
+        self._reset_context()
 
         # Prepare the ledger
         ledger_message = TextMessage(
@@ -310,19 +315,16 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
         progress_ledger: Dict[str, Any] = {}
         assert self._max_json_retries > 0
         key_error: bool = False
+        # The same context is used for all the retries.
         for _ in range(self._max_json_retries):
             if self._model_client.model_info.get("structured_output", False):
-                response = await self._model_client.create(
-                    self._get_compatible_context(context), json_output=LedgerEntry
-                )
+                response = await self._model_client.create(context, json_output=LedgerEntry)
             elif self._model_client.model_info.get("json_output", False):
                 response = await self._model_client.create(
-                    self._get_compatible_context(context), cancellation_token=cancellation_token, json_output=True
+                    context, cancellation_token=cancellation_token, json_output=True
                 )
             else:
-                response = await self._model_client.create(
-                    self._get_compatible_context(context), cancellation_token=cancellation_token
-                )
+                response = await self._model_client.create(context, cancellation_token=cancellation_token)
             ledger_str = response.content
             try:
                 assert isinstance(ledger_str, str)
@@ -451,9 +453,7 @@ async def _update_task_ledger(self, cancellation_token: CancellationToken) -> No
         update_facts_prompt = self._get_task_ledger_facts_update_prompt(self._task, self._facts)
         context.append(UserMessage(content=update_facts_prompt, source=self._name))
 
-        response = await self._model_client.create(
-            self._get_compatible_context(context), cancellation_token=cancellation_token
-        )
+        response = await self._model_client.create(context, cancellation_token=cancellation_token)
 
         assert isinstance(response.content, str)
         self._facts = response.content
@@ -463,9 +463,7 @@ async def _update_task_ledger(self, cancellation_token: CancellationToken) -> No
         update_plan_prompt = self._get_task_ledger_plan_update_prompt(self._team_description)
         context.append(UserMessage(content=update_plan_prompt, source=self._name))
 
-        response = await self._model_client.create(
-            self._get_compatible_context(context), cancellation_token=cancellation_token
-        )
+        response = await self._model_client.create(context, cancellation_token=cancellation_token)
 
         assert isinstance(response.content, str)
         self._plan = response.content
@@ -478,9 +476,7 @@ async def _prepare_final_answer(self, reason: str, cancellation_token: Cancellat
         final_answer_prompt = self._get_final_answer_prompt(self._task)
         context.append(UserMessage(content=final_answer_prompt, source=self._name))
 
-        response = await self._model_client.create(
-            self._get_compatible_context(context), cancellation_token=cancellation_token
-        )
+        response = await self._model_client.create(context, cancellation_token=cancellation_token)
         assert isinstance(response.content, str)
         message = TextMessage(content=response.content, source=self._name)
 
@@ -507,9 +503,25 @@ async def _prepare_final_answer(self, reason: str, cancellation_token: Cancellat
         await self._signal_termination(StopMessage(content=reason, source=self._name))
 
     def _thread_to_context(self) -> List[LLMMessage]:
-        """Convert the message thread to a context for the model."""
+        """Convert the message thread to a context for the model, compatible with the model client.
+
+        Only the messages added to the thread since the last call are converted. The context is
+        append-only between resets of the thread, so consecutive model calls share the same prefix,
+        starting with the task ledger, which lets providers reuse their cached prompt prefix."""
+        if self._context_length < len(self._message_thread):
+            new_messages = self._message_thread[self._context_length :]
+            self._context.extend(self._get_compatible_context(self._convert_messages(new_messages)))
+            self._context_length += len(new_messages)
+        return list(self._context)
+
+    def _reset_context(self) -> None:
+        """Discard the model context, e.g., after the message thread is cleared or loaded."""
+        self._context.clear()
+        self._context_length = 0
+
+    def _convert_messages(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[LLMMessage]:
         context: List[LLMMessage] = []
-        for m in self._message_thread:
+        for m in messages:
             if isinstance(m, ToolCallRequestEvent | ToolCallExecutionEvent):
                 # Ignore tool call messages.
                 continue
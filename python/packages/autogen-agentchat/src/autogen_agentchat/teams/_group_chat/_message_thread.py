@@ -0,0 +1,158 @@
+import json
+import tempfile
+from array import array
+from collections import deque
+from typing import IO, Any, Deque, Iterable, Iterator, List, Mapping, Sequence, overload
+
+from pydantic_core import to_jsonable_python
+
+from ...messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
+    MessageFactory,
+    ModelClientStreamingChunkEvent,
+    ToolCallExecutionChunkEvent,
+)
+
+
+class MessageThread(Sequence[BaseAgentEvent | BaseChatMessage]):
+    """The message thread of a group chat manager.
+
+    The thread keeps the most recent `window` messages in memory. Older messages are
+    appended to an on-disk log and are read back lazily when the thread is indexed or
+    iterated, so the memory used by a long-running group chat stays bounded.
+    If `window` is None, all messages are kept in memory.
+
+    Streaming chunk events, i.e., :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`
+    and :class:`~autogen_agentchat.messages.ToolCallExecutionChunkEvent`, are not added to the thread
+    unless `exclude_streaming_chunks` is False, as the complete messages are added after them.
+
+    Args:
+        message_factory (MessageFactory): The message factory used to load the messages from the log.
+        window (int | None, optional): The maximum number of messages kept in memory. Defaults to None.
+        spill_dir (str | None, optional): The directory of the log file. The log is a temporary file that is
+            removed when the thread is closed or garbage collected. Defaults to the system temporary directory.
+        exclude_streaming_chunks (bool, optional): Whether to drop streaming chunk events. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        message_factory: MessageFactory,
+        window: int | None = None,
+        spill_dir: str | None = None,
+        exclude_streaming_chunks: bool = True,
+    ) -> None:
+        if window is not None and window < 1:
+            raise ValueError("The message thread window must be at least 1.")
+        self._message_factory = message_factory
+        self._window = window
+        self._spill_dir = spill_dir
+        self._exclude_streaming_chunks = exclude_streaming_chunks
+        self._tail: Deque[BaseAgentEvent | BaseChatMessage] = deque()
+        # The log file is created on the first spill. Each entry is a line of JSON,
+        # and the byte offsets of the entries are kept for random access.
+        self._log: IO[bytes] | None = None
+        self._log_offsets = array("q")
+
+    def __len__(self) -> int:
+        return len(self._log_offsets) + len(self._tail)
+
+    @overload
+    def __getitem__(self, index: int) -> BaseAgentEvent | BaseChatMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BaseAgentEvent | BaseChatMessage]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> BaseAgentEvent | BaseChatMessage | List[BaseAgentEvent | BaseChatMessage]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Message thread index out of range.")
+        if index < len(self._log_offsets):
+            return self._message_factory.create(self._read_log_entry(index))
+        return self._tail[index - len(self._log_offsets)]
+
+    def __iter__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        # Iterate over the messages at the time of the call, as messages may be appended
+        # and spilled to the log while the iterator is suspended.
+        num_logged, tail = len(self._log_offsets), list(self._tail)
+        for index in range(num_logged):
+            yield self._message_factory.create(self._read_log_entry(index))
+        yield from tail
+
+    def __reversed__(self) -> Iterator[BaseAgentEvent | BaseChatMessage]:
+        yield from reversed(list(self._tail))
+        for index in reversed(range(len(self._log_offsets))):
+            yield self._message_factory.create(self._read_log_entry(index))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))  # type: ignore[reportUnknownVariableType]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"MessageThread(len={len(self)}, in_memory={len(self._tail)})"
+
+    def extend(self, messages: Iterable[BaseAgentEvent | BaseChatMessage]) -> None:
+        """Append messages to the thread, spilling the oldest in-memory messages to the log
+        if the window is exceeded."""
+        for message in messages:
+            if self._exclude_streaming_chunks and isinstance(
+                message, ModelClientStreamingChunkEvent | ToolCallExecutionChunkEvent
+            ):
+                continue
+            self._tail.append(message)
+            if self._window is not None and len(self._tail) > self._window:
+                self._spill(self._tail.popleft())
+
+    def append(self, message: BaseAgentEvent | BaseChatMessage) -> None:
+        """Append a message to the thread."""
+        self.extend([message])
+
+    def clear(self) -> None:
+        """Remove all messages from the thread."""
+        self._tail.clear()
+        self._log_offsets = array("q")
+        if self._log is not None:
+            self._log.seek(0)
+            self._log.truncate()
+
+    def dump(self) -> Iterator[Mapping[str, Any]]:
+        """Lazily yield the serialized messages of the thread at the time of the call, e.g., to save the state.
+        Messages in the log are yielded as stored, without loading them as messages."""
+        num_logged, tail = len(self._log_offsets), list(self._tail)
+        for index in range(num_logged):
+            yield self._read_log_entry(index)
+        for message in tail:
+            yield message.dump()
+
+    def load(self, dumps: Iterable[Mapping[str, Any]]) -> None:
+        """Replace the messages of the thread with the serialized messages."""
+        self.clear()
+        self.extend(self._message_factory.create(dump) for dump in dumps)
+
+    def close(self) -> None:
+        """Remove all messages from the thread and delete the log file."""
+        self._tail.clear()
+        self._log_offsets = array("q")
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _spill(self, message: BaseAgentEvent | BaseChatMessage) -> None:
+        if self._log is None:
+            self._log = tempfile.TemporaryFile(dir=self._spill_dir, prefix="autogen_message_thread_")
+        self._log.seek(0, 2)
+        self._log_offsets.append(self._log.tell())
+        self._log.write(json.dumps(message.dump(), default=to_jsonable_python).encode("utf-8") + b"\n")
+
+    def _read_log_entry(self, index: int) -> Mapping[str, Any]:
+        assert self._log is not None
+        self._log.seek(self._log_offsets[index])
+        return json.loads(self._log.readline())  # type: ignore[no-any-return]
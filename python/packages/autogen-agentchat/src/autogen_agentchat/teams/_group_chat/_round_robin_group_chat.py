@@ -29,6 +29,7 @@ def __init__(
         max_turns: int | None,
         message_factory: MessageFactory,
         emit_team_events: bool,
+        parallel_speakers: int = 1,
     ) -> None:
         super().__init__(
             name,
@@ -44,6 +45,7 @@ def __init__(
             emit_team_events,
         )
         self._next_speaker_index = 0
+        self._parallel_speakers = min(parallel_speakers, len(participant_names))
 
     async def validate_group_state(self, messages: List[BaseChatMessage] | None) -> None:
         pass
@@ -57,15 +59,14 @@ async def reset(self) -> None:
 
     async def save_state(self) -> Mapping[str, Any]:
         state = RoundRobinManagerState(
-            message_thread=[message.dump() for message in self._message_thread],
             current_turn=self._current_turn,
             next_speaker_index=self._next_speaker_index,
         )
-        return state.model_dump()
+        return self._dump_state(state)
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         round_robin_state = RoundRobinManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in round_robin_state.message_thread]
+        self._message_thread.load(round_robin_state.message_thread)
         self._current_turn = round_robin_state.current_turn
         self._next_speaker_index = round_robin_state.next_speaker_index
 
@@ -74,12 +75,19 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
 
         .. note::
 
-            This method always returns a single speaker.
+            This method returns a single speaker, unless the manager is configured with
+            more than one parallel speaker, in which case the next speakers in the
+            round-robin order are returned to speak concurrently.
         """
         current_speaker_index = self._next_speaker_index
-        self._next_speaker_index = (current_speaker_index + 1) % len(self._participant_names)
-        current_speaker = self._participant_names[current_speaker_index]
-        return current_speaker
+        num_participants = len(self._participant_names)
+        self._next_speaker_index = (current_speaker_index + self._parallel_speakers) % num_participants
+        if self._parallel_speakers == 1:
+            return self._participant_names[current_speaker_index]
+        return [
+            self._participant_names[(current_speaker_index + i) % num_participants]
+            for i in range(self._parallel_speakers)
+        ]
 
 
 class RoundRobinGroupChatConfig(BaseModel):
@@ -89,6 +97,9 @@ class RoundRobinGroupChatConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     emit_team_events: bool = False
+    message_thread_window: int | None = None
+    message_thread_spill_dir: str | None = None
+    parallel_speakers: int = 1
 
 
 class RoundRobinGroupChat(BaseGroupChat, Component[RoundRobinGroupChatConfig]):
@@ -106,9 +117,22 @@ class RoundRobinGroupChat(BaseGroupChat, Component[RoundRobinGroupChatConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        team_template (str | None, optional): The name of a team template for teams that share the `runtime`.
+            Teams of the same template register their agents in the runtime only once and are run by
+            sending a single message, see :class:`BaseGroupChat`. Defaults to None.
+        message_thread_window (int | None, optional): The maximum number of messages of the group chat manager's
+            message thread kept in memory. Older messages are spilled to an append-only log file on disk
+            and read back lazily. Defaults to None, meaning all messages are kept in memory.
+        message_thread_spill_dir (str | None, optional): The directory for the message thread log file.
+            Defaults to None, meaning the system temporary directory.
+        parallel_speakers (int, optional): The number of consecutive participants, in the round-robin order,
+            that speak concurrently in each turn. The concurrent speakers do not see each other's messages
+            of the same turn, and their messages are added to the message thread in the round-robin order.
+            This is useful when the participants work independently. Defaults to 1.
 
     Raises:
-        ValueError: If no participants are provided or if participant names are not unique.
+        ValueError: If no participants are provided, if participant names are not unique,
+            or if `parallel_speakers` is less than 1.
 
     Examples:
 
@@ -180,7 +204,13 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        team_template: str | None = None,
+        message_thread_window: int | None = None,
+        message_thread_spill_dir: str | None = None,
+        parallel_speakers: int = 1,
     ) -> None:
+        if parallel_speakers < 1:
+            raise ValueError("The number of parallel speakers must be at least 1.")
         super().__init__(
             participants,
             group_chat_manager_name="RoundRobinGroupChatManager",
@@ -190,7 +220,11 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            team_template=team_template,
+            message_thread_window=message_thread_window,
+            message_thread_spill_dir=message_thread_spill_dir,
         )
+        self._parallel_speakers = parallel_speakers
 
     def _create_group_chat_manager_factory(
         self,
@@ -218,6 +252,7 @@ def _factory() -> RoundRobinGroupChatManager:
                 max_turns,
                 message_factory,
                 self._emit_team_events,
+                self._parallel_speakers,
             )
 
         return _factory
@@ -230,6 +265,9 @@ def _to_config(self) -> RoundRobinGroupChatConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             emit_team_events=self._emit_team_events,
+            message_thread_window=self._message_thread_window,
+            message_thread_spill_dir=self._message_thread_spill_dir,
+            parallel_speakers=self._parallel_speakers,
         )
 
     @classmethod
@@ -243,4 +281,7 @@ def _from_config(cls, config: RoundRobinGroupChatConfig) -> Self:
             termination_condition=termination_condition,
             max_turns=config.max_turns,
             emit_team_events=config.emit_team_events,
+            message_thread_window=config.message_thread_window,
+            message_thread_spill_dir=config.message_thread_spill_dir,
+            parallel_speakers=config.parallel_speakers,
         )
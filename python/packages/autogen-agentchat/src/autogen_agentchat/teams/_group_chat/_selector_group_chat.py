@@ -1,8 +1,9 @@
 import asyncio
 import logging
 import re
+from collections import deque
 from inspect import iscoroutinefunction
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Union, cast
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union, cast
 
 from autogen_core import AgentRuntime, CancellationToken, Component, ComponentModel
 from autogen_core.model_context import (
@@ -48,6 +49,59 @@
 CandidateFuncType = Union[SyncCandidateFunc | AsyncCandidateFunc]
 
 
+class SpeakerSelectionMetrics:
+    """The number of speaker selections of a :class:`SelectorGroupChat` by the tier that made the selection.
+
+    The tiers are tried in order, and the model is only called if no earlier tier selects a speaker:
+
+    - ``"selector_func"``: the custom selector function returned a speaker.
+    - ``"single_candidate"``: only one candidate was left after filtering.
+    - ``"handoff"``: the last message is a handoff to a candidate.
+    - ``"mention"``: the last message @mentions exactly one candidate.
+    - ``"classifier"``: the last message matches the description of one candidate with high confidence.
+    - ``"model"``: the model selected the speakers.
+
+    The ``"handoff"``, ``"mention"`` and ``"classifier"`` tiers are only used if the team is
+    created with `fast_path_selection` enabled.
+    """
+
+    TIERS = ("selector_func", "single_candidate", "handoff", "mention", "classifier", "model")
+
+    def __init__(self) -> None:
+        self.selections: Dict[str, int] = {tier: 0 for tier in self.TIERS}
+        # The number of model calls for speaker selection, including retries.
+        self.model_calls = 0
+
+    @property
+    def total_selections(self) -> int:
+        """The total number of speaker selections."""
+        return sum(self.selections.values())
+
+    @property
+    def model_calls_avoided(self) -> int:
+        """The number of speaker selections made without calling the model."""
+        return self.total_selections - self.selections["model"]
+
+    @property
+    def hit_rates(self) -> Dict[str, float]:
+        """The fraction of speaker selections made by each tier."""
+        total = self.total_selections
+        return {tier: count / total if total else 0.0 for tier, count in self.selections.items()}
+
+    def reset(self) -> None:
+        """Reset the counts."""
+        self.selections = {tier: 0 for tier in self.TIERS}
+        self.model_calls = 0
+
+    def __repr__(self) -> str:
+        return f"SpeakerSelectionMetrics(selections={self.selections}, model_calls={self.model_calls})"
+
+
+def _keywords(text: str) -> Set[str]:
+    """The lowercase words of the text that are longer than three characters."""
+    return {word for word in re.findall(r"[a-z0-9]+", text.lower()) if len(word) > 3}
+
+
 class SelectorGroupChatManager(BaseGroupChatManager):
     """A group chat manager that selects the next speaker using a ChatCompletion
     model and a custom selector function."""
@@ -73,6 +127,11 @@ def __init__(
         emit_team_events: bool,
         model_context: ChatCompletionContext | None,
         model_client_streaming: bool = False,
+        max_parallel_speakers: int = 1,
+        selector_history_token_limit: int | None = None,
+        fast_path_selection: bool = False,
+        fast_path_min_confidence: float = 0.75,
+        selection_metrics: SpeakerSelectionMetrics | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -90,6 +149,8 @@ def __init__(
         self._model_client = model_client
         self._selector_prompt = selector_prompt
         self._previous_speaker: str | None = None
+        # All speakers of the previous turn, which has more than one speaker when speakers run in parallel.
+        self._previous_speakers: List[str] = []
         self._allow_repeated_speaker = allow_repeated_speaker
         self._selector_func = selector_func
         self._is_selector_func_async = iscoroutinefunction(self._selector_func)
@@ -97,11 +158,34 @@ def __init__(
         self._candidate_func = candidate_func
         self._is_candidate_func_async = iscoroutinefunction(self._candidate_func)
         self._model_client_streaming = model_client_streaming
+        self._max_parallel_speakers = max_parallel_speakers
+        self._selector_history_token_limit = selector_history_token_limit
         if model_context is not None:
             self._model_context = model_context
+            # The messages of a custom model context may be changed by the context, e.g., a buffered context,
+            # so the history is rendered from the messages of the context on every selection.
+            self._history: Deque[Tuple[str, int]] | None = None
         else:
             self._model_context = UnboundedChatCompletionContext()
+            # The history is rendered incrementally as messages are added to the model context:
+            # each entry is a rendered message and its token count, if the history is limited by tokens.
+            self._history = deque()
+        self._history_tokens = 0
         self._cancellation_token = CancellationToken()
+        # Construct agent roles.
+        # Each agent sould appear on a single line.
+        roles = ""
+        for topic_type, description in zip(self._participant_names, self._participant_descriptions, strict=True):
+            roles += re.sub(r"\s+", " ", f"{topic_type}: {description}").strip() + "\n"
+        self._roles = roles.strip()
+        self._fast_path_selection = fast_path_selection
+        self._fast_path_min_confidence = fast_path_min_confidence
+        self._selection_metrics = selection_metrics if selection_metrics is not None else SpeakerSelectionMetrics()
+        # The keywords of each participant for the classifier tier of the fast path.
+        self._participant_keywords = {
+            name: _keywords(f"{name.replace('_', ' ')} {description}")
+            for name, description in zip(self._participant_names, self._participant_descriptions, strict=True)
+        }
 
     async def validate_group_state(self, messages: List[BaseChatMessage] | None) -> None:
         pass
@@ -110,45 +194,99 @@ async def reset(self) -> None:
         self._current_turn = 0
         self._message_thread.clear()
         await self._model_context.clear()
+        if self._history is not None:
+            self._history.clear()
+        self._history_tokens = 0
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._previous_speaker = None
+        self._previous_speakers = []
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SelectorManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
             current_turn=self._current_turn,
             previous_speaker=self._previous_speaker,
+            previous_speakers=self._previous_speakers,
         )
-        return state.model_dump()
+        return self._dump_state(state)
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         selector_state = SelectorManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(msg) for msg in selector_state.message_thread]
-        await self._add_messages_to_context(
+        self._message_thread.load(selector_state.message_thread)
+        llm_messages = await self._add_messages_to_context(
             self._model_context, [msg for msg in self._message_thread if isinstance(msg, BaseChatMessage)]
         )
+        self._update_history(llm_messages)
         self._current_turn = selector_state.current_turn
         self._previous_speaker = selector_state.previous_speaker
+        if selector_state.previous_speakers:
+            self._previous_speakers = list(selector_state.previous_speakers)
+        else:
+            self._previous_speakers = [self._previous_speaker] if self._previous_speaker is not None else []
 
     @staticmethod
     async def _add_messages_to_context(
         model_context: ChatCompletionContext,
         messages: Sequence[BaseChatMessage],
-    ) -> None:
+    ) -> List[LLMMessage]:
         """
-        Add incoming messages to the model context.
+        Add incoming messages to the model context and return the added model messages.
         """
+        llm_messages: List[LLMMessage] = []
         for msg in messages:
             if isinstance(msg, HandoffMessage):
-                for llm_msg in msg.context:
-                    await model_context.add_message(llm_msg)
-            await model_context.add_message(msg.to_model_message())
+                llm_messages.extend(msg.context)
+            llm_messages.append(msg.to_model_message())
+        for llm_msg in llm_messages:
+            await model_context.add_message(llm_msg)
+        return llm_messages
 
     async def update_message_thread(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> None:
         self._message_thread.extend(messages)
         base_chat_messages = [m for m in messages if isinstance(m, BaseChatMessage)]
-        await self._add_messages_to_context(self._model_context, base_chat_messages)
+        llm_messages = await self._add_messages_to_context(self._model_context, base_chat_messages)
+        self._update_history(llm_messages)
+
+    def _update_history(self, llm_messages: Sequence[LLMMessage]) -> None:
+        """Render the messages added to the model context and append them to the history,
+        dropping the oldest messages that exceed the history token limit."""
+        if self._history is None:
+            return
+        for entry in self._render_history_entries(llm_messages):
+            self._history.append(entry)
+            self._history_tokens += entry[1]
+        if self._selector_history_token_limit is not None:
+            # Keep at least the most recent message.
+            while self._history_tokens > self._selector_history_token_limit and len(self._history) > 1:
+                self._history_tokens -= self._history.popleft()[1]
+
+    def _render_history_entries(self, message_history: Sequence[LLMMessage]) -> List[Tuple[str, int]]:
+        entries: List[Tuple[str, int]] = []
+        for msg in message_history:
+            if isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage):
+                message = f"{msg.source}: {msg.content}"
+                # Create some consistency for how messages are separated in the transcript
+                text = message.rstrip() + "\n\n"
+                tokens = 0
+                if self._selector_history_token_limit is not None:
+                    tokens = self._model_client.count_tokens([UserMessage(content=text, source=msg.source)])
+                entries.append((text, tokens))
+        return entries
+
+    async def _get_history(self) -> str:
+        """Get the rendered conversation history for the selector prompt."""
+        if self._history is not None:
+            return "\n".join(text for text, _ in self._history)
+        entries = self._render_history_entries(await self._model_context.get_messages())
+        if self._selector_history_token_limit is not None:
+            # Keep the most recent messages within the token limit, and at least the most recent message.
+            num_tokens = 0
+            for i in range(len(entries) - 1, -1, -1):
+                num_tokens += entries[i][1]
+                if num_tokens > self._selector_history_token_limit and i < len(entries) - 1:
+                    entries = entries[i + 1 :]
+                    break
+        return "\n".join(text for text, _ in entries)
 
     async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str] | str:
         """Selects the next speaker in a group chat using a ChatCompletion client,
@@ -156,7 +294,9 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
 
         .. note::
 
-            This method always returns a single speaker name.
+            This method returns a single speaker name, unless the manager is configured
+            with more than one parallel speaker, in which case the model may select
+            multiple speakers to speak concurrently.
 
         A key assumption is that the agent type is the same as the topic type, which we use as the agent name.
         """
@@ -175,6 +315,7 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
                         f"Expected one of: {self._participant_names}."
                     )
                 # Skip the model based selection.
+                self._selection_metrics.selections["selector_func"] += 1
                 return [speaker]
 
         # Use the candidate function to filter participants if provided
@@ -194,49 +335,86 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
                 )
         else:
             # Construct the candidate agent list to be selected from, skip the previous speaker if not allowed.
-            if self._previous_speaker is not None and not self._allow_repeated_speaker:
-                participants = [p for p in self._participant_names if p != self._previous_speaker]
+            if self._previous_speakers and not self._allow_repeated_speaker:
+                participants = [p for p in self._participant_names if p not in self._previous_speakers]
+                if not participants:
+                    # All participants spoke in the previous turn.
+                    participants = list(self._participant_names)
             else:
                 participants = list(self._participant_names)
 
         assert len(participants) > 0
 
-        # Construct agent roles.
-        # Each agent sould appear on a single line.
-        roles = ""
-        for topic_type, description in zip(self._participant_names, self._participant_descriptions, strict=True):
-            roles += re.sub(r"\s+", " ", f"{topic_type}: {description}").strip() + "\n"
-        roles = roles.strip()
-
-        # Select the next speaker.
-        if len(participants) > 1:
-            agent_name = await self._select_speaker(roles, participants, self._max_selector_attempts)
+        # Select the next speakers.
+        if len(participants) == 1:
+            self._selection_metrics.selections["single_candidate"] += 1
+            agent_names = [participants[0]]
         else:
-            agent_name = participants[0]
-        self._previous_speaker = agent_name
-        trace_logger.debug(f"Selected speaker: {agent_name}")
-        return [agent_name]
+            fast_path_selection = self._select_speaker_fast_path(thread, participants)
+            if fast_path_selection is not None:
+                tier, agent_name = fast_path_selection
+                trace_logger.debug(f"Selected speaker {agent_name} without the model by the {tier} rule.")
+                self._selection_metrics.selections[tier] += 1
+                agent_names = [agent_name]
+            else:
+                self._selection_metrics.selections["model"] += 1
+                agent_names = await self._select_speakers(self._roles, participants, self._max_selector_attempts)
+        self._previous_speaker = agent_names[-1]
+        self._previous_speakers = agent_names
+        trace_logger.debug(f"Selected speakers: {agent_names}")
+        return agent_names
+
+    def _select_speaker_fast_path(
+        self, thread: Sequence[BaseAgentEvent | BaseChatMessage], participants: List[str]
+    ) -> Tuple[str, str] | None:
+        """Select the next speaker with deterministic rules and a keyword classifier, without calling the model.
+        Returns the tier and the speaker, or None if the selection is not obvious and the model should be used."""
+        if not self._fast_path_selection:
+            return None
+        last_message = next((msg for msg in reversed(thread) if isinstance(msg, BaseChatMessage)), None)
+        if last_message is None:
+            return None
+
+        # A handoff to a candidate.
+        if isinstance(last_message, HandoffMessage) and last_message.target in participants:
+            return "handoff", last_message.target
+
+        content = last_message.to_model_text()
+        # A direct @mention of exactly one candidate other than the sender.
+        mentioned = [
+            name
+            for name in participants
+            if name != last_message.source and re.search(rf"(?<!\w)@{re.escape(name)}(?!\w)", content)
+        ]
+        if len(mentioned) == 1:
+            return "mention", mentioned[0]
+
+        # A candidate whose name and description match the keywords of the last message with high confidence.
+        keywords = _keywords(content)
+        scores = {name: len(keywords & self._participant_keywords[name]) for name in participants}
+        best = max(scores, key=lambda name: scores[name])
+        total = sum(scores.values())
+        if scores[best] >= 2 and scores[best] / total >= self._fast_path_min_confidence:
+            return "classifier", best
+        return None
 
     def construct_message_history(self, message_history: List[LLMMessage]) -> str:
         # Construct the history of the conversation.
-        history_messages: List[str] = []
-        for msg in message_history:
-            if isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage):
-                message = f"{msg.source}: {msg.content}"
-                history_messages.append(
-                    message.rstrip() + "\n\n"
-                )  # Create some consistency for how messages are separated in the transcript
-
-        history: str = "\n".join(history_messages)
+        history: str = "\n".join(text for text, _ in self._render_history_entries(message_history))
         return history
 
-    async def _select_speaker(self, roles: str, participants: List[str], max_attempts: int) -> str:
-        model_context_messages = await self._model_context.get_messages()
-        model_context_history = self.construct_message_history(model_context_messages)
+    async def _select_speakers(self, roles: str, participants: List[str], max_attempts: int) -> List[str]:
+        model_context_history = await self._get_history()
 
         select_speaker_prompt = self._selector_prompt.format(
             roles=roles, participants=str(participants), history=model_context_history
         )
+        max_speakers = min(self._max_parallel_speakers, len(participants))
+        if max_speakers > 1:
+            select_speaker_prompt += (
+                f"\nYou may select up to {max_speakers} roles from {participants} that can work independently "
+                "of each other at the same time. Return only the selected roles, separated by commas."
+            )
 
         select_speaker_messages: List[SystemMessage | UserMessage | AssistantMessage]
         if ModelFamily.is_openai(self._model_client.model_info["family"]):
@@ -248,6 +426,7 @@ async def _select_speaker(self, roles: str, participants: List[str], max_attempt
         num_attempts = 0
         while num_attempts < max_attempts:
             num_attempts += 1
+            self._selection_metrics.model_calls += 1
             if self._model_client_streaming:
                 chunk: CreateResult | str = ""
                 async for _chunk in self._model_client.create_stream(messages=select_speaker_messages):
@@ -277,36 +456,40 @@ async def _select_speaker(self, roles: str, participants: List[str], max_attempt
                 trace_logger.debug(f"Model failed to select a valid name: {response.content} (attempt {num_attempts})")
                 feedback = f"No valid name was mentioned. Please select from: {str(participants)}."
                 select_speaker_messages.append(UserMessage(content=feedback, source="user"))
-            elif len(mentions) > 1:
+            elif len(mentions) > max_speakers:
                 trace_logger.debug(f"Model selected multiple names: {str(mentions)} (attempt {num_attempts})")
-                feedback = (
-                    f"Expected exactly one name to be mentioned. Please select only one from: {str(participants)}."
-                )
+                if max_speakers == 1:
+                    feedback = (
+                        f"Expected exactly one name to be mentioned. Please select only one from: {str(participants)}."
+                    )
+                else:
+                    feedback = f"Expected at most {max_speakers} names to be mentioned. Please select from: {str(participants)}."
                 select_speaker_messages.append(UserMessage(content=feedback, source="user"))
             else:
-                agent_name = list(mentions.keys())[0]
-                if (
-                    not self._allow_repeated_speaker
-                    and self._previous_speaker is not None
-                    and agent_name == self._previous_speaker
-                ):
-                    trace_logger.debug(f"Model selected the previous speaker: {agent_name} (attempt {num_attempts})")
+                # The mentions are in the order of the participants, which is the order the speakers' messages
+                # are added to the message thread.
+                agent_names = list(mentions.keys())
+                repeated = [name for name in agent_names if name in self._previous_speakers]
+                # Repeated speakers are allowed if all participants spoke in the previous turn.
+                all_spoke = set(self._previous_speakers) == set(self._participant_names)
+                if not self._allow_repeated_speaker and repeated and not all_spoke:
+                    trace_logger.debug(f"Model selected the previous speaker: {repeated} (attempt {num_attempts})")
                     feedback = (
                         f"Repeated speaker is not allowed, please select a different name from: {str(participants)}."
                     )
                     select_speaker_messages.append(UserMessage(content=feedback, source="user"))
                 else:
                     # Valid selection
-                    trace_logger.debug(f"Model selected a valid name: {agent_name} (attempt {num_attempts})")
-                    return agent_name
+                    trace_logger.debug(f"Model selected valid names: {agent_names} (attempt {num_attempts})")
+                    return agent_names
 
         if self._previous_speaker is not None:
             trace_logger.warning(f"Model failed to select a speaker after {max_attempts}, using the previous speaker.")
-            return self._previous_speaker
+            return [self._previous_speaker]
         trace_logger.warning(
             f"Model failed to select a speaker after {max_attempts} and there was no previous speaker, using the first participant."
         )
-        return participants[0]
+        return [participants[0]]
 
     def _mentioned_agents(self, message_content: str, agent_names: List[str]) -> Dict[str, int]:
         """Counts the number of times each agent is mentioned in the provided message content.
@@ -356,6 +539,12 @@ class SelectorGroupChatConfig(BaseModel):
     emit_team_events: bool = False
     model_client_streaming: bool = False
     model_context: ComponentModel | None = None
+    message_thread_window: int | None = None
+    message_thread_spill_dir: str | None = None
+    max_parallel_speakers: int = 1
+    selector_history_token_limit: int | None = None
+    fast_path_selection: bool = False
+    fast_path_min_confidence: float = 0.75
 
 
 class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
@@ -393,12 +582,38 @@ class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        team_template (str | None, optional): The name of a team template for teams that share the `runtime`.
+            Teams of the same template register their agents in the runtime only once and are run by
+            sending a single message, see :class:`BaseGroupChat`. Defaults to None.
+        message_thread_window (int | None, optional): The maximum number of messages of the group chat manager's
+            message thread kept in memory. Older messages are spilled to an append-only log file on disk
+            and read back lazily. Defaults to None, meaning all messages are kept in memory.
+        message_thread_spill_dir (str | None, optional): The directory for the message thread log file.
+            Defaults to None, meaning the system temporary directory.
         model_client_streaming (bool, optional): Whether to use streaming for the model client. (This is useful for reasoning models like QwQ). Defaults to False.
         model_context (ChatCompletionContext | None, optional): The model context for storing and retrieving
             :class:`~autogen_core.models.LLMMessage`. It can be preloaded with initial messages. Messages stored in model context will be used for speaker selection. The initial messages will be cleared when the team is reset.
+        max_parallel_speakers (int, optional): The maximum number of speakers the model may select for a turn.
+            If greater than 1, the model is asked to select up to this many roles that can work independently,
+            and the selected speakers respond concurrently without seeing each other's messages of the same turn.
+            Their messages are added to the message thread in the order of the participants. Defaults to 1.
+        selector_history_token_limit (int | None, optional): The maximum number of tokens of the conversation
+            history in the selector prompt, counted with the `model_client`. The most recent messages
+            within the limit are kept, so the cost of selecting a speaker does not grow with the length
+            of the conversation. Defaults to None, meaning the full history of the model context is used.
+        fast_path_selection (bool, optional): Whether to try cheap deterministic rules before calling the model
+            to select a speaker: a handoff to a candidate in the last message, an @mention of exactly one candidate
+            in the last message, and a keyword classifier that matches the last message with the names and
+            descriptions of the candidates. The model is only called if no rule selects a speaker.
+            See :attr:`selection_metrics` for the number of selections made by each rule. Defaults to False.
+        fast_path_min_confidence (float, optional): The minimum confidence of the keyword classifier, i.e.,
+            the fraction of the matched keywords that belong to the best candidate, for it to select the speaker
+            without the model. Defaults to 0.75.
 
     Raises:
-        ValueError: If the number of participants is less than two or if the selector prompt is invalid.
+        ValueError: If the number of participants is less than two, if the selector prompt is invalid,
+            if `max_parallel_speakers` is less than 1, if `selector_history_token_limit` is not positive,
+            or if `fast_path_min_confidence` is not in (0, 1].
 
     Examples:
 
@@ -598,6 +813,13 @@ def __init__(
         emit_team_events: bool = False,
         model_client_streaming: bool = False,
         model_context: ChatCompletionContext | None = None,
+        team_template: str | None = None,
+        message_thread_window: int | None = None,
+        message_thread_spill_dir: str | None = None,
+        max_parallel_speakers: int = 1,
+        selector_history_token_limit: int | None = None,
+        fast_path_selection: bool = False,
+        fast_path_min_confidence: float = 0.75,
     ):
         super().__init__(
             participants,
@@ -608,10 +830,19 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            team_template=team_template,
+            message_thread_window=message_thread_window,
+            message_thread_spill_dir=message_thread_spill_dir,
         )
         # Validate the participants.
         if len(participants) < 2:
             raise ValueError("At least two participants are required for SelectorGroupChat.")
+        if max_parallel_speakers < 1:
+            raise ValueError("The maximum number of parallel speakers must be at least 1.")
+        if selector_history_token_limit is not None and selector_history_token_limit <= 0:
+            raise ValueError("selector_history_token_limit must be greater than 0.")
+        if not 0 < fast_path_min_confidence <= 1:
+            raise ValueError("fast_path_min_confidence must be in (0, 1].")
         self._selector_prompt = selector_prompt
         self._model_client = model_client
         self._allow_repeated_speaker = allow_repeated_speaker
@@ -620,6 +851,17 @@ def __init__(
         self._candidate_func = candidate_func
         self._model_client_streaming = model_client_streaming
         self._model_context = model_context
+        self._max_parallel_speakers = max_parallel_speakers
+        self._selector_history_token_limit = selector_history_token_limit
+        self._fast_path_selection = fast_path_selection
+        self._fast_path_min_confidence = fast_path_min_confidence
+        self._selection_metrics = SpeakerSelectionMetrics()
+
+    @property
+    def selection_metrics(self) -> SpeakerSelectionMetrics:
+        """The number of speaker selections by each selection tier, including
+        how many selections were made without calling the model."""
+        return self._selection_metrics
 
     def _create_group_chat_manager_factory(
         self,
@@ -654,6 +896,11 @@ def _create_group_chat_manager_factory(
             self._emit_team_events,
             self._model_context,
             self._model_client_streaming,
+            self._max_parallel_speakers,
+            self._selector_history_token_limit,
+            self._fast_path_selection,
+            self._fast_path_min_confidence,
+            self._selection_metrics,
         )
 
     def _to_config(self) -> SelectorGroupChatConfig:
@@ -669,6 +916,12 @@ def _to_config(self) -> SelectorGroupChatConfig:
             emit_team_events=self._emit_team_events,
             model_client_streaming=self._model_client_streaming,
             model_context=self._model_context.dump_component() if self._model_context else None,
+            message_thread_window=self._message_thread_window,
+            message_thread_spill_dir=self._message_thread_spill_dir,
+            max_parallel_speakers=self._max_parallel_speakers,
+            selector_history_token_limit=self._selector_history_token_limit,
+            fast_path_selection=self._fast_path_selection,
+            fast_path_min_confidence=self._fast_path_min_confidence,
         )
 
     @classmethod
@@ -689,4 +942,10 @@ def _from_config(cls, config: SelectorGroupChatConfig) -> Self:
             emit_team_events=config.emit_team_events,
             model_client_streaming=config.model_client_streaming,
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
+            message_thread_window=config.message_thread_window,
+            message_thread_spill_dir=config.message_thread_spill_dir,
+            max_parallel_speakers=config.max_parallel_speakers,
+            selector_history_token_limit=config.selector_history_token_limit,
+            fast_path_selection=config.fast_path_selection,
+            fast_path_min_confidence=config.fast_path_min_confidence,
         )
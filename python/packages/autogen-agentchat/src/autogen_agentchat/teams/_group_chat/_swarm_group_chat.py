@@ -99,15 +99,14 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SwarmManagerState(
-            message_thread=[msg.dump() for msg in self._message_thread],
             current_turn=self._current_turn,
             current_speaker=self._current_speaker,
         )
-        return state.model_dump()
+        return self._dump_state(state)
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         swarm_state = SwarmManagerState.model_validate(state)
-        self._message_thread = [self._message_factory.create(message) for message in swarm_state.message_thread]
+        self._message_thread.load(swarm_state.message_thread)
         self._current_turn = swarm_state.current_turn
         self._current_speaker = swarm_state.current_speaker
 
@@ -119,6 +118,8 @@ class SwarmConfig(BaseModel):
     termination_condition: ComponentModel | None = None
     max_turns: int | None = None
     emit_team_events: bool = False
+    message_thread_window: int | None = None
+    message_thread_spill_dir: str | None = None
 
 
 class Swarm(BaseGroupChat, Component[SwarmConfig]):
@@ -138,6 +139,14 @@ class Swarm(BaseGroupChat, Component[SwarmConfig]):
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        team_template (str | None, optional): The name of a team template for teams that share the `runtime`.
+            Teams of the same template register their agents in the runtime only once and are run by
+            sending a single message, see :class:`BaseGroupChat`. Defaults to None.
+        message_thread_window (int | None, optional): The maximum number of messages of the group chat manager's
+            message thread kept in memory. Older messages are spilled to an append-only log file on disk
+            and read back lazily. Defaults to None, meaning all messages are kept in memory.
+        message_thread_spill_dir (str | None, optional): The directory for the message thread log file.
+            Defaults to None, meaning the system temporary directory.
 
     Basic example:
 
@@ -226,6 +235,9 @@ def __init__(
         runtime: AgentRuntime | None = None,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        team_template: str | None = None,
+        message_thread_window: int | None = None,
+        message_thread_spill_dir: str | None = None,
     ) -> None:
         super().__init__(
             participants,
@@ -236,6 +248,9 @@ def __init__(
             runtime=runtime,
             custom_message_types=custom_message_types,
             emit_team_events=emit_team_events,
+            team_template=team_template,
+            message_thread_window=message_thread_window,
+            message_thread_spill_dir=message_thread_spill_dir,
         )
         # The first participant must be able to produce handoff messages.
         first_participant = self._participants[0]
@@ -280,6 +295,8 @@ def _to_config(self) -> SwarmConfig:
             termination_condition=termination_condition,
             max_turns=self._max_turns,
             emit_team_events=self._emit_team_events,
+            message_thread_window=self._message_thread_window,
+            message_thread_spill_dir=self._message_thread_spill_dir,
         )
 
     @classmethod
@@ -293,4 +310,6 @@ def _from_config(cls, config: SwarmConfig) -> "Swarm":
             termination_condition=termination_condition,
             max_turns=config.max_turns,
             emit_team_events=config.emit_team_events,
+            message_thread_window=config.message_thread_window,
+            message_thread_spill_dir=config.message_thread_spill_dir,
         )
@@ -1,6 +1,7 @@
+import asyncio
 import json
 import logging
-from typing import Dict, List
+from typing import AsyncGenerator, Dict, List
 
 import pytest
 from autogen_agentchat import EVENT_LOGGER_NAME
@@ -15,11 +16,12 @@
     StructuredMessage,
     TextMessage,
     ThoughtEvent,
+    ToolCallExecutionChunkEvent,
     ToolCallExecutionEvent,
     ToolCallRequestEvent,
     ToolCallSummaryMessage,
 )
-from autogen_core import ComponentModel, FunctionCall, Image
+from autogen_core import CancellationToken, ComponentModel, FunctionCall, Image
 from autogen_core.memory import ListMemory, Memory, MemoryContent, MemoryMimeType, MemoryQueryResult
 from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import (
@@ -33,7 +35,7 @@
     UserMessage,
 )
 from autogen_core.models._model_client import ModelFamily, ModelInfo
-from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench
+from autogen_core.tools import BaseStreamTool, BaseTool, FunctionTool, StaticWorkbench
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.models.replay import ReplayChatCompletionClient
 from autogen_ext.tools.mcp import (
@@ -463,6 +465,39 @@ async def test_run_with_parallel_tools_with_empty_call_ids() -> None:
     assert state == state2
 
 
+class _ClosableTool(FunctionTool):
+    def __init__(self) -> None:
+        super().__init__(_pass_function, description="Pass")
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_close_releases_tools() -> None:
+    model_client = ReplayChatCompletionClient(
+        ["Hello"],
+        model_info={
+            "function_calling": True,
+            "vision": False,
+            "json_output": False,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": False,
+        },
+    )
+    tool = _ClosableTool()
+    agent = AssistantAgent("tool_use_agent", model_client=model_client, tools=[tool])
+    await agent.close()
+    assert tool.closed
+
+    # A workbench passed to the agent is not stopped.
+    tool = _ClosableTool()
+    agent = AssistantAgent("tool_use_agent", model_client=model_client, workbench=StaticWorkbench([tool]))
+    await agent.close()
+    assert not tool.closed
+
+
 @pytest.mark.asyncio
 async def test_run_with_workbench() -> None:
     model_client = ReplayChatCompletionClient(
@@ -1363,6 +1398,264 @@ async def test_model_client_stream_with_tool_calls() -> None:
     assert "".join(chunks) == "Example response 2 to task"
 
 
+class _ProgressArgs(BaseModel):
+    steps: int
+
+
+class _ProgressUpdate(BaseModel):
+    step: int
+
+
+class _ProgressResult(BaseModel):
+    done: bool
+
+
+class _ProgressTool(BaseStreamTool[_ProgressArgs, _ProgressUpdate, _ProgressResult]):
+    def __init__(self) -> None:
+        super().__init__(
+            args_type=_ProgressArgs,
+            return_type=_ProgressResult,
+            name="progress_tool",
+            description="A tool that reports its progress.",
+        )
+
+    async def run_stream(
+        self, args: _ProgressArgs, cancellation_token: CancellationToken
+    ) -> AsyncGenerator[_ProgressUpdate | _ProgressResult, None]:
+        for i in range(args.steps):
+            yield _ProgressUpdate(step=i)
+        yield _ProgressResult(done=True)
+
+
+@pytest.mark.asyncio
+async def test_run_with_stream_tool() -> None:
+    model_client = ReplayChatCompletionClient(
+        [
+            CreateResult(
+                content=[
+                    FunctionCall(id="1", name="progress_tool", arguments=json.dumps({"steps": 2})),
+                    FunctionCall(id="2", name="_pass_function", arguments=json.dumps({"input": "task"})),
+                ],
+                finish_reason="function_calls",
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+        ]
+    )
+    model_client._model_info["function_calling"] = True  # pyright: ignore
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=model_client,
+        tools=[_ProgressTool(), _pass_function],
+    )
+    chunks: List[ToolCallExecutionChunkEvent] = []
+    result: TaskResult | None = None
+    async for message in agent.run_stream(task="task"):
+        if isinstance(message, TaskResult):
+            result = message
+        elif isinstance(message, ToolCallExecutionChunkEvent):
+            chunks.append(message)
+
+    # Partial results are streamed as chunk events.
+    assert [chunk.content for chunk in chunks] == ['{"step":0}', '{"step":1}']
+    assert all(chunk.call_id == "1" and chunk.name == "progress_tool" for chunk in chunks)
+
+    # Chunk events are not part of the task result, and the final results are reported once.
+    assert result is not None
+    assert not any(isinstance(message, ToolCallExecutionChunkEvent) for message in result.messages)
+    assert isinstance(result.messages[2], ToolCallExecutionEvent)
+    assert result.messages[2].content == [
+        FunctionExecutionResult(call_id="1", content='{"done": true}', is_error=False, name="progress_tool"),
+        FunctionExecutionResult(call_id="2", content="pass", is_error=False, name="_pass_function"),
+    ]
+
+
+async def _slow_function(input: str) -> str:
+    await asyncio.sleep(0.1)
+    return "slow"
+
+
+async def _hanging_function(input: str) -> str:
+    await asyncio.sleep(60)
+    return "hanging"
+
+
+@pytest.mark.asyncio
+async def test_run_with_tool_call_quorum() -> None:
+    model_client = ReplayChatCompletionClient(
+        [
+            CreateResult(
+                content=[
+                    FunctionCall(id="1", name="_hanging_function", arguments=json.dumps({"input": "task"})),
+                    FunctionCall(id="2", name="_pass_function", arguments=json.dumps({"input": "task"})),
+                    FunctionCall(id="3", name="_slow_function", arguments=json.dumps({"input": "task"})),
+                ],
+                finish_reason="function_calls",
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+            "Done with partial results",
+        ]
+    )
+    model_client._model_info["function_calling"] = True  # pyright: ignore
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=model_client,
+        tools=[_hanging_function, _pass_function, _slow_function],
+        reflect_on_tool_use=True,
+        tool_call_quorum=1,
+        tool_call_quorum_grace_period=1,
+    )
+    result = await asyncio.wait_for(agent.run(task="task"), timeout=10)
+
+    # The slow call finishes within the grace period and is merged, the hanging call is cancelled.
+    assert isinstance(result.messages[2], ToolCallExecutionEvent)
+    hanging_result, pass_result, slow_result = result.messages[2].content
+    assert hanging_result.is_error and hanging_result.call_id == "1"
+    assert pass_result == FunctionExecutionResult(call_id="2", content="pass", is_error=False, name="_pass_function")
+    assert slow_result == FunctionExecutionResult(call_id="3", content="slow", is_error=False, name="_slow_function")
+
+    # The reflection is made with the partial results.
+    assert isinstance(result.messages[-1], TextMessage)
+    assert result.messages[-1].content == "Done with partial results"
+    last_context_message = model_client.create_calls[-1]["messages"][-1]
+    assert isinstance(last_context_message, FunctionExecutionResultMessage)
+    assert len(last_context_message.content) == 3
+
+    config = agent.dump_component()
+    assert config.config["tool_call_quorum"] == 1
+    assert config.config["tool_call_quorum_grace_period"] == 1
+
+    with pytest.raises(ValueError):
+        AssistantAgent("test_agent", model_client=model_client, tools=[_pass_function], tool_call_quorum=0)
+
+
+@pytest.mark.asyncio
+async def test_run_with_tool_call_timeouts() -> None:
+    def _make_model_client() -> ReplayChatCompletionClient:
+        model_client = ReplayChatCompletionClient(
+            [
+                CreateResult(
+                    content=[
+                        FunctionCall(id="1", name="_hanging_function", arguments=json.dumps({"input": "task"})),
+                        FunctionCall(id="2", name="_pass_function", arguments=json.dumps({"input": "task"})),
+                        FunctionCall(id="3", name="_slow_function", arguments=json.dumps({"input": "task"})),
+                    ],
+                    finish_reason="function_calls",
+                    usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                    cached=False,
+                ),
+            ]
+        )
+        model_client._model_info["function_calling"] = True  # pyright: ignore
+        return model_client
+
+    # A per-tool timeout only applies to the named tool.
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=_make_model_client(),
+        tools=[_hanging_function, _pass_function, _slow_function],
+        tool_call_timeout={"_hanging_function": 0.2},
+    )
+    result = await asyncio.wait_for(agent.run(task="task"), timeout=10)
+    assert isinstance(result.messages[2], ToolCallExecutionEvent)
+    hanging_result, pass_result, slow_result = result.messages[2].content
+    assert hanging_result.is_error
+    assert hanging_result.content == "Error: tool call timed out after 0.2 seconds."
+    assert pass_result == FunctionExecutionResult(call_id="2", content="pass", is_error=False, name="_pass_function")
+    assert slow_result == FunctionExecutionResult(call_id="3", content="slow", is_error=False, name="_slow_function")
+    durations = result.messages[2].durations
+    assert set(durations) == {"1", "2", "3"}
+    assert durations["1"] >= 0.2 and durations["3"] >= 0.1
+
+    # A turn timeout cancels every call still running at the deadline.
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=_make_model_client(),
+        tools=[_hanging_function, _pass_function, _slow_function],
+        tool_call_turn_timeout=0.5,
+    )
+    result = await asyncio.wait_for(agent.run(task="task"), timeout=10)
+    assert isinstance(result.messages[2], ToolCallExecutionEvent)
+    hanging_result, pass_result, slow_result = result.messages[2].content
+    assert hanging_result.is_error
+    assert "turn timeout" in hanging_result.content
+    assert not pass_result.is_error and not slow_result.is_error
+
+    # With a concurrency limit of one, the calls run one after another.
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=_make_model_client(),
+        tools=[_hanging_function, _pass_function, _slow_function],
+        tool_call_timeout=0.2,
+        max_concurrent_tool_calls=1,
+    )
+    start = asyncio.get_running_loop().time()
+    result = await asyncio.wait_for(agent.run(task="task"), timeout=10)
+    assert asyncio.get_running_loop().time() - start >= 0.3
+    assert isinstance(result.messages[2], ToolCallExecutionEvent)
+    assert [r.is_error for r in result.messages[2].content] == [True, False, False]
+
+    config = agent.dump_component()
+    assert config.config["tool_call_timeout"] == 0.2
+    assert config.config["max_concurrent_tool_calls"] == 1
+    loaded_agent = AssistantAgent.load_component(config)
+    assert loaded_agent._tool_call_timeout == 0.2  # pyright: ignore[reportPrivateUsage]
+
+    with pytest.raises(ValueError):
+        AssistantAgent("test_agent", model_client=_make_model_client(), tool_call_timeout=0)
+    with pytest.raises(ValueError):
+        AssistantAgent("test_agent", model_client=_make_model_client(), max_concurrent_tool_calls=0)
+
+
+@pytest.mark.asyncio
+async def test_handoff_outlasts_tool_call_turn_timeout() -> None:
+    class SlowHandoff(Handoff):
+        @property
+        def handoff_tool(self) -> BaseTool[BaseModel, BaseModel]:
+            """Create a handoff tool that takes longer than the turn timeout."""
+
+            async def _slow_handoff() -> str:
+                await asyncio.sleep(0.3)
+                return self.message
+
+            return FunctionTool(_slow_handoff, name=self.name, description=self.description)
+
+    handoff = SlowHandoff(target="agent2")
+    model_client = ReplayChatCompletionClient(
+        [
+            CreateResult(
+                content=[
+                    FunctionCall(id="1", name="_hanging_function", arguments=json.dumps({"input": "task"})),
+                    FunctionCall(id="2", name=handoff.name, arguments=json.dumps({})),
+                ],
+                finish_reason="function_calls",
+                usage=RequestUsage(prompt_tokens=10, completion_tokens=5),
+                cached=False,
+            ),
+        ]
+    )
+    model_client._model_info["function_calling"] = True  # pyright: ignore
+    agent = AssistantAgent(
+        "test_agent",
+        model_client=model_client,
+        tools=[_hanging_function],
+        handoffs=[handoff],
+        tool_call_turn_timeout=0.1,
+    )
+    result = await asyncio.wait_for(agent.run(task="task"), timeout=10)
+
+    # The turn timeout cancels the hanging call, but the handoff is awaited and completes.
+    assert isinstance(result.messages[2], ToolCallExecutionEvent)
+    hanging_result, handoff_result = result.messages[2].content
+    assert hanging_result.is_error and "turn timeout" in hanging_result.content
+    assert handoff_result == FunctionExecutionResult(
+        call_id="2", content=handoff.message, is_error=False, name=handoff.name
+    )
+    assert isinstance(result.messages[-1], HandoffMessage)
+    assert result.messages[-1].target == "agent2"
+
+
 @pytest.mark.asyncio
 async def test_invalid_structured_output_format() -> None:
     class AgentResponse(BaseModel):
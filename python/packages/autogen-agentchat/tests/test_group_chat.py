@@ -2,6 +2,7 @@
 import json
 import logging
 import tempfile
+from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Mapping, Sequence
 
 import pytest
@@ -23,6 +24,7 @@
     BaseAgentEvent,
     BaseChatMessage,
     HandoffMessage,
+    MessageFactory,
     ModelClientStreamingChunkEvent,
     MultiModalMessage,
     SelectorEvent,
@@ -34,13 +36,21 @@
     ToolCallRequestEvent,
     ToolCallSummaryMessage,
 )
+from autogen_agentchat.state import (
+    FileCheckpointStore,
+    InMemoryCheckpointStore,
+    RoundRobinManagerState,
+    SelectorManagerState,
+    TeamCheckpointer,
+)
 from autogen_agentchat.teams import MagenticOneGroupChat, RoundRobinGroupChat, SelectorGroupChat, Swarm
+from autogen_agentchat.teams._group_chat._message_thread import MessageThread
 from autogen_agentchat.teams._group_chat._round_robin_group_chat import RoundRobinGroupChatManager
 from autogen_agentchat.teams._group_chat._selector_group_chat import SelectorGroupChatManager
 from autogen_agentchat.teams._group_chat._swarm_group_chat import SwarmGroupChatManager
 from autogen_agentchat.ui import Console
 from autogen_core import AgentId, AgentRuntime, CancellationToken, FunctionCall, SingleThreadedAgentRuntime
-from autogen_core.model_context import BufferedChatCompletionContext
+from autogen_core.model_context import BufferedChatCompletionContext, UnboundedChatCompletionContext
 from autogen_core.models import (
     AssistantMessage,
     CreateResult,
@@ -55,6 +65,7 @@
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.models.replay import ReplayChatCompletionClient
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 from utils import FileLogHandler, compare_messages, compare_task_results
 
 logger = logging.getLogger(EVENT_LOGGER_NAME)
@@ -194,6 +205,26 @@ async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_to
         return Response(chat_message=StopMessage(content="TERMINATE", source=self.name))
 
 
+class _DelayedEchoAgent(_EchoAgent):
+    """An echo agent that takes `delay` seconds to respond and tracks the number of concurrent responses."""
+
+    active = 0
+    max_active = 0
+
+    def __init__(self, name: str, description: str, *, delay: float) -> None:
+        super().__init__(name, description)
+        self._delay = delay
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        _DelayedEchoAgent.active += 1
+        _DelayedEchoAgent.max_active = max(_DelayedEchoAgent.max_active, _DelayedEchoAgent.active)
+        try:
+            await asyncio.sleep(self._delay)
+            return await super().on_messages(messages, cancellation_token)
+        finally:
+            _DelayedEchoAgent.active -= 1
+
+
 def _pass_function(input: str) -> str:
     return "pass"
 
@@ -547,6 +578,215 @@ async def test_round_robin_group_chat_with_resume_and_reset(runtime: AgentRuntim
     assert result.stop_reason is not None
 
 
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_with_team_template() -> None:
+    runtime = SingleThreadedAgentRuntime()
+    runtime.start()
+
+    def _create_team() -> RoundRobinGroupChat:
+        return RoundRobinGroupChat(
+            participants=[_EchoAgent("agent_1", description="echo agent 1"), _EchoAgent("agent_2", "echo agent 2")],
+            termination_condition=MaxMessageTermination(3),
+            runtime=runtime,
+            team_template="echo_team",
+        )
+
+    # Many teams of the same template run concurrently on the shared runtime.
+    teams = [_create_team() for _ in range(5)]
+    results = await asyncio.gather(*[team.run(task=f"Task {i}") for i, team in enumerate(teams)])
+    for i, result in enumerate(results):
+        assert [message.to_text() for message in result.messages] == [f"Task {i}"] * 3
+        assert [message.source for message in result.messages] == ["user", "agent_1", "agent_2"]
+
+    # The agent types are registered only once for the template.
+    assert len(runtime._agent_factories) == 3  # pyright: ignore[reportPrivateUsage]
+    assert len(runtime._instantiated_agents) == 15  # pyright: ignore[reportPrivateUsage]
+
+    # Each team keeps its own state between runs.
+    result = await teams[1].run()
+    assert [message.source for message in result.messages] == ["agent_1", "agent_2", "agent_1"]
+    assert result.messages[0].to_text() == "Task 1"
+
+    # Closing a team removes its agents from the runtime.
+    await teams[0].close()
+    assert len(runtime._instantiated_agents) == 12  # pyright: ignore[reportPrivateUsage]
+
+    # A team that does not match the template is rejected.
+    with pytest.raises(ValueError, match="does not match the team template"):
+        RoundRobinGroupChat(
+            participants=[_EchoAgent("agent_3", description="echo agent 3")],
+            runtime=runtime,
+            team_template="echo_team",
+        )
+
+    with pytest.raises(ValueError, match="requires a shared runtime"):
+        RoundRobinGroupChat(participants=[_EchoAgent("agent_1", "echo agent 1")], team_template="echo_team")
+
+    await runtime.stop()
+
+
+def test_message_thread_spills_to_disk(tmp_path: Path) -> None:
+    thread = MessageThread(MessageFactory(), window=2, spill_dir=str(tmp_path))
+    messages = [TextMessage(content=f"Message {i}", source="user") for i in range(5)]
+    thread.extend(messages)
+    thread.append(ModelClientStreamingChunkEvent(content="chunk", source="agent"))
+
+    # Only the window is kept in memory, the rest is read back from the log.
+    assert len(thread) == 5
+    assert len(thread._tail) == 2  # pyright: ignore[reportPrivateUsage]
+    assert list(thread) == messages
+    assert list(reversed(thread)) == messages[::-1]
+    assert thread[0] == messages[0] and thread[-1] == messages[-1]
+    assert thread[1:3] == messages[1:3]
+    assert [TextMessage.load(dump) for dump in thread.dump()] == messages
+
+    # Iteration covers the messages at the time of the call, even if messages are spilled meanwhile.
+    iterator, dumps = iter(thread), thread.dump()
+    assert next(iterator) == messages[0] and TextMessage.load(next(dumps)) == messages[0]
+    thread.extend([TextMessage(content="Late message", source="user")] * 2)
+    assert [messages[0], *iterator] == messages
+    assert [messages[0], *[TextMessage.load(dump) for dump in dumps]] == messages
+    assert len(thread) == 7
+
+    thread.load([message.dump() for message in messages[:3]])
+    assert thread == messages[:3]
+    thread.clear()
+    assert len(thread) == 0
+    thread.close()
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_with_message_thread_window(tmp_path: Path) -> None:
+    agent_1 = _EchoAgent("agent_1", description="echo agent 1")
+    agent_2 = _EchoAgent("agent_2", description="echo agent 2")
+    team = RoundRobinGroupChat(
+        participants=[agent_1, agent_2],
+        termination_condition=MaxMessageTermination(10),
+        message_thread_window=3,
+        message_thread_spill_dir=str(tmp_path),
+    )
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    assert len(result.messages) == 10
+
+    # The state export includes the spilled messages.
+    state = await team.save_state()
+    manager_state = RoundRobinManagerState.model_validate(state["agent_states"]["RoundRobinGroupChatManager"])
+    assert [message["content"] for message in manager_state.message_thread] == [
+        message.to_text() for message in result.messages
+    ]
+
+    # The state can be loaded into a team without a window.
+    team_2 = RoundRobinGroupChat(participants=[agent_1, agent_2], termination_condition=MaxMessageTermination(10))
+    await team_2.load_state(state)
+    manager = await team_2._runtime.try_get_underlying_agent_instance(  # pyright: ignore[reportPrivateUsage]
+        AgentId("RoundRobinGroupChatManager_" + team_2._team_id, team_2._team_id),  # pyright: ignore[reportPrivateUsage]
+        RoundRobinGroupChatManager,
+    )
+    assert manager._message_thread == result.messages  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_with_parallel_speakers() -> None:
+    _DelayedEchoAgent.max_active = 0
+    agent_1 = _DelayedEchoAgent("agent_1", description="echo agent 1", delay=0.2)
+    agent_2 = _DelayedEchoAgent("agent_2", description="echo agent 2", delay=0.0)
+    agent_3 = _DelayedEchoAgent("agent_3", description="echo agent 3", delay=0.0)
+    team = RoundRobinGroupChat(
+        participants=[agent_1, agent_2, agent_3],
+        termination_condition=MaxMessageTermination(5),
+        parallel_speakers=2,
+    )
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    assert _DelayedEchoAgent.max_active == 2
+    assert len(result.messages) == 5
+
+    # The message thread is in the round-robin order, although agent_2 responded before agent_1.
+    state = await team.save_state()
+    manager_state = RoundRobinManagerState.model_validate(state["agent_states"]["RoundRobinGroupChatManager"])
+    assert [message["source"] for message in manager_state.message_thread] == [
+        "user",
+        "agent_1",
+        "agent_2",
+        "agent_3",
+        "agent_1",
+    ]
+    assert manager_state.next_speaker_index == 1
+
+    with pytest.raises(ValueError, match="parallel speakers"):
+        RoundRobinGroupChat(participants=[agent_1, agent_2], parallel_speakers=0)
+
+
+@pytest.mark.asyncio
+async def test_round_robin_group_chat_checkpoints(tmp_path: Path) -> None:
+    agent_1 = _EchoAgent("agent_1", description="echo agent 1")
+    agent_2 = _EchoAgent("agent_2", description="echo agent 2")
+    team = RoundRobinGroupChat(participants=[agent_1, agent_2], termination_condition=MaxMessageTermination(3))
+    store = FileCheckpointStore(str(tmp_path))
+    checkpointer = TeamCheckpointer(team, store, name="team", compact_every=2)
+
+    # The first checkpoint is a full checkpoint.
+    await team.run(task="Write a program that prints 'Hello, world!'")
+    checkpoint = await checkpointer.save()
+    assert checkpoint.full
+    assert checkpointer.agent_versions == {"agent_1": 1, "agent_2": 1, "RoundRobinGroupChatManager": 1}
+
+    # Later checkpoints only contain the messages appended to the thread.
+    result = await team.run()
+    checkpoint = await checkpointer.save()
+    assert not checkpoint.full
+    manager_delta = checkpoint.agent_deltas["RoundRobinGroupChatManager"]
+    appended = [op for op in manager_delta if op["op"] == "append" and op["path"] == ["message_thread"]]
+    assert [message["content"] for message in appended[0]["value"]] == [
+        message.to_text() for message in result.messages
+    ]
+    assert checkpointer.agent_versions["RoundRobinGroupChatManager"] == 2
+
+    # Agents whose state did not change are omitted.
+    checkpoint = await checkpointer.save()
+    assert checkpoint.agent_deltas == {}
+    assert len(await store.read("team")) == 3
+
+    # The checkpoints are compacted to a full checkpoint.
+    await team.run()
+    checkpoint = await checkpointer.save()
+    assert checkpoint.full
+    assert len(await store.read("team")) == 1
+    await team.run()
+    await checkpointer.save()
+
+    # The team state is restored from the full and delta checkpoints.
+    team_2 = RoundRobinGroupChat(
+        participants=[
+            _EchoAgent("agent_1", description="echo agent 1"),
+            _EchoAgent("agent_2", description="echo agent 2"),
+        ],
+        termination_condition=MaxMessageTermination(3),
+    )
+    checkpointer_2 = TeamCheckpointer(team_2, FileCheckpointStore(str(tmp_path)), name="team")
+    assert await checkpointer_2.restore()
+    assert checkpointer_2.agent_versions == checkpointer.agent_versions
+    assert to_jsonable_python(await team_2.save_state()) == to_jsonable_python(await team.save_state())
+    assert not await TeamCheckpointer(team_2, InMemoryCheckpointStore(), name="team").restore()
+
+
+@pytest.mark.asyncio
+async def test_file_checkpoint_store_recovers_partial_write(tmp_path: Path) -> None:
+    store = FileCheckpointStore(str(tmp_path))
+    await store.append("team", {"n": 1})
+    # A crash while appending leaves a partially written line.
+    path = tmp_path / "team.jsonl"
+    path.write_text(path.read_text(encoding="utf-8") + '{"n": 2, "agent_st', encoding="utf-8")
+    assert await store.read("team") == [{"n": 1}]
+    # The checkpoints appended after the crash are not lost.
+    await store.append("team", {"n": 3})
+    await store.append("team", {"n": 4})
+    assert await store.read("team") == [{"n": 1}, {"n": 3}, {"n": 4}]
+    # A file with only a partially written line is emptied.
+    (tmp_path / "other.jsonl").write_text('{"n": ', encoding="utf-8")
+    await store.append("other", {"n": 1})
+    assert await store.read("other") == [{"n": 1}]
+
+
 @pytest.mark.asyncio
 async def test_round_robin_group_chat_with_exception_raised_from_agent(runtime: AgentRuntime | None) -> None:
     agent_1 = _EchoAgent("agent_1", description="echo agent 1")
@@ -701,6 +941,110 @@ async def test_selector_group_chat(runtime: AgentRuntime | None) -> None:
     assert compare_task_results(result2, result)
 
 
+@pytest.mark.asyncio
+async def test_selector_group_chat_with_parallel_speakers() -> None:
+    model_client = ReplayChatCompletionClient(["agent3, agent2", "agent1"])
+    _DelayedEchoAgent.max_active = 0
+    agent1 = _DelayedEchoAgent("agent1", description="echo agent 1", delay=0.0)
+    agent2 = _DelayedEchoAgent("agent2", description="echo agent 2", delay=0.2)
+    agent3 = _DelayedEchoAgent("agent3", description="echo agent 3", delay=0.0)
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        termination_condition=MaxMessageTermination(4),
+        max_parallel_speakers=2,
+    )
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    assert _DelayedEchoAgent.max_active == 2
+    # The model is asked to select up to two speakers.
+    assert "up to 2 roles" in str(model_client.create_calls[0]["messages"][0].content)
+    # The speakers of a turn are added to the message thread in the order of the participants.
+    state = await team.save_state()
+    manager_state = SelectorManagerState.model_validate(state["agent_states"]["SelectorGroupChatManager"])
+    assert [message["source"] for message in manager_state.message_thread] == ["user", "agent2", "agent3", "agent1"]
+    assert manager_state.previous_speakers == ["agent1"]
+    assert len(result.messages) == 4
+
+    with pytest.raises(ValueError, match="parallel speakers"):
+        SelectorGroupChat(participants=[agent1, agent2], model_client=model_client, max_parallel_speakers=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("custom_model_context", [False, True])
+async def test_selector_group_chat_with_history_token_limit(custom_model_context: bool) -> None:
+    model_client = ReplayChatCompletionClient(["agent2", "agent1", "agent2", "agent1"])
+    agent1 = _EchoAgent("agent1", description="echo agent 1")
+    agent2 = _EchoAgent("agent2", description="echo agent 2")
+    agent3 = _EchoAgent("agent3", description="echo agent 3")
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        termination_condition=MaxMessageTermination(5),
+        model_context=UnboundedChatCompletionContext() if custom_model_context else None,
+        selector_history_token_limit=20,
+    )
+    await team.run(task="Write a program that prints 'Hello, world!'")
+
+    def _history(call: Dict[str, Any]) -> List[str]:
+        prompt = str(call["messages"][0].content)
+        return [line for line in prompt.splitlines() if "Hello, world!" in line]
+
+    # The selector prompt keeps the most recent messages within the token limit, which fits two messages.
+    assert [line.split(":")[0] for line in _history(model_client.create_calls[0])] == ["user"]
+    assert [line.split(":")[0] for line in _history(model_client.create_calls[1])] == ["user", "agent2"]
+    assert [line.split(":")[0] for line in _history(model_client.create_calls[2])] == ["agent2", "agent1"]
+    assert [line.split(":")[0] for line in _history(model_client.create_calls[3])] == ["agent1", "agent2"]
+
+    with pytest.raises(ValueError, match="selector_history_token_limit"):
+        SelectorGroupChat(participants=[agent1, agent2], model_client=model_client, selector_history_token_limit=0)
+
+
+@pytest.mark.asyncio
+async def test_selector_group_chat_with_fast_path_selection() -> None:
+    model_client = ReplayChatCompletionClient(["agent1", "agent2"])
+    agent1 = _EchoAgent("agent1", description="Writes python code.")
+    agent2 = _EchoAgent("agent2", description="Reviews the code.")
+    agent3 = _EchoAgent("agent3", description="Search agent that can search the web for recent news.")
+    team = SelectorGroupChat(
+        participants=[agent1, agent2, agent3],
+        model_client=model_client,
+        termination_condition=MaxMessageTermination(4),
+        fast_path_selection=True,
+    )
+    # The @mention selects agent2, the model selects agent1 as agent2's echo mentions itself,
+    # and the @mention in agent1's echo selects agent2 again.
+    result = await team.run(task="Please @agent2 take a look.")
+    assert [message.source for message in result.messages] == ["user", "agent2", "agent1", "agent2"]
+    assert team.selection_metrics.selections["mention"] == 2
+    assert team.selection_metrics.selections["model"] == 1
+    assert team.selection_metrics.model_calls == 1
+    assert team.selection_metrics.model_calls_avoided == 2
+
+    # The keyword classifier selects agent3 for a task that matches its description.
+    team.selection_metrics.reset()
+    await team.reset()
+    result = await team.run(task="Find recent news about the search engine.")
+    assert [message.source for message in result.messages][:2] == ["user", "agent3"]
+    assert team.selection_metrics.selections["classifier"] >= 1
+
+    # A handoff to a candidate selects the target.
+    model_client = ReplayChatCompletionClient(["first_agent"])
+    team = SelectorGroupChat(
+        participants=[
+            _HandOffAgent("first_agent", description="first agent", next_agent="second_agent"),
+            _HandOffAgent("second_agent", description="second agent", next_agent="third_agent"),
+            _EchoAgent("third_agent", description="third agent"),
+        ],
+        model_client=model_client,
+        termination_condition=MaxMessageTermination(4),
+        fast_path_selection=True,
+    )
+    result = await team.run(task="Hello.")
+    assert [message.source for message in result.messages] == ["user", "first_agent", "second_agent", "third_agent"]
+    assert team.selection_metrics.selections["handoff"] == 2
+    assert team.selection_metrics.hit_rates["handoff"] == pytest.approx(2 / 3)
+
+
 @pytest.mark.asyncio
 async def test_selector_group_chat_with_model_context(runtime: AgentRuntime | None) -> None:
     buffered_context = BufferedChatCompletionContext(buffer_size=5)
@@ -1082,6 +1426,29 @@ def _select_agent(messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> str |
     )
 
 
+@pytest.mark.asyncio
+async def test_selector_group_chat_custom_selector_keeps_previous_speaker(runtime: AgentRuntime | None) -> None:
+    model_client = ReplayChatCompletionClient(["agent1"])
+    agent1 = _EchoAgent("agent1", description="echo agent 1")
+    agent2 = _EchoAgent("agent2", description="echo agent 2")
+
+    def _select_agent(messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> str | None:
+        return "agent1" if len(messages) == 1 else None
+
+    # A speaker picked by the selector function is not the previous speaker of the model-based selection,
+    # so it is not excluded when repeated speakers are not allowed.
+    team = SelectorGroupChat(
+        participants=[agent1, agent2],
+        model_client=model_client,
+        selector_func=_select_agent,
+        allow_repeated_speaker=False,
+        termination_condition=MaxMessageTermination(3),
+        runtime=runtime,
+    )
+    result = await team.run(task="task")
+    assert [message.source for message in result.messages] == ["user", "agent1", "agent1"]
+
+
 @pytest.mark.asyncio
 async def test_selector_group_chat_custom_candidate_func(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(["agent3"])
@@ -11,7 +11,7 @@
     MessageFilterConfig,
     PerSourceFilter,
 )
-from autogen_agentchat.base import Response, TaskResult
+from autogen_agentchat.base import ChatAgent, Response, TaskResult
 from autogen_agentchat.conditions import MaxMessageTermination, SourceMatchTermination
 from autogen_agentchat.messages import BaseChatMessage, ChatMessage, MessageFactory, StopMessage, TextMessage
 from autogen_agentchat.teams import (
@@ -657,6 +657,35 @@ async def test_digraph_group_chat_conditional_branch(runtime: AgentRuntime | Non
     assert result_with_lambda.messages[2].source == "C"
 
 
+@pytest.mark.asyncio
+async def test_digraph_group_chat_compiled_plan_shared() -> None:
+    # A node with many string conditions, which are matched with a single automaton.
+    keywords = [f"topic{i}" for i in range(10)]
+    graph = DiGraph(
+        nodes={
+            "A": DiGraphNode(
+                name="A", edges=[DiGraphEdge(target=f"N{i}", condition=k) for i, k in enumerate(keywords)]
+            ),
+            **{f"N{i}": DiGraphNode(name=f"N{i}", edges=[], activation="any") for i in range(len(keywords))},
+        }
+    )
+    participants: List[ChatAgent] = [_EchoAgent("A", description="Echo agent A")] + [
+        _EchoAgent(f"N{i}", description=f"Echo agent N{i}") for i in range(len(keywords))
+    ]
+
+    team = GraphFlow(participants=participants, graph=graph)
+    result = await team.run(task="Discuss topic3 and topic7.")
+    assert sorted(message.source for message in result.messages[2:4]) == ["N3", "N7"]
+    plan = graph._plan  # pyright: ignore[reportPrivateUsage]
+    assert plan is not None
+
+    # Another team built from the same graph reuses the compiled plan.
+    team_2 = GraphFlow(participants=participants, graph=graph)
+    result = await team_2.run(task="Discuss topic1.")
+    assert [message.source for message in result.messages[1:3]] == ["A", "N1"]
+    assert graph._plan is plan  # pyright: ignore[reportPrivateUsage]
+
+
 @pytest.mark.asyncio
 async def test_digraph_group_chat_loop_with_exit_condition(runtime: AgentRuntime | None) -> None:
     # Agents A and C: Echo Agents
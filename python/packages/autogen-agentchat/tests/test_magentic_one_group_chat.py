@@ -138,6 +138,13 @@ async def test_magentic_one_group_chat_basic(runtime: AgentRuntime | None) -> No
     assert result.messages[4].to_text() == "print('Hello, world!')"
     assert result.stop_reason is not None and result.stop_reason == "Because"
 
+    # Consecutive orchestrator calls extend the same context, which starts with the task ledger.
+    calls = [call["messages"] for call in model_client.create_calls[2:]]
+    assert "agent_1: echo agent 1" in calls[0][0].content
+    for previous, current in zip(calls, calls[1:], strict=False):
+        assert list(current[: len(previous) - 1]) == list(previous[:-1])
+        assert len(current) >= len(previous)
+
     # Test save and load.
     state = await team.save_state()
     team2 = MagenticOneGroupChat(
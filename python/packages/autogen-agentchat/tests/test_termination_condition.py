@@ -277,6 +277,68 @@ async def test_or_termination() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_composite_termination_skips_irrelevant_conditions() -> None:
+    class _CountingTextMessage(TextMessage):
+        num_renders: int = 0
+
+        def to_text(self) -> str:
+            self.num_renders += 1
+            return super().to_text()
+
+    called: list[str] = []
+
+    class _RecordingStopMessageTermination(StopMessageTermination):
+        async def __call__(self, messages: Sequence[BaseAgentEvent | BaseChatMessage]) -> StopMessage | None:
+            called.append("stop")
+            return await super().__call__(messages)
+
+    external = ExternalTermination()
+    termination = (
+        _RecordingStopMessageTermination()
+        | external
+        | (TextMentionTermination("foo") | TextMentionTermination("bar"))
+        | TextMentionTermination("baz")
+    )
+    assert termination.message_types is None
+
+    # The stop message condition is not evaluated without a stop message, and the
+    # text of each message is rendered once for all the text mention conditions.
+    message = _CountingTextMessage(content="Hello bar", source="user")
+    result = await termination([message])
+    assert result is not None
+    assert result.content == "Text 'bar' mentioned"
+    assert called == []
+    assert message.num_renders == 1
+
+    await termination.reset()
+    assert await termination([StopMessage(content="stop", source="user")]) is not None
+    assert called == ["stop"]
+
+    # An external termination is evaluated once it is set.
+    await termination.reset()
+    assert not external.pending
+    external.set()
+    assert external.pending
+    result = await termination([HandoffMessage(target="target", source="user", content="")])
+    assert result is not None
+    assert result.source == "ExternalTermination"
+
+    # A skipped condition does not satisfy an AND condition.
+    termination = StopMessageTermination() & TextMentionTermination("stop")
+    assert await termination([TextMessage(content="stop", source="user")]) is None
+    assert await termination([StopMessage(content="", source="user")]) is not None
+
+    # A timeout is evaluated once it elapsed.
+    timeout = TimeoutTermination(0.05)
+    termination = StopMessageTermination() | timeout
+    assert termination.message_types == (StopMessage,)
+    assert await termination([TextMessage(content="Hello", source="user")]) is None
+    await asyncio.sleep(0.1)
+    assert timeout.pending
+    assert await termination([TextMessage(content="Hello", source="user")]) is not None
+
+
 @pytest.mark.asyncio
 async def test_timeout_termination() -> None:
     termination = TimeoutTermination(0.1)  # 100ms timeout
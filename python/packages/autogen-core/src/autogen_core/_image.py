@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import re
+import weakref
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, cast
+from typing import Any, ClassVar, Dict, cast
 
 from PIL import Image as PILImage
 from pydantic import GetCoreSchemaHandler, ValidationInfo
@@ -15,6 +17,14 @@
 class Image:
     """Represents an image.
 
+    An image is immutable: its base64 encoding is computed once and reused
+    every time the image is serialized, e.g., when a message with the image is published
+    to many recipients, sent to a model or saved in the state of many agents. Images
+    decoded from the same base64 data while a previous one is alive are the same object,
+    so a payload received or loaded many times is held in memory once. For this reason
+    :attr:`image` is read-only and must not be modified in place; to edit an image,
+    create a new one from a copy, e.g., ``Image.from_pil(image.image.copy())``.
+
 
     Example:
 
@@ -39,8 +49,18 @@ async def from_url(url: str) -> Image:
 
     """
 
+    # Decoded images by the digest of their base64 data.
+    _decoded: ClassVar[weakref.WeakValueDictionary[str, Image]] = weakref.WeakValueDictionary()
+
     def __init__(self, image: PILImage.Image):
-        self.image: PILImage.Image = image.convert("RGB")
+        self._image: PILImage.Image = image.convert("RGB")
+        self._base64: str | None = None
+
+    @property
+    def image(self) -> PILImage.Image:
+        """The PIL image. It may be shared by the images decoded from the same data and its
+        encoding is cached, so it must not be modified in place."""
+        return self._image
 
     @classmethod
     def from_pil(cls, pil_image: PILImage.Image) -> Image:
@@ -57,13 +77,20 @@ def from_uri(cls, uri: str) -> Image:
 
     @classmethod
     def from_base64(cls, base64_str: str) -> Image:
-        return cls(PILImage.open(BytesIO(base64.b64decode(base64_str))))
+        digest = hashlib.sha256(base64_str.encode("utf-8")).hexdigest()
+        image = cls._decoded.get(digest)
+        if image is None or type(image) is not cls:
+            image = cls(PILImage.open(BytesIO(base64.b64decode(base64_str))))
+            cls._decoded[digest] = image
+        return image
 
     def to_base64(self) -> str:
-        buffered = BytesIO()
-        self.image.save(buffered, format="PNG")
-        content = buffered.getvalue()
-        return base64.b64encode(content).decode("utf-8")
+        if self._base64 is None:
+            buffered = BytesIO()
+            self._image.save(buffered, format="PNG")
+            content = buffered.getvalue()
+            self._base64 = base64.b64encode(content).decode("utf-8")
+        return self._base64
 
     @classmethod
     def from_file(cls, file_path: Path) -> Image:
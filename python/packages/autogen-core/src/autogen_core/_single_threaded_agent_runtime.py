@@ -938,6 +938,21 @@ def agent_factory() -> Agent:
         self._instantiated_agents[agent_id] = agent_instance
         return agent_id
 
+    async def remove_agent_instance(self, agent_id: AgentId) -> None:
+        """Close an instantiated agent and remove it from the runtime.
+
+        The agent's factory and subscriptions are kept, so a new instance is created
+        by the factory if a message is sent to the agent again. This releases the memory
+        held by agents that are no longer needed, e.g., agents keyed by a finished session.
+
+        Args:
+            agent_id (AgentId): The ID of the agent to remove. If the agent has not been
+                instantiated, this is a no-op.
+        """
+        agent = self._instantiated_agents.pop(agent_id, None)
+        if agent is not None:
+            await agent.close()
+
     async def _invoke_agent_factory(
         self,
         agent_factory: Callable[[], T | Awaitable[T]] | Callable[[AgentRuntime, AgentId], T | Awaitable[T]],
@@ -1,18 +1,22 @@
-from ._base import BaseTool, BaseToolWithState, ParametersSchema, Tool, ToolSchema
+from ._base import BaseStreamTool, BaseTool, BaseToolWithState, ParametersSchema, StreamTool, Tool, ToolSchema
 from ._function_tool import FunctionTool
-from ._static_workbench import StaticWorkbench
-from ._workbench import ImageResultContent, TextResultContent, ToolResult, Workbench
+from ._static_workbench import StaticStreamWorkbench, StaticWorkbench
+from ._workbench import ImageResultContent, StreamWorkbench, TextResultContent, ToolResult, Workbench
 
 __all__ = [
     "Tool",
+    "StreamTool",
     "ToolSchema",
     "ParametersSchema",
     "BaseTool",
     "BaseToolWithState",
+    "BaseStreamTool",
     "FunctionTool",
     "Workbench",
+    "StreamWorkbench",
     "ToolResult",
     "TextResultContent",
     "ImageResultContent",
     "StaticWorkbench",
+    "StaticStreamWorkbench",
 ]
@@ -2,7 +2,7 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, Dict, Generic, Mapping, Protocol, Type, TypeVar, cast, runtime_checkable
+from typing import Any, AsyncGenerator, Dict, Generic, Mapping, Protocol, Type, TypeVar, cast, runtime_checkable
 
 import jsonref
 from pydantic import BaseModel
@@ -61,9 +61,17 @@ async def save_state_json(self) -> Mapping[str, Any]: ...
     async def load_state_json(self, state: Mapping[str, Any]) -> None: ...
 
 
+@runtime_checkable
+class StreamTool(Tool, Protocol):
+    def run_json_stream(
+        self, args: Mapping[str, Any], cancellation_token: CancellationToken, call_id: str | None = None
+    ) -> AsyncGenerator[Any, None]: ...
+
+
 ArgsT = TypeVar("ArgsT", bound=BaseModel, contravariant=True)
 ReturnT = TypeVar("ReturnT", bound=BaseModel, covariant=True)
 StateT = TypeVar("StateT", bound=BaseModel)
+StreamT = TypeVar("StreamT", bound=BaseModel, covariant=True)
 
 
 class BaseTool(ABC, Tool, Generic[ArgsT, ReturnT], ComponentBase[BaseModel]):
@@ -83,9 +91,22 @@ def __init__(
         self._name = name
         self._description = description
         self._strict = strict
+        self._schema: ToolSchema | None = None
 
     @property
     def schema(self) -> ToolSchema:
+        """The schema of the tool.
+
+        The schema is built from the arguments type on first access and then
+        cached on the tool instance, so repeated reads (e.g., on every agent turn)
+        do not regenerate the JSON schema. The returned dictionary is shared
+        and must not be mutated.
+        """
+        if self._schema is None:
+            self._schema = self._build_schema()
+        return self._schema
+
+    def _build_schema(self) -> ToolSchema:
         model_schema: Dict[str, Any] = self._args_type.model_json_schema()
 
         if "$defs" in model_schema:
@@ -187,6 +208,64 @@ async def load_state_json(self, state: Mapping[str, Any]) -> None:
         pass
 
 
+class BaseStreamTool(
+    BaseTool[ArgsT, ReturnT], StreamTool, ABC, Generic[ArgsT, StreamT, ReturnT], ComponentBase[BaseModel]
+):
+    """A tool that produces partial results while it runs.
+
+    Subclasses implement :meth:`run_stream`, which yields zero or more partial
+    results followed by the final return value as the last item. The default
+    :meth:`run` consumes the stream and returns the final value, so a stream tool
+    can be used anywhere a regular tool is expected.
+    """
+
+    component_type = "tool"
+
+    @abstractmethod
+    def run_stream(self, args: ArgsT, cancellation_token: CancellationToken) -> AsyncGenerator[StreamT | ReturnT, None]:
+        """Run the tool and yield partial results. The last item yielded must be the final return value."""
+        ...
+
+    async def run(self, args: ArgsT, cancellation_token: CancellationToken) -> ReturnT:
+        return_value: StreamT | ReturnT | None = None
+        async for item in self.run_stream(args, cancellation_token):
+            return_value = item
+        if return_value is None:
+            raise RuntimeError(f"Tool {self.name} did not produce a final result.")
+        return cast(ReturnT, return_value)
+
+    async def run_json_stream(
+        self, args: Mapping[str, Any], cancellation_token: CancellationToken, call_id: str | None = None
+    ) -> AsyncGenerator[Any, None]:
+        """Run the tool with the provided arguments in a dictionary and yield its partial results.
+
+        Args:
+            args (Mapping[str, Any]): The arguments to pass to the tool.
+            cancellation_token (CancellationToken): A token to cancel the operation if needed.
+            call_id (str | None): An optional identifier for the tool call, used for tracing.
+
+        Yields:
+            Any: The partial results of the tool, followed by the final return value.
+        """
+        return_value: Any = None
+        with trace_tool_span(
+            tool_name=self._name,
+            tool_description=self._description,
+            tool_call_id=call_id,
+        ):
+            async for item in self.run_stream(self._args_type.model_validate(args), cancellation_token):
+                return_value = item
+                yield item
+
+        # Log the tool call event
+        event = ToolCallEvent(
+            tool_name=self.name,
+            arguments=dict(args),  # Using the raw args passed to run_json_stream
+            result=self.return_value_as_string(return_value),
+        )
+        logger.info(event)
+
+
 class BaseToolWithState(BaseTool[ArgsT, ReturnT], ABC, Generic[ArgsT, ReturnT, StateT], ComponentBase[BaseModel]):
     def __init__(
         self,
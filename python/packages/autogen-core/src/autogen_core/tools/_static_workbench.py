@@ -1,14 +1,15 @@
 import asyncio
 import builtins
-from typing import Any, Dict, List, Literal, Mapping
+import inspect
+from typing import Any, AsyncGenerator, Dict, List, Literal, Mapping
 
 from pydantic import BaseModel
 from typing_extensions import Self
 
 from .._cancellation_token import CancellationToken
 from .._component_config import Component, ComponentModel
-from ._base import BaseTool, ToolSchema
-from ._workbench import TextResultContent, ToolResult, Workbench
+from ._base import BaseTool, StreamTool, ToolSchema
+from ._workbench import StreamWorkbench, TextResultContent, ToolResult, Workbench
 
 
 class StaticWorkbenchConfig(BaseModel):
@@ -72,7 +73,11 @@ async def start(self) -> None:
         return None
 
     async def stop(self) -> None:
-        return None
+        # Release the resources of the tools that hold some, e.g., the pooled connections of HTTP tools.
+        for tool in self._tools:
+            close = getattr(tool, "close", None)
+            if close is not None and inspect.iscoroutinefunction(close):
+                await close()
 
     async def reset(self) -> None:
         return None
@@ -108,3 +113,52 @@ def _format_errors(self, error: Exception) -> str:
         else:
             error_message += f"{str(error)}\n"
         return error_message.strip()
+
+
+class StaticStreamWorkbench(StaticWorkbench, StreamWorkbench, Component[StaticWorkbenchConfig]):
+    """
+    A workbench that provides a static set of tools that do not change after
+    each tool execution, and supports streaming results from tools that
+    implement :class:`~autogen_core.tools.StreamTool`.
+
+    Tools that do not support streaming produce a single final result.
+
+    Args:
+        tools (List[BaseTool[Any, Any]]): A list of tools to be included in the workbench.
+            The tools should be subclasses of :class:`~autogen_core.tools.BaseTool`.
+    """
+
+    component_provider_override = "autogen_core.tools.StaticStreamWorkbench"
+
+    async def call_tool_stream(
+        self,
+        name: str,
+        arguments: Mapping[str, Any] | None = None,
+        cancellation_token: CancellationToken | None = None,
+        call_id: str | None = None,
+    ) -> AsyncGenerator[Any | ToolResult, None]:
+        tool = next((tool for tool in self._tools if tool.name == name), None)
+        if tool is None or not isinstance(tool, StreamTool):
+            yield await self.call_tool(name, arguments, cancellation_token, call_id=call_id)
+            return
+        if not cancellation_token:
+            cancellation_token = CancellationToken()
+        if not arguments:
+            arguments = {}
+        try:
+            # The last item of the stream is the final result, so hold each item back until the next one arrives.
+            previous_result: Any = None
+            has_result = False
+            async for result in tool.run_json_stream(arguments, cancellation_token, call_id=call_id):
+                if has_result:
+                    yield previous_result
+                previous_result = result
+                has_result = True
+            if not has_result:
+                raise RuntimeError(f"Tool {name} did not produce a final result.")
+            is_error = False
+            result_str = tool.return_value_as_string(previous_result)
+        except Exception as e:
+            result_str = self._format_errors(e)
+            is_error = True
+        yield ToolResult(name=tool.name, result=[TextResultContent(content=result_str)], is_error=is_error)
@@ -172,6 +172,35 @@ async def test_register_receives_publish(tracer_provider: TracerProvider) -> Non
     await runtime.close()
 
 
+@pytest.mark.asyncio
+async def test_remove_agent_instance() -> None:
+    runtime = SingleThreadedAgentRuntime()
+
+    runtime.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await runtime.register_factory(
+        type=AgentType("name"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await runtime.add_subscription(TypeSubscription("default", "name"))
+
+    runtime.start()
+    await runtime.publish_message(MessageType(), topic_id=TopicId("default", "session"))
+    await runtime.stop_when_idle()
+    agent = await runtime.try_get_underlying_agent_instance(AgentId("name", "session"), type=LoopbackAgent)
+    assert agent.num_calls == 1
+
+    # The removed agent is recreated by its factory on the next message.
+    await runtime.remove_agent_instance(AgentId("name", "session"))
+    await runtime.remove_agent_instance(AgentId("name", "never_instantiated"))
+    runtime.start()
+    await runtime.publish_message(MessageType(), topic_id=TopicId("default", "session"))
+    await runtime.stop_when_idle()
+    new_agent = await runtime.try_get_underlying_agent_instance(AgentId("name", "session"), type=LoopbackAgent)
+    assert new_agent is not agent
+    assert new_agent.num_calls == 1
+
+    await runtime.close()
+
+
 @pytest.mark.asyncio
 async def test_register_receives_publish_with_construction(caplog: pytest.LogCaptureFixture) -> None:
     runtime = SingleThreadedAgentRuntime()
@@ -188,6 +188,24 @@ class PydanticImageMessage(BaseModel):
     assert deserialized.image.image == image.image
 
 
+def test_image_payload_reuse() -> None:
+    image = Image(PILImage.new("RGB", (100, 100)))
+
+    # The encoding is computed once.
+    data = image.to_base64()
+    assert image.to_base64() is data
+
+    # Decoding the same payload again returns the image that is alive.
+    decoded = Image.from_base64(data)
+    assert Image.from_base64(data) is decoded
+    assert decoded.image == image.image
+    assert decoded.to_base64() == data
+
+    # The shared image cannot be replaced, which would make the cached encoding stale.
+    with pytest.raises(AttributeError):
+        decoded.image = PILImage.new("RGB", (10, 10))  # type: ignore[misc]
+
+
 def test_type_name_for_protos() -> None:
     type_name = SerializationRegistry().type_name(ProtoMessage())
     assert type_name == "agents.ProtoMessage"
@@ -70,6 +70,13 @@ def test_tool_schema_generation() -> None:
     assert len(schema["parameters"]["properties"]) == 1
 
 
+def test_tool_schema_is_cached() -> None:
+    tool = MyTool()
+
+    assert tool.schema is tool.schema
+    assert MyTool().schema == tool.schema
+
+
 def test_func_tool_schema_generation() -> None:
     def my_function(arg: str, other: Annotated[int, "int arg"], nonrequired: int = 5) -> MyResult:
         return MyResult(result="test")
@@ -1,8 +1,17 @@
-from typing import Annotated
+from typing import Annotated, Any, AsyncGenerator, List
 
 import pytest
+from autogen_core import CancellationToken
 from autogen_core.code_executor import ImportFromModule
-from autogen_core.tools import FunctionTool, StaticWorkbench, Workbench
+from autogen_core.tools import (
+    BaseStreamTool,
+    FunctionTool,
+    StaticStreamWorkbench,
+    StaticWorkbench,
+    ToolResult,
+    Workbench,
+)
+from pydantic import BaseModel
 
 
 @pytest.mark.asyncio
@@ -121,3 +130,75 @@ def test_tool_func_2(x: Annotated[int, "The number to add 2."]) -> int:
         assert result_2.result[0].content == "This is a test error"
         assert result_2.to_text() == "This is a test error"
         assert result_2.is_error is True
+
+
+class StreamArgs(BaseModel):
+    count: int
+
+
+class StreamProgress(BaseModel):
+    step: int
+
+
+class StreamResult(BaseModel):
+    total: int
+
+
+class CountingStreamTool(BaseStreamTool[StreamArgs, StreamProgress, StreamResult]):
+    def __init__(self) -> None:
+        super().__init__(
+            args_type=StreamArgs,
+            return_type=StreamResult,
+            name="counting_tool",
+            description="Counts up to a number, reporting each step.",
+        )
+
+    async def run_stream(
+        self, args: StreamArgs, cancellation_token: CancellationToken
+    ) -> AsyncGenerator[StreamProgress | StreamResult, None]:
+        for i in range(args.count):
+            yield StreamProgress(step=i)
+        yield StreamResult(total=args.count)
+
+
+@pytest.mark.asyncio
+async def test_static_stream_workbench() -> None:
+    def test_tool_func(x: Annotated[int, "The number to double."]) -> int:
+        return x * 2
+
+    test_tool = FunctionTool(
+        test_tool_func,
+        name="test_tool",
+        description="A test tool that doubles a number.",
+        global_imports=[ImportFromModule(module="typing_extensions", imports=["Annotated"])],
+    )
+    stream_tool = CountingStreamTool()
+
+    async with StaticStreamWorkbench(tools=[test_tool, stream_tool]) as workbench:
+        # A stream tool yields its partial results followed by the final result.
+        items: List[Any] = []
+        async for item in workbench.call_tool_stream("counting_tool", {"count": 3}):
+            items.append(item)
+        assert items[:3] == [StreamProgress(step=0), StreamProgress(step=1), StreamProgress(step=2)]
+        assert isinstance(items[-1], ToolResult)
+        assert items[-1].to_text() == '{"total": 3}'
+        assert items[-1].is_error is False
+
+        # A regular tool yields a single final result.
+        items = [item async for item in workbench.call_tool_stream("test_tool", {"x": 5})]
+        assert len(items) == 1
+        assert isinstance(items[0], ToolResult)
+        assert items[0].to_text() == "10"
+
+        # Calling a stream tool without streaming returns the final result.
+        result = await workbench.call_tool("counting_tool", {"count": 2})
+        assert result.to_text() == '{"total": 2}'
+
+        # Unknown tools yield an error result.
+        items = [item async for item in workbench.call_tool_stream("unknown_tool")]
+        assert len(items) == 1
+        assert items[0].is_error is True
+
+    # The stream workbench round-trips through its config.
+    config = StaticStreamWorkbench(tools=[test_tool]).dump_component()
+    assert isinstance(Workbench.load_component(config), StaticStreamWorkbench)
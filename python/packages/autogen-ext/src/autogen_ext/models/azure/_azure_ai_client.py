@@ -76,21 +76,22 @@ def convert_tools(tools: Sequence[Tool | ToolSchema]) -> List[ChatCompletionsToo
     result: List[ChatCompletionsToolDefinition] = []
     for tool in tools:
         if isinstance(tool, Tool):
-            tool_schema = tool.schema.copy()
+            tool_schema = tool.schema
         else:
             assert isinstance(tool, dict)
-            tool_schema = tool.copy()
-
-        if "parameters" in tool_schema:
-            for value in tool_schema["parameters"]["properties"].values():
-                if "title" in value.keys():
-                    del value["title"]
+            tool_schema = tool
 
         function_def: Dict[str, Any] = dict(name=tool_schema["name"])
         if "description" in tool_schema:
             function_def["description"] = tool_schema["description"]
         if "parameters" in tool_schema:
-            function_def["parameters"] = tool_schema["parameters"]
+            # Build new property dicts without titles rather than mutating the (possibly cached) tool schema.
+            parameters = dict(tool_schema["parameters"])
+            parameters["properties"] = {
+                key: {k: v for k, v in value.items() if k != "title"}
+                for key, value in tool_schema["parameters"]["properties"].items()
+            }
+            function_def["parameters"] = parameters
 
         result.append(
             ChatCompletionsToolDefinition(
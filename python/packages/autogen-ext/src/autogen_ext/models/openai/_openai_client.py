@@ -6,6 +6,7 @@
 import os
 import re
 import warnings
+import weakref
 from asyncio import Task
 from dataclasses import dataclass
 from importlib.metadata import PackageNotFoundError, version
@@ -49,7 +50,7 @@
     UserMessage,
     validate_model_info,
 )
-from autogen_core.tools import Tool, ToolSchema
+from autogen_core.tools import BaseTool, Tool, ToolSchema
 from openai import NOT_GIVEN, AsyncAzureOpenAI, AsyncOpenAI
 from openai.types.chat import (
     ChatCompletion,
@@ -235,36 +236,105 @@ def _add_usage(usage1: RequestUsage, usage2: RequestUsage) -> RequestUsage:
     )
 
 
+@dataclass
+class _ToolCacheEntry:
+    """Per-tool cache of the OpenAI tool param and its token counts, keyed on the schema it was built from."""
+
+    schema: ToolSchema
+    tool_param: ChatCompletionToolParam
+    token_counts: Dict[str, int]
+
+
+# Shared across all clients. Entries are dropped when the tool is garbage collected.
+_tool_cache: "weakref.WeakKeyDictionary[Tool, _ToolCacheEntry]" = weakref.WeakKeyDictionary()
+
+
+def _convert_tool_schema(tool_schema: ToolSchema) -> ChatCompletionToolParam:
+    tool_param = ChatCompletionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name=tool_schema["name"],
+            description=(tool_schema["description"] if "description" in tool_schema else ""),
+            parameters=(cast(FunctionParameters, tool_schema["parameters"]) if "parameters" in tool_schema else {}),
+            strict=(tool_schema["strict"] if "strict" in tool_schema else False),
+        ),
+    )
+    # Check if the tool has a valid name.
+    assert_valid_name(tool_param["function"]["name"])
+    return tool_param
+
+
+def _get_tool_cache_entry(tool: Tool) -> _ToolCacheEntry:
+    tool_schema = tool.schema
+    entry = _tool_cache.get(tool)
+    # Tools that rebuild their schema on each access get a fresh entry, so a changed schema is never served stale.
+    if entry is None or entry.schema is not tool_schema:
+        entry = _ToolCacheEntry(schema=tool_schema, tool_param=_convert_tool_schema(tool_schema), token_counts={})
+        _tool_cache[tool] = entry
+    return entry
+
+
 def convert_tools(
     tools: Sequence[Tool | ToolSchema],
 ) -> List[ChatCompletionToolParam]:
     result: List[ChatCompletionToolParam] = []
     for tool in tools:
-        if isinstance(tool, Tool):
-            tool_schema = tool.schema
+        if isinstance(tool, BaseTool):
+            # BaseTool caches its schema, so the converted form can be reused across turns and clients.
+            result.append(_get_tool_cache_entry(tool).tool_param)
+        elif isinstance(tool, Tool):
+            result.append(_convert_tool_schema(tool.schema))
         else:
             assert isinstance(tool, dict)
-            tool_schema = tool
-
-        result.append(
-            ChatCompletionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name=tool_schema["name"],
-                    description=(tool_schema["description"] if "description" in tool_schema else ""),
-                    parameters=(
-                        cast(FunctionParameters, tool_schema["parameters"]) if "parameters" in tool_schema else {}
-                    ),
-                    strict=(tool_schema["strict"] if "strict" in tool_schema else False),
-                ),
-            )
-        )
-    # Check if all tools have valid names.
-    for tool_param in result:
-        assert_valid_name(tool_param["function"]["name"])
+            result.append(_convert_tool_schema(tool))
     return result
 
 
+def _count_tool_param_tokens(tool_param: ChatCompletionToolParam, encoding: tiktoken.Encoding) -> int:
+    function = tool_param["function"]
+    tool_tokens = len(encoding.encode(function["name"]))
+    if "description" in function:
+        tool_tokens += len(encoding.encode(function["description"]))
+    tool_tokens -= 2
+    if "parameters" in function:
+        parameters = function["parameters"]
+        if "properties" in parameters:
+            assert isinstance(parameters["properties"], dict)
+            for propertiesKey in parameters["properties"]:  # pyright: ignore
+                assert isinstance(propertiesKey, str)
+                tool_tokens += len(encoding.encode(propertiesKey))
+                v = parameters["properties"][propertiesKey]  # pyright: ignore
+                for field in v:  # pyright: ignore
+                    if field == "type":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
+                    elif field == "description":
+                        tool_tokens += 2
+                        tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
+                    elif field == "enum":
+                        tool_tokens -= 3
+                        for o in v["enum"]:  # pyright: ignore
+                            tool_tokens += 3
+                            tool_tokens += len(encoding.encode(o))  # pyright: ignore
+                    else:
+                        trace_logger.warning(f"Not supported field {field}")
+            tool_tokens += 11
+            if len(parameters["properties"]) == 0:  # pyright: ignore
+                tool_tokens -= 2
+    return tool_tokens
+
+
+def _count_tool_tokens(tool: Tool | ToolSchema, encoding: tiktoken.Encoding) -> int:
+    if not isinstance(tool, BaseTool):
+        return _count_tool_param_tokens(convert_tools([tool])[0], encoding)
+    entry = _get_tool_cache_entry(tool)
+    tool_tokens = entry.token_counts.get(encoding.name)
+    if tool_tokens is None:
+        tool_tokens = _count_tool_param_tokens(entry.tool_param, encoding)
+        entry.token_counts[encoding.name] = tool_tokens
+    return tool_tokens
+
+
 def normalize_name(name: str) -> str:
     """
     LLMs sometimes ask functions while ignoring their own format requirements, this function should be used to replace invalid characters with "_".
@@ -333,39 +403,8 @@ def count_tokens_openai(
     num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
 
     # Tool tokens.
-    oai_tools = convert_tools(tools)
-    for tool in oai_tools:
-        function = tool["function"]
-        tool_tokens = len(encoding.encode(function["name"]))
-        if "description" in function:
-            tool_tokens += len(encoding.encode(function["description"]))
-        tool_tokens -= 2
-        if "parameters" in function:
-            parameters = function["parameters"]
-            if "properties" in parameters:
-                assert isinstance(parameters["properties"], dict)
-                for propertiesKey in parameters["properties"]:  # pyright: ignore
-                    assert isinstance(propertiesKey, str)
-                    tool_tokens += len(encoding.encode(propertiesKey))
-                    v = parameters["properties"][propertiesKey]  # pyright: ignore
-                    for field in v:  # pyright: ignore
-                        if field == "type":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["type"]))  # pyright: ignore
-                        elif field == "description":
-                            tool_tokens += 2
-                            tool_tokens += len(encoding.encode(v["description"]))  # pyright: ignore
-                        elif field == "enum":
-                            tool_tokens -= 3
-                            for o in v["enum"]:  # pyright: ignore
-                                tool_tokens += 3
-                                tool_tokens += len(encoding.encode(o))  # pyright: ignore
-                        else:
-                            trace_logger.warning(f"Not supported field {field}")
-                tool_tokens += 11
-                if len(parameters["properties"]) == 0:  # pyright: ignore
-                    tool_tokens -= 2
-        num_tokens += tool_tokens
+    for tool in tools:
+        num_tokens += _count_tool_tokens(tool, encoding)
     num_tokens += 12
     return num_tokens
 
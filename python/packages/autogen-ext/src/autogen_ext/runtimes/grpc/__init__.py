@@ -1,6 +1,7 @@
-from ._worker_runtime import GrpcWorkerAgentRuntime
+from ._batching import MessageBatching
+from ._worker_runtime import GrpcWorkerAgentRuntime, PayloadDecodingStats
 from ._worker_runtime_host import GrpcWorkerAgentRuntimeHost
-from ._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
+from ._worker_runtime_host_servicer import ClientSendStats, GrpcWorkerAgentRuntimeHostServicer
 
 try:
     import grpc  # type: ignore
@@ -10,7 +11,10 @@
     ) from e
 
 __all__ = [
+    "ClientSendStats",
     "GrpcWorkerAgentRuntime",
     "GrpcWorkerAgentRuntimeHost",
     "GrpcWorkerAgentRuntimeHostServicer",
+    "MessageBatching",
+    "PayloadDecodingStats",
 ]
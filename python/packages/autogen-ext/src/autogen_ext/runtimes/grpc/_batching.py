@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import importlib.util
+import struct
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Literal, Sequence, Set, Tuple
+
+from . import _constants
+from .protos import agent_worker_pb2, cloudevent_pb2
+
+CAPABILITY_BATCH = "batch"
+
+_LENGTH = struct.Struct(">I")
+
+
+@dataclass(frozen=True)
+class MessageBatching:
+    """The batching of the messages sent on a data channel between a worker and a host.
+
+    The messages that are waiting to be sent are coalesced into a single batch message, up to
+    `max_batch_bytes`. If `window` is positive, the sender waits up to `window` seconds for more
+    messages before sending a batch, trading latency for fewer and larger frames. Batches whose
+    size is at least `compression_min_bytes` are compressed with `compression`.
+
+    Batching is negotiated on the channel: a batch is only sent to a peer that advertised it
+    can decode batches and the compression, so workers and hosts without batching keep receiving
+    plain messages. All peers that support batching can decode gzip, and zstd if the `zstandard`
+    package is installed.
+
+    Args:
+        window (float, optional): The seconds to wait for more messages before sending a batch. Defaults to 0.0.
+        max_batch_bytes (int, optional): The size of the messages of a batch, after which the batch is sent.
+            Defaults to 1 MiB.
+        compression (Literal["gzip", "zstd"] | None, optional): The compression of large batches. Defaults to None.
+        compression_min_bytes (int, optional): The size of the smallest batch that is compressed. Defaults to 4096.
+    """
+
+    window: float = 0.0
+    max_batch_bytes: int = 1024 * 1024
+    compression: Literal["gzip", "zstd"] | None = None
+    compression_min_bytes: int = 4096
+
+    def __post_init__(self) -> None:
+        if self.window < 0:
+            raise ValueError("The batching window must not be negative.")
+        if self.max_batch_bytes < 1:
+            raise ValueError("The maximum batch size must be at least 1 byte.")
+        if self.compression == "zstd" and not _zstd_available():
+            raise ImportError("zstd compression requires the zstandard package. Install it with: pip install zstandard")
+
+
+def _zstd_available() -> bool:
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def supported_capabilities() -> List[str]:
+    """The capabilities of the data channel advertised to the peer."""
+    capabilities = [CAPABILITY_BATCH, "gzip"]
+    if _zstd_available():
+        capabilities.append("zstd")
+    return capabilities
+
+
+def capabilities_metadata() -> Tuple[str, str]:
+    return (_constants.CAPABILITIES_METADATA_KEY, ",".join(supported_capabilities()))
+
+
+def parse_capabilities(metadata: Sequence[Tuple[str, Any]] | None) -> Set[str]:
+    """Parse the capabilities advertised by the peer in the metadata of the channel."""
+    for key, value in metadata or []:
+        if key == _constants.CAPABILITIES_METADATA_KEY:
+            return set(str(value).split(","))
+    return set()
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=1)
+    import zstandard  # type: ignore
+
+    compressed: bytes = zstandard.ZstdCompressor().compress(data)
+    return compressed
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        import zstandard  # type: ignore
+
+        decompressed: bytes = zstandard.ZstdDecompressor().decompress(data)
+        return decompressed
+    raise ValueError(f"Unsupported batch compression: {compression}")
+
+
+def encode_batch(
+    messages: Sequence[agent_worker_pb2.Message], batching: MessageBatching, peer_capabilities: Set[str]
+) -> agent_worker_pb2.Message:
+    """Encode messages into a batch message. A single message is returned as is, unless it is compressed."""
+    compression = batching.compression if batching.compression in peer_capabilities else None
+    if len(messages) == 1 and (compression is None or messages[0].ByteSize() < batching.compression_min_bytes):
+        return messages[0]
+    data = b"".join(_LENGTH.pack(message.ByteSize()) + message.SerializeToString() for message in messages)
+    attributes: Dict[str, cloudevent_pb2.CloudEvent.CloudEventAttributeValue] = {}
+    if compression is not None and len(data) >= batching.compression_min_bytes:
+        data = _compress(data, compression)
+        attributes[_constants.BATCH_COMPRESSION_ATTR] = cloudevent_pb2.CloudEvent.CloudEventAttributeValue(
+            ce_string=compression
+        )
+    return agent_worker_pb2.Message(
+        cloudEvent=cloudevent_pb2.CloudEvent(
+            id="",
+            source="",
+            spec_version="1.0",
+            type=_constants.MESSAGE_BATCH_EVENT_TYPE,
+            attributes=attributes,
+            binary_data=data,
+        )
+    )
+
+
+def decode_batch(message: agent_worker_pb2.Message) -> List[agent_worker_pb2.Message] | None:
+    """Decode the messages of a batch message. Returns None if the message is not a batch."""
+    if message.WhichOneof("message") != "cloudEvent" or message.cloudEvent.type != _constants.MESSAGE_BATCH_EVENT_TYPE:
+        return None
+    data = message.cloudEvent.binary_data
+    if _constants.BATCH_COMPRESSION_ATTR in message.cloudEvent.attributes:
+        data = _decompress(data, message.cloudEvent.attributes[_constants.BATCH_COMPRESSION_ATTR].ce_string)
+    messages: List[agent_worker_pb2.Message] = []
+    offset = 0
+    while offset < len(data):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        messages.append(agent_worker_pb2.Message.FromString(data[offset : offset + length]))
+        offset += length
+    return messages
+
+
+async def next_batch(
+    queue: asyncio.Queue[agent_worker_pb2.Message], batching: MessageBatching, peer_capabilities: Set[str]
+) -> agent_worker_pb2.Message:
+    """Wait for a message in the queue and encode it in a batch with the messages that follow it."""
+    messages = [await queue.get()]
+    size = messages[0].ByteSize()
+    waited = batching.window <= 0
+    while size < batching.max_batch_bytes:
+        if queue.empty():
+            if waited:
+                break
+            await asyncio.sleep(batching.window)
+            waited = True
+            continue
+        message = queue.get_nowait()
+        messages.append(message)
+        size += message.ByteSize()
+    return encode_batch(messages, batching, peer_capabilities)
+
+
+class BatchingQueueAsyncIterable(AsyncIterator[agent_worker_pb2.Message]):
+    """Iterate over the messages of a queue, in batches once the peer advertised it can decode them."""
+
+    def __init__(self, queue: asyncio.Queue[agent_worker_pb2.Message], batching: MessageBatching) -> None:
+        self._queue = queue
+        self._batching = batching
+        self.peer_capabilities: Set[str] = set()
+        self._consumer: asyncio.Task[Any] | None = None
+        self._closed = False
+
+    async def __anext__(self) -> agent_worker_pb2.Message:
+        if self._closed:
+            raise StopAsyncIteration
+        if self._consumer is None:
+            self._consumer = asyncio.current_task()
+        if CAPABILITY_BATCH not in self.peer_capabilities:
+            return await self._queue.get()
+        return await next_batch(self._queue, self._batching, self.peer_capabilities)
+
+    def __aiter__(self) -> AsyncIterator[agent_worker_pb2.Message]:
+        return self
+
+    def close(self) -> None:
+        """Stop the task that iterates, like :meth:`QueueAsyncIterable.close`."""
+        self._closed = True
+        if self._consumer is not None:
+            self._consumer.cancel()
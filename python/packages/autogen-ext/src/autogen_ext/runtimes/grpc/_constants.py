@@ -7,6 +7,29 @@
 AGENT_SENDER_TYPE_ATTR = "agagentsendertype"
 AGENT_SENDER_KEY_ATTR = "agagentsenderkey"
 MESSAGE_KIND_ATTR = "agmsgkind"
+RECIPIENTS_ATTR = "agrecipients"
+PEER_CLIENT_ID_PREFIX = "peer:"
+# Control messages that carry a part of a large state have the rpc id of the request followed by this suffix.
+STATE_CHUNK_RPC_ID_SUFFIX = "+chunk"
+STATE_CHUNK_SIZE = 1024 * 1024
+# The seconds a worker waits for the response to a state request sent to another worker.
+CONTROL_REQUEST_TIMEOUT = 60.0
+# The metadata of a data channel with the capabilities of each side, e.g., "batch,gzip".
+CAPABILITIES_METADATA_KEY = "agcapabilities"
+MESSAGE_BATCH_EVENT_TYPE = "agmessagebatch"
+BATCH_COMPRESSION_ATTR = "agbatchcompression"
+# The sequence number of a message sent by a worker, in the metadata or attributes of the message.
+SEQUENCE_NUMBER_KEY = "agseq"
+# The initial metadata of a data channel that tells the client whether the host resumed its session.
+SESSION_METADATA_KEY = "agsession"
+SESSION_RESUMED = "resumed"
+# The initial metadata of a data channel with the sequence number of the last message the host received from the client.
+LAST_SEQUENCE_NUMBER_KEY = "aglastseq"
+RECONNECT_INITIAL_BACKOFF = 0.1
+RECONNECT_MAX_BACKOFF = 10.0
+DETACHED_CLIENT_BUFFER_SIZE = 1024
+MAX_TRACKED_CLIENTS = 4096
+MAX_CACHED_TOPIC_ROUTES = 4096
 MESSAGE_KIND_VALUE_PUBLISH = "publish"
 MESSAGE_KIND_VALUE_RPC_REQUEST = "rpc_request"
 MESSAGE_KIND_VALUE_RPC_RESPONSE = "rpc_response"
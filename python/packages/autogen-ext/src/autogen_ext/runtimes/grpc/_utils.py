@@ -1,7 +1,10 @@
+import logging
+
 from autogen_core._subscription import Subscription
 from autogen_core._type_prefix_subscription import TypePrefixSubscription
 from autogen_core._type_subscription import TypeSubscription
 
+from . import _constants
 from .protos import agent_worker_pb2
 
 
@@ -43,3 +46,67 @@ def subscription_from_proto(subscription: agent_worker_pb2.Subscription) -> Subs
             )
         case None:
             raise ValueError("Invalid subscription message.")
+
+
+def trace_message(
+    logger: logging.Logger,
+    direction: str,
+    client_id: str,
+    message: agent_worker_pb2.Message | agent_worker_pb2.ControlMessage,
+) -> None:
+    """Log a message sent or received on a channel at DEBUG level.
+
+    Only the kind and the serialized size of the message are logged, as rendering
+    the payload is costly. The fields are also set as the `grpc_*` attributes of the record
+    for structured logging handlers."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    kind = message.WhichOneof("message") if isinstance(message, agent_worker_pb2.Message) else "control"
+    size = message.ByteSize()
+    logger.debug(
+        "%s %s message, client %s, %d bytes",
+        direction,
+        kind,
+        client_id,
+        size,
+        extra={"grpc_direction": direction, "grpc_kind": kind, "grpc_client_id": client_id, "grpc_size": size},
+    )
+
+
+def set_sequence_number(message: agent_worker_pb2.Message, sequence_number: int) -> None:
+    """Set the sequence number of a message sent by a worker, which the host uses to drop replayed messages."""
+    match message.WhichOneof("message"):
+        case "request":
+            message.request.metadata[_constants.SEQUENCE_NUMBER_KEY] = str(sequence_number)
+        case "response":
+            message.response.metadata[_constants.SEQUENCE_NUMBER_KEY] = str(sequence_number)
+        case "cloudEvent":
+            message.cloudEvent.attributes[_constants.SEQUENCE_NUMBER_KEY].ce_string = str(sequence_number)
+        case _:
+            pass
+
+
+def get_sequence_number(message: agent_worker_pb2.Message, remove: bool = False) -> int | None:
+    """Get the sequence number of a message, and optionally remove it before the message is forwarded.
+    Returns None if the message has no sequence number."""
+    match message.WhichOneof("message"):
+        case "request":
+            fields = message.request.metadata
+        case "response":
+            fields = message.response.metadata
+        case "cloudEvent":
+            attributes = message.cloudEvent.attributes
+            if _constants.SEQUENCE_NUMBER_KEY not in attributes:
+                return None
+            value = attributes[_constants.SEQUENCE_NUMBER_KEY].ce_string
+            if remove:
+                del attributes[_constants.SEQUENCE_NUMBER_KEY]
+            return int(value)
+        case _:
+            return None
+    if _constants.SEQUENCE_NUMBER_KEY not in fields:
+        return None
+    value = fields[_constants.SEQUENCE_NUMBER_KEY]
+    if remove:
+        del fields[_constants.SEQUENCE_NUMBER_KEY]
+    return int(value)
@@ -5,10 +5,12 @@
 import json
 import logging
 import signal
+import time
 import uuid
 import warnings
 from asyncio import Future, Task
-from collections import defaultdict
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,6 +20,7 @@
     Callable,
     ClassVar,
     DefaultDict,
+    Deque,
     Dict,
     List,
     Literal,
@@ -56,9 +59,21 @@
 from opentelemetry.trace import TracerProvider
 from typing_extensions import Self
 
-from autogen_ext.runtimes.grpc._utils import subscription_to_proto
+from autogen_ext.runtimes.grpc._utils import (
+    get_sequence_number,
+    set_sequence_number,
+    subscription_to_proto,
+    trace_message,
+)
 
 from . import _constants
+from ._batching import (
+    BatchingQueueAsyncIterable,
+    MessageBatching,
+    capabilities_metadata,
+    decode_batch,
+    parse_capabilities,
+)
 from ._constants import GRPC_IMPORT_ERROR_STR
 from ._type_helpers import ChannelArgumentType
 from .protos import agent_worker_pb2, agent_worker_pb2_grpc, cloudevent_pb2
@@ -84,10 +99,22 @@
 class QueueAsyncIterable(AsyncIterator[Any], AsyncIterable[Any]):
     def __init__(self, queue: asyncio.Queue[Any]) -> None:
         self._queue = queue
+        self._consumer: Task[Any] | None = None
+        self._closed = False
 
     async def __anext__(self) -> Any:
+        if self._closed:
+            raise StopAsyncIteration
+        if self._consumer is None:
+            self._consumer = asyncio.current_task()
         return await self._queue.get()
 
+    def close(self) -> None:
+        """Stop the task that iterates, e.g., the task of a stream call that ended, which waits for the queue."""
+        self._closed = True
+        if self._consumer is not None:
+            self._consumer.cancel()
+
     def __aiter__(self) -> AsyncIterator[Any]:
         return self
 
@@ -115,25 +142,60 @@ class HostConnection:
         )
     ]
 
-    def __init__(self, channel: grpc.aio.Channel, stub: Any) -> None:  # type: ignore
+    def __init__(  # type: ignore
+        self,
+        channel: grpc.aio.Channel,  # type: ignore
+        stub: Any,
+        batching: MessageBatching | None = None,
+        reconnect: bool = False,
+        replay_buffer_size: int = 0,
+    ) -> None:
         self._channel = channel
+        self._batching = batching
+        self._reconnect = reconnect
         self._send_queue = asyncio.Queue[agent_worker_pb2.Message]()
         self._recv_queue = asyncio.Queue[agent_worker_pb2.Message]()
+        self._control_send_queue = asyncio.Queue[agent_worker_pb2.ControlMessage]()
+        self._control_recv_queue = asyncio.Queue[agent_worker_pb2.ControlMessage]()
         self._connection_task: Task[None] | None = None
+        self._read_tasks: List[Task[None]] = []
         self._stub: AgentRpcAsyncStub = stub
         self._client_id = str(uuid.uuid4())
+        # The messages sent to the host are numbered, so that the host can drop the messages
+        # that are replayed after a reconnection but were already received.
+        self._sequence_number = 0
+        self._replay_buffer_size = replay_buffer_size
+        self._replay_buffer: Deque[agent_worker_pb2.Message] = deque()
+        # The sequence numbers of the requests in the replay buffer, so that the buffer is trimmed
+        # once the host responds to them, as the host received every message sent before them.
+        self._replay_request_sequence_numbers: Dict[str, int] = {}
+        self._host_capabilities: Set[str] = set()
+        self._closing = False
+        self.on_reconnect: Callable[[bool, Set[str]], Awaitable[None]] | None = None
+        """Called after a reconnection, with whether the host resumed the session of the client,
+        i.e., kept its registrations and the messages sent to it while it was disconnected,
+        and the ids of the requests that were replayed."""
 
     @property
     def stub(self) -> Any:
         return self._stub
 
+    @property
+    def client_id(self) -> str:
+        return self._client_id
+
     @property
     def metadata(self) -> Sequence[Tuple[str, str]]:
         return [("client-id", self._client_id)]
 
     @classmethod
     async def from_host_address(
-        cls, host_address: str, extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG
+        cls,
+        host_address: str,
+        extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG,
+        batching: MessageBatching | None = None,
+        reconnect: bool = False,
+        replay_buffer_size: int = 0,
     ) -> Self:
         logger.info("Connecting to %s", host_address)
         #  Always use DEFAULT_GRPC_CONFIG and override it with provided grpc_config
@@ -146,19 +208,112 @@ async def from_host_address(
             options=merged_options,
         )
         stub: AgentRpcAsyncStub = agent_worker_pb2_grpc.AgentRpcStub(channel)  # type: ignore
-        instance = cls(channel, stub)
+        instance = cls(channel, stub, batching, reconnect, replay_buffer_size)
 
-        instance._connection_task = await instance._connect(
-            stub, instance._send_queue, instance._recv_queue, instance._client_id
-        )
+        await instance._open_streams(instance._send_queue)
+        instance._connection_task = asyncio.create_task(instance._run())
 
         return instance
 
     async def close(self) -> None:
         if self._connection_task is None:
             raise RuntimeError("Connection is not open.")
+        self._closing = True
         await self._channel.close()
-        await self._connection_task
+        # Stop reconnecting, e.g., while the host is unreachable. Waiting does not raise the cancellation
+        # of the connection task, but still raises the cancellation of the caller.
+        self._connection_task.cancel()
+        await asyncio.wait([self._connection_task])
+        for task in self._read_tasks:
+            task.cancel()
+        if self._read_tasks:
+            await asyncio.wait(self._read_tasks)
+
+    async def _open_streams(self, send_queue: asyncio.Queue[agent_worker_pb2.Message]) -> Sequence[Tuple[str, str]]:
+        """Open the data and control streams. Returns the initial metadata of the data stream,
+        or an empty list if the host does not send initial metadata before its first message."""
+        data_stream, read_tasks = await self._connect(
+            self._stub, send_queue, self._recv_queue, self._client_id, self._batching, self._host_capabilities
+        )
+        try:
+            read_tasks.append(
+                await self._connect_control(
+                    self._stub, self._control_send_queue, self._control_recv_queue, self._client_id
+                )
+            )
+        except BaseException:
+            for task in read_tasks:
+                task.cancel()
+            data_stream.cancel()
+            raise
+        self._read_tasks = read_tasks
+        if not self._host_capabilities:
+            return []
+        return list(await data_stream.initial_metadata())  # type: ignore
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.wait(self._read_tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in self._read_tasks:
+                task.cancel()
+            results = await asyncio.gather(*self._read_tasks, return_exceptions=True)
+            if self._closing or not self._reconnect:
+                return
+            error = next((result for result in results if isinstance(result, Exception)), None)
+            if isinstance(error, grpc.aio.AioRpcError):
+                logger.warning(f"Connection to host lost: {error.details()}. Reconnecting.")
+            else:
+                logger.warning(f"Connection to host lost: {error}. Reconnecting.")
+            if not await self._reconnect_streams():
+                return
+
+    async def _reconnect_streams(self) -> bool:
+        """Reconnect to the host with exponential backoff. Returns False if the connection was closed first."""
+        backoff = _constants.RECONNECT_INITIAL_BACKOFF
+        while True:
+            await asyncio.sleep(backoff)
+            if self._closing:
+                return False
+            # The new stream sends from a new queue, which is filled once the host told which messages it received.
+            send_queue = asyncio.Queue[agent_worker_pb2.Message]()
+            control_send_queue = asyncio.Queue[agent_worker_pb2.ControlMessage]()
+            while not self._control_send_queue.empty():
+                control_send_queue.put_nowait(self._control_send_queue.get_nowait())
+            self._control_send_queue = control_send_queue
+            try:
+                metadata = await self._open_streams(send_queue)
+                break
+            except Exception as e:
+                if self._closing:
+                    return False
+                backoff = min(backoff * 2, _constants.RECONNECT_MAX_BACKOFF)
+                details = e.details() if isinstance(e, grpc.aio.AioRpcError) else e
+                logger.warning(f"Failed to reconnect to host, retrying in {backoff} seconds: {details}")
+        session = dict(metadata)
+        resumed = session.get(_constants.SESSION_METADATA_KEY) == _constants.SESSION_RESUMED
+        # Replay the messages the host did not receive, followed by the messages that were not sent yet.
+        # If the host does not know the last message it received from the client, e.g., after a restart,
+        # the messages that were sent are not replayed, as they may have been delivered.
+        pending: Dict[int, agent_worker_pb2.Message] = {}
+        if _constants.LAST_SEQUENCE_NUMBER_KEY in session:
+            last_sequence_number = int(session[_constants.LAST_SEQUENCE_NUMBER_KEY])
+            for message in self._replay_buffer:
+                sequence_number = cast(int, get_sequence_number(message))
+                if sequence_number > last_sequence_number:
+                    pending[sequence_number] = message
+        while not self._send_queue.empty():
+            message = self._send_queue.get_nowait()
+            pending[cast(int, get_sequence_number(message))] = message
+        for sequence_number in sorted(pending):
+            send_queue.put_nowait(pending[sequence_number])
+        self._send_queue = send_queue
+        logger.info(f"Reconnected to host, session resumed: {resumed}, replayed {len(pending)} messages.")
+        if self.on_reconnect is not None:
+            replayed_request_ids = {
+                message.request.request_id for message in pending.values() if message.HasField("request")
+            }
+            await self.on_reconnect(resumed, replayed_request_ids)
+        return True
 
     @staticmethod
     async def _connect(
@@ -166,38 +321,137 @@ async def _connect(
         send_queue: asyncio.Queue[agent_worker_pb2.Message],
         receive_queue: asyncio.Queue[agent_worker_pb2.Message],
         client_id: str,
-    ) -> Task[None]:
+        batching: MessageBatching | None = None,
+        host_capabilities: Set[str] | None = None,
+    ) -> Tuple[Any, List[Task[None]]]:
         from grpc.aio import StreamStreamCall
 
-        # TODO: where do exceptions from reading the iterable go? How do we recover from those?
+        # Messages are sent in batches once the host advertised it can decode them.
+        send_iterable = (
+            BatchingQueueAsyncIterable(send_queue, batching) if batching is not None else QueueAsyncIterable(send_queue)
+        )
         stream: StreamStreamCall[agent_worker_pb2.Message, agent_worker_pb2.Message] = stub.OpenChannel(  # type: ignore
-            QueueAsyncIterable(send_queue), metadata=[("client-id", client_id)]
+            send_iterable, metadata=[("client-id", client_id), capabilities_metadata()]
         )
 
-        await stream.wait_for_connection()
+        try:
+            await stream.wait_for_connection()
+        except BaseException:
+            # Cancel the call and stop consuming the send queue.
+            stream.cancel()
+            send_iterable.close()
+            raise
 
         async def read_loop() -> None:
-            while True:
-                logger.info("Waiting for message from host")
-                message = cast(agent_worker_pb2.Message, await stream.read())  # type: ignore
-                if message == grpc.aio.EOF:  # type: ignore
-                    logger.info("EOF")
-                    break
-                logger.info(f"Received a message from host: {message}")
-                await receive_queue.put(message)
-                logger.info("Put message in receive queue")
+            try:
+                # The host sends its capabilities in the initial metadata, before any message.
+                capabilities = parse_capabilities(await stream.initial_metadata())  # type: ignore
+                if host_capabilities is not None:
+                    host_capabilities.update(capabilities)
+                if isinstance(send_iterable, BatchingQueueAsyncIterable):
+                    send_iterable.peer_capabilities = capabilities
+                while True:
+                    message = cast(agent_worker_pb2.Message, await stream.read())  # type: ignore
+                    if message == grpc.aio.EOF:  # type: ignore
+                        logger.info("EOF")
+                        break
+                    trace_message(logger, "Received", client_id, message)
+                    for batched_message in decode_batch(message) or [message]:
+                        await receive_queue.put(batched_message)
+            finally:
+                # Stop consuming the send queue, which a new stream consumes after a reconnection.
+                stream.cancel()
+                send_iterable.close()
+
+        return stream, [asyncio.create_task(read_loop())]
+
+    @staticmethod
+    async def _connect_control(
+        stub: Any,  # AgentRpcAsyncStub
+        send_queue: asyncio.Queue[agent_worker_pb2.ControlMessage],
+        receive_queue: asyncio.Queue[agent_worker_pb2.ControlMessage],
+        client_id: str,
+    ) -> Task[None]:
+        from grpc.aio import StreamStreamCall
+
+        send_iterable = QueueAsyncIterable(send_queue)
+        stream: StreamStreamCall[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage] = (  # type: ignore
+            stub.OpenControlChannel(send_iterable, metadata=[("client-id", client_id)])
+        )
+
+        try:
+            await stream.wait_for_connection()
+        except BaseException:
+            stream.cancel()
+            send_iterable.close()
+            raise
+
+        async def read_loop() -> None:
+            try:
+                while True:
+                    message = cast(agent_worker_pb2.ControlMessage, await stream.read())  # type: ignore
+                    if message == grpc.aio.EOF:  # type: ignore
+                        break
+                    trace_message(logger, "Received", client_id, message)
+                    await receive_queue.put(message)
+            finally:
+                stream.cancel()
+                send_iterable.close()
 
         return asyncio.create_task(read_loop())
 
     async def send(self, message: agent_worker_pb2.Message) -> None:
-        logger.info(f"Send message to host: {message}")
+        self._sequence_number += 1
+        set_sequence_number(message, self._sequence_number)
+        if self._replay_buffer_size > 0:
+            if len(self._replay_buffer) >= self._replay_buffer_size:
+                self._forget_replay_message(self._replay_buffer.popleft())
+            self._replay_buffer.append(message)
+            if message.HasField("request"):
+                self._replay_request_sequence_numbers[message.request.request_id] = self._sequence_number
+        trace_message(logger, "Sending", self._client_id, message)
         await self._send_queue.put(message)
-        logger.info("Put message in send queue")
+
+    def acknowledge(self, request_id: str) -> None:
+        """Drop the messages up to the request from the replay buffer, as the host received them
+        if it forwarded a response to the request."""
+        sequence_number = self._replay_request_sequence_numbers.pop(request_id, None)
+        if sequence_number is None:
+            return
+        while self._replay_buffer and cast(int, get_sequence_number(self._replay_buffer[0])) <= sequence_number:
+            self._forget_replay_message(self._replay_buffer.popleft())
+
+    def _forget_replay_message(self, message: agent_worker_pb2.Message) -> None:
+        if message.HasField("request"):
+            self._replay_request_sequence_numbers.pop(message.request.request_id, None)
 
     async def recv(self) -> agent_worker_pb2.Message:
-        logger.info("Getting message from queue")
         return await self._recv_queue.get()
 
+    async def send_control(self, message: agent_worker_pb2.ControlMessage) -> None:
+        trace_message(logger, "Sending", self._client_id, message)
+        await self._control_send_queue.put(message)
+
+    async def recv_control(self) -> agent_worker_pb2.ControlMessage:
+        return await self._control_recv_queue.get()
+
+
+@dataclass(frozen=True)
+class PayloadDecodingStats:
+    """The deserialization of the payloads of the messages received by a worker.
+
+    Args:
+        decoded (int): The number of payloads deserialized.
+        offloaded (int): The number of payloads deserialized in a worker thread.
+        skipped (int): The number of event payloads not deserialized because the event had no recipient.
+        seconds (float): The seconds spent deserializing the payloads, including waiting for a worker thread.
+    """
+
+    decoded: int
+    offloaded: int
+    skipped: int
+    seconds: float
+
 
 # TODO: Lots of types need to have protobuf equivalents:
 # Core:
@@ -223,6 +477,24 @@ class GrpcWorkerAgentRuntime(AgentRuntime):
 
     .. _cloudevent.proto: https://github.com/microsoft/autogen/blob/main/protos/cloudevent.proto
 
+    Args:
+        host_address (str): The address of the host, e.g., "localhost:50051", or "unix:/path/to/socket" for
+            a host on the same machine that listens on a Unix domain socket.
+        tracer_provider (TracerProvider | None, optional): The tracer provider of the runtime. Defaults to None.
+        extra_grpc_config (ChannelArgumentType | None, optional): Extra options of the gRPC channel. Defaults to None.
+        payload_serialization_format (str, optional): The serialization format of the payloads. Defaults to JSON.
+        message_batching (MessageBatching | None, optional): The batching and compression of the messages sent
+            to the host, if the host supports it. See :class:`MessageBatching`. Defaults to None, i.e., no batching.
+        reconnect (bool, optional): Whether to reconnect to the host with exponential backoff when the connection
+            is lost. After reconnecting, the agent types and subscriptions are registered again, unless the host
+            resumed the session, and the messages the host did not receive are sent again. Defaults to False.
+        replay_buffer_size (int, optional): The number of the most recent messages sent to the host that are kept
+            to be sent again after a reconnection. The messages sent before a request are dropped from the buffer
+            once the host responds to the request. Defaults to 0, i.e., no message is sent again.
+        deserialization_offload_threshold (int | None, optional): The size in bytes of the smallest payload that is
+            deserialized in a worker thread rather than on the event loop, so that large payloads, e.g., long
+            group chat messages, do not block the other messages. Defaults to None, i.e., no payload is offloaded.
+
     """
 
     # TODO: Needs to handle agent close() call
@@ -232,8 +504,15 @@ def __init__(
         tracer_provider: TracerProvider | None = None,
         extra_grpc_config: ChannelArgumentType | None = None,
         payload_serialization_format: str = JSON_DATA_CONTENT_TYPE,
+        message_batching: MessageBatching | None = None,
+        reconnect: bool = False,
+        replay_buffer_size: int = 0,
+        deserialization_offload_threshold: int | None = None,
     ) -> None:
         self._host_address = host_address
+        self._message_batching = message_batching
+        self._reconnect = reconnect
+        self._replay_buffer_size = replay_buffer_size
         self._trace_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("Worker Runtime"))
         self._per_type_subscribers: DefaultDict[tuple[str, str], Set[AgentId]] = defaultdict(set)
         self._agent_factories: Dict[
@@ -242,14 +521,25 @@ def __init__(
         self._instantiated_agents: Dict[AgentId, Agent] = {}
         self._known_namespaces: set[str] = set()
         self._read_task: None | Task[None] = None
+        self._control_read_task: None | Task[None] = None
         self._running = False
         self._pending_requests: Dict[str, Future[Any]] = {}
+        self._pending_control_requests: Dict[str, Future[Any]] = {}
+        # The parts of the large states received in chunks, by rpc id.
+        self._state_chunks: Dict[str, List[str]] = {}
+        self._state_chunk_size = _constants.STATE_CHUNK_SIZE
+        self._control_request_timeout = _constants.CONTROL_REQUEST_TIMEOUT
         self._pending_requests_lock = asyncio.Lock()
         self._next_request_id = 0
         self._host_connection: HostConnection | None = None
         self._background_tasks: Set[Task[Any]] = set()
         self._subscription_manager = SubscriptionManager()
         self._serialization_registry = SerializationRegistry()
+        self._deserialization_offload_threshold = deserialization_offload_threshold
+        self._decoded_payloads = 0
+        self._offloaded_payloads = 0
+        self._skipped_payloads = 0
+        self._decoding_seconds = 0.0
         self._extra_grpc_config = extra_grpc_config or []
         self._agent_instance_types: Dict[str, Type[Agent]] = {}
 
@@ -264,11 +554,18 @@ async def start(self) -> None:
             raise ValueError("Runtime is already running.")
         logger.info(f"Connecting to host: {self._host_address}")
         self._host_connection = await HostConnection.from_host_address(
-            self._host_address, extra_grpc_config=self._extra_grpc_config
+            self._host_address,
+            extra_grpc_config=self._extra_grpc_config,
+            batching=self._message_batching,
+            reconnect=self._reconnect,
+            replay_buffer_size=self._replay_buffer_size,
         )
+        self._host_connection.on_reconnect = self._on_reconnect
         logger.info("Connection established")
         if self._read_task is None:
             self._read_task = asyncio.create_task(self._run_read_loop())
+        if self._control_read_task is None:
+            self._control_read_task = asyncio.create_task(self._run_control_read_loop())
         self._running = True
 
     def _raise_on_exception(self, task: Task[Any]) -> None:
@@ -276,6 +573,34 @@ def _raise_on_exception(self, task: Task[Any]) -> None:
         if exception is not None:
             raise exception
 
+    async def _on_reconnect(self, resumed: bool, replayed_request_ids: Set[str]) -> None:
+        # The responses to the control requests sent to the host are lost with the connection.
+        for future in self._pending_control_requests.values():
+            if not future.done():
+                future.set_exception(RuntimeError("The connection to the host was lost."))
+        self._pending_control_requests.clear()
+        # The rest of the states that were being received in chunks is lost with the connection.
+        self._state_chunks.clear()
+        if resumed:
+            return
+        assert self._host_connection is not None
+        # The host dropped the messages sent to this worker while it was disconnected, so the requests
+        # that were not replayed may never get a response.
+        for request_id, future in list(self._pending_requests.items()):
+            if request_id not in replayed_request_ids and not future.done():
+                future.set_exception(RuntimeError("The connection to the host was lost before the response."))
+                del self._pending_requests[request_id]
+        try:
+            for agent_type in self._agent_factories:
+                await self._register_agent_type(agent_type)
+            for subscription in self._subscription_manager.subscriptions:
+                await self._host_connection.stub.AddSubscription(
+                    agent_worker_pb2.AddSubscriptionRequest(subscription=subscription_to_proto(subscription)),
+                    metadata=self._host_connection.metadata,
+                )
+        except grpc.aio.AioRpcError as e:
+            logger.error(f"Failed to register the agent types and subscriptions again: {e.details()}")
+
     async def _run_read_loop(self) -> None:
         logger.info("Starting read loop")
         assert self._host_connection is not None
@@ -317,17 +642,18 @@ async def stop(self) -> None:
                 logger.error("Error in background task", exc_info=task_result)
         # Close the host connection.
         if self._host_connection is not None:
-            try:
-                await self._host_connection.close()
-            except asyncio.CancelledError:
-                pass
-        # Cancel the read task.
-        if self._read_task is not None:
-            self._read_task.cancel()
-            try:
-                await self._read_task
-            except asyncio.CancelledError:
-                pass
+            await self._host_connection.close()
+        # Cancel the read tasks.
+        for read_task in (self._read_task, self._control_read_task):
+            if read_task is not None:
+                read_task.cancel()
+                try:
+                    await read_task
+                except asyncio.CancelledError:
+                    pass
+        for future in self._pending_control_requests.values():
+            future.cancel()
+        self._pending_control_requests.clear()
 
     async def stop_when_signal(self, signals: Sequence[signal.Signals] = (signal.SIGTERM, signal.SIGINT)) -> None:
         """Stop the runtime when a signal is received."""
@@ -490,19 +816,166 @@ async def publish_message(
             task.add_done_callback(self._background_tasks.discard)
 
     async def save_state(self) -> Mapping[str, Any]:
-        raise NotImplementedError("Saving state is not yet implemented.")
+        """Save the state of the agents instantiated in this worker, concurrently.
+
+        .. note::
+            This method does not save the state of the agents of other workers, nor the subscriptions.
+
+        Returns:
+            A dictionary mapping agent IDs to their state.
+        """
+        agent_ids = list(self._instantiated_agents)
+        states = await asyncio.gather(*[self._instantiated_agents[agent_id].save_state() for agent_id in agent_ids])
+        return {str(agent_id): dict(state) for agent_id, state in zip(agent_ids, states, strict=True)}
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
-        raise NotImplementedError("Loading state is not yet implemented.")
+        """Load the state of the agents of the types registered in this worker, concurrently, on the workers
+        the host places them on. The keys of the dictionary are the agent IDs, and the values are the states
+        returned by :meth:`save_state`."""
+        agent_ids = [AgentId.from_str(agent_id_str) for agent_id_str in state]
+        await asyncio.gather(
+            *[
+                self.agent_load_state(agent_id, state[str(agent_id)])
+                for agent_id in agent_ids
+                if agent_id.type in self._known_agent_names
+            ]
+        )
 
     async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
         raise NotImplementedError("Agent metadata is not yet implemented.")
 
     async def agent_save_state(self, agent: AgentId) -> Mapping[str, Any]:
-        raise NotImplementedError("Agent save_state is not yet implemented.")
+        """Save the state of an agent. While the runtime is running, the state is requested over the control
+        channel of the host, which places the agent as it does for messages, e.g., on another worker of a
+        scaled-out agent type, and large states are transferred in chunks."""
+        if not self._running and agent.type in self._known_agent_names:
+            return await (await self._get_agent(agent)).save_state()
+        response = await self._send_control_request(
+            agent, agent_worker_pb2.SaveStateRequest(agentId=agent_worker_pb2.AgentId(type=agent.type, key=agent.key))
+        )
+        assert isinstance(response, agent_worker_pb2.SaveStateResponse)
+        if response.HasField("error"):
+            raise RuntimeError(f"Failed to save the state of agent {agent}: {response.error}")
+        return cast(Mapping[str, Any], json.loads(response.state))
 
     async def agent_load_state(self, agent: AgentId, state: Mapping[str, Any]) -> None:
-        raise NotImplementedError("Agent load_state is not yet implemented.")
+        """Load the state of an agent. While the runtime is running, the state is sent over the control
+        channel of the host, which places the agent as it does for messages, e.g., on another worker of a
+        scaled-out agent type, and large states are transferred in chunks."""
+        if not self._running and agent.type in self._known_agent_names:
+            await (await self._get_agent(agent)).load_state(state)
+            return
+        response = await self._send_control_request(
+            agent,
+            agent_worker_pb2.LoadStateRequest(
+                agentId=agent_worker_pb2.AgentId(type=agent.type, key=agent.key), state=json.dumps(state)
+            ),
+        )
+        assert isinstance(response, agent_worker_pb2.LoadStateResponse)
+        if response.HasField("error"):
+            raise RuntimeError(f"Failed to load the state of agent {agent}: {response.error}")
+
+    async def _send_control_request(
+        self, agent: AgentId, request: agent_worker_pb2.SaveStateRequest | agent_worker_pb2.LoadStateRequest
+    ) -> agent_worker_pb2.SaveStateResponse | agent_worker_pb2.LoadStateResponse:
+        if not self._running:
+            raise ValueError("Runtime must be running when sending a control message.")
+        if self._host_connection is None:
+            raise RuntimeError("Host connection is not set.")
+        rpc_id = str(uuid.uuid4())
+        future: Future[agent_worker_pb2.SaveStateResponse | agent_worker_pb2.LoadStateResponse] = (
+            asyncio.get_event_loop().create_future()
+        )
+        self._pending_control_requests[rpc_id] = future
+        await self._send_control_message(
+            rpc_id, f"agentid={agent}", request, respond_to=f"clientid={self._host_connection.client_id}"
+        )
+        try:
+            return await asyncio.wait_for(future, timeout=self._control_request_timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"No response to the state request {rpc_id} for agent {agent}.") from None
+        finally:
+            self._pending_control_requests.pop(rpc_id, None)
+            # The chunks of a response that ended with an error or was lost are not needed anymore.
+            self._state_chunks.pop(rpc_id, None)
+
+    async def _send_control_message(
+        self,
+        rpc_id: str,
+        destination: str,
+        message: _ControlPayload,
+        respond_to: str | None = None,
+    ) -> None:
+        """Send a control message, splitting a large state into chunks sent before the final message."""
+        assert self._host_connection is not None
+        if isinstance(message, agent_worker_pb2.SaveStateResponse | agent_worker_pb2.LoadStateRequest):
+            state = message.state
+            size = self._state_chunk_size
+            for start in range(0, len(state) - size, size):
+                chunk = type(message)()
+                chunk.CopyFrom(message)
+                chunk.state = state[start : start + size]
+                await self._host_connection.send_control(
+                    _control_message(rpc_id + _constants.STATE_CHUNK_RPC_ID_SUFFIX, destination, chunk, respond_to)
+                )
+            if len(state) > size:
+                last = type(message)()
+                last.CopyFrom(message)
+                last.state = state[(len(state) - 1) // size * size :]
+                message = last
+        await self._host_connection.send_control(_control_message(rpc_id, destination, message, respond_to))
+
+    async def _run_control_read_loop(self) -> None:
+        assert self._host_connection is not None
+        while True:
+            try:
+                control_message = await self._host_connection.recv_control()
+                message = _unpack_control_payload(control_message)
+                if message is None:
+                    logger.warning(f"Unknown control message: {control_message.rpcMessage.type_url}")
+                    continue
+                # Reassemble the states received in chunks before processing them.
+                if isinstance(message, agent_worker_pb2.SaveStateResponse | agent_worker_pb2.LoadStateRequest):
+                    if control_message.rpc_id.endswith(_constants.STATE_CHUNK_RPC_ID_SUFFIX):
+                        rpc_id = control_message.rpc_id[: -len(_constants.STATE_CHUNK_RPC_ID_SUFFIX)]
+                        self._state_chunks.setdefault(rpc_id, []).append(message.state)
+                        continue
+                    chunks = self._state_chunks.pop(control_message.rpc_id, None)
+                    if chunks is not None:
+                        message.state = "".join(chunks) + message.state
+                task = asyncio.create_task(self._process_control_message(control_message, message))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._raise_on_exception)
+                task.add_done_callback(self._background_tasks.discard)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error in control read loop", exc_info=e)
+
+    async def _process_control_message(
+        self, control_message: agent_worker_pb2.ControlMessage, message: _ControlPayload
+    ) -> None:
+        if isinstance(message, agent_worker_pb2.SaveStateResponse | agent_worker_pb2.LoadStateResponse):
+            future = self._pending_control_requests.get(control_message.rpc_id)
+            if future is not None and not future.done():
+                future.set_result(message)
+            return
+        agent_id = AgentId(message.agentId.type, message.agentId.key)
+        response: _ControlPayload
+        if isinstance(message, agent_worker_pb2.SaveStateRequest):
+            try:
+                state = await (await self._get_agent(agent_id)).save_state()
+                response = agent_worker_pb2.SaveStateResponse(state=json.dumps(state))
+            except Exception as e:
+                response = agent_worker_pb2.SaveStateResponse(error=str(e))
+        else:
+            try:
+                await (await self._get_agent(agent_id)).load_state(json.loads(message.state))
+                response = agent_worker_pb2.LoadStateResponse()
+            except Exception as e:
+                response = agent_worker_pb2.LoadStateResponse(error=str(e))
+        if control_message.HasField("respond_to"):
+            await self._send_control_message(control_message.rpc_id, control_message.respond_to, response)
 
     async def _get_new_request_id(self) -> str:
         async with self._pending_requests_lock:
@@ -519,15 +992,13 @@ async def _process_request(self, request: agent_worker_pb2.RpcRequest) -> None:
         else:
             logging.info(f"Processing request from unknown source to {recipient}")
 
-        # Deserialize the message.
-        message = self._serialization_registry.deserialize(
-            request.payload.data,
-            type_name=request.payload.data_type,
-            data_content_type=request.payload.data_content_type,
+        # Get the receiving agent and deserialize the message.
+        rec_agent = await self._get_agent(recipient)
+        message = await self._deserialize_payload(
+            request.payload.data, request.payload.data_type, request.payload.data_content_type
         )
 
-        # Get the receiving agent and prepare the message context.
-        rec_agent = await self._get_agent(recipient)
+        # Prepare the message context.
         message_context = MessageContext(
             sender=sender,
             topic_id=None,
@@ -589,17 +1060,26 @@ async def _process_response(self, response: agent_worker_pb2.RpcResponse) -> Non
             attributes={"request_id": response.request_id},
             extraAttributes={"message_type": response.payload.data_type},
         ):
-            # Deserialize the result.
-            result = self._serialization_registry.deserialize(
-                response.payload.data,
-                type_name=response.payload.data_type,
-                data_content_type=response.payload.data_content_type,
-            )
+            if self._host_connection is not None:
+                self._host_connection.acknowledge(response.request_id)
             # Get the future and set the result.
-            future = self._pending_requests.pop(response.request_id)
+            future = self._pending_requests.pop(response.request_id, None)
+            if future is None or future.done():
+                # The request was failed when the session with the host was lost.
+                logger.warning(f"Received a response to an unknown request {response.request_id}.")
+                return
             if len(response.error) > 0:
                 future.set_exception(Exception(response.error))
-            else:
+                return
+            # Deserialize the result.
+            try:
+                result = await self._deserialize_payload(
+                    response.payload.data, response.payload.data_type, response.payload.data_content_type
+                )
+            except Exception as e:
+                future.set_exception(e)
+                return
+            if not future.done():
                 future.set_result(result)
 
     async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
@@ -616,20 +1096,26 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         topic_id = TopicId(event.type, event.source)
         # Get the recipients for the topic.
         recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
+        if _constants.RECIPIENTS_ATTR in event_attributes:
+            # The host placed the recipients of agent types that run on many workers.
+            placed_recipients = set(json.loads(event_attributes[_constants.RECIPIENTS_ATTR].ce_string))
+            recipients = [recipient for recipient in recipients if str(recipient) in placed_recipients]
+
+        recipients = [agent_id for agent_id in recipients if agent_id != sender]
 
         message_content_type = event_attributes[_constants.DATA_CONTENT_TYPE_ATTR].ce_string
         message_type = event_attributes[_constants.DATA_SCHEMA_ATTR].ce_string
 
+        if not recipients:
+            # The payload is not deserialized for an event that no agent of the worker handles.
+            self._skipped_payloads += 1
+            return
         if message_content_type == JSON_DATA_CONTENT_TYPE:
-            message = self._serialization_registry.deserialize(
-                event.binary_data, type_name=message_type, data_content_type=message_content_type
-            )
+            message = await self._deserialize_payload(event.binary_data, message_type, message_content_type)
         elif message_content_type == PROTOBUF_DATA_CONTENT_TYPE:
             # TODO: find a way to prevent the roundtrip serialization
             proto_binary_data = event.proto_data.SerializeToString()
-            message = self._serialization_registry.deserialize(
-                proto_binary_data, type_name=message_type, data_content_type=message_content_type
-            )
+            message = await self._deserialize_payload(proto_binary_data, message_type, message_content_type)
         else:
             raise ValueError(f"Unsupported message content type: {message_content_type}")
 
@@ -646,8 +1132,6 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         # Send the message to each recipient.
         responses: List[Awaitable[Any]] = []
         for agent_id in recipients:
-            if agent_id == sender:
-                continue
             message_context = MessageContext(
                 sender=sender,
                 topic_id=topic_id,
@@ -702,6 +1186,38 @@ async def send_message(agent: Agent, message_context: MessageContext) -> Any:
         except BaseException as e:
             logger.error("Error handling event", exc_info=e)
 
+    @property
+    def payload_decoding_stats(self) -> PayloadDecodingStats:
+        """The deserialization of the payloads of the messages received by the worker, e.g., to tune
+        the `deserialization_offload_threshold`."""
+        return PayloadDecodingStats(
+            decoded=self._decoded_payloads,
+            offloaded=self._offloaded_payloads,
+            skipped=self._skipped_payloads,
+            seconds=self._decoding_seconds,
+        )
+
+    async def _deserialize_payload(self, data: bytes, type_name: str, data_content_type: str) -> Any:
+        start = time.perf_counter()
+        try:
+            if (
+                self._deserialization_offload_threshold is not None
+                and len(data) >= self._deserialization_offload_threshold
+            ):
+                self._offloaded_payloads += 1
+                return await asyncio.to_thread(
+                    self._serialization_registry.deserialize,
+                    data,
+                    type_name=type_name,
+                    data_content_type=data_content_type,
+                )
+            return self._serialization_registry.deserialize(
+                data, type_name=type_name, data_content_type=data_content_type
+            )
+        finally:
+            self._decoded_payloads += 1
+            self._decoding_seconds += time.perf_counter() - start
+
     async def _register_agent_type(self, agent_type: str) -> None:
         if self._host_connection is None:
             raise RuntimeError("Host connection is not set.")
@@ -854,3 +1370,36 @@ async def get(
 
     def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
         self._serialization_registry.add_serializer(serializer)
+
+
+_ControlPayload = (
+    agent_worker_pb2.SaveStateRequest
+    | agent_worker_pb2.SaveStateResponse
+    | agent_worker_pb2.LoadStateRequest
+    | agent_worker_pb2.LoadStateResponse
+)
+
+
+def _control_message(
+    rpc_id: str, destination: str, message: _ControlPayload, respond_to: str | None
+) -> agent_worker_pb2.ControlMessage:
+    rpc_message = any_pb2.Any()
+    rpc_message.Pack(message)
+    return agent_worker_pb2.ControlMessage(
+        rpc_id=rpc_id, destination=destination, respond_to=respond_to, rpcMessage=rpc_message
+    )
+
+
+def _unpack_control_payload(control_message: agent_worker_pb2.ControlMessage) -> _ControlPayload | None:
+    rpc_message = control_message.rpcMessage
+    for message_type in (
+        agent_worker_pb2.SaveStateRequest,
+        agent_worker_pb2.SaveStateResponse,
+        agent_worker_pb2.LoadStateRequest,
+        agent_worker_pb2.LoadStateResponse,
+    ):
+        if rpc_message.Is(message_type.DESCRIPTOR):
+            message = message_type()
+            rpc_message.Unpack(message)
+            return message
+    return None
@@ -1,11 +1,18 @@
 import asyncio
 import logging
 import signal
-from typing import Optional, Sequence
+from typing import List, Mapping, Optional, Sequence
 
+from ._batching import MessageBatching
 from ._constants import GRPC_IMPORT_ERROR_STR
 from ._type_helpers import ChannelArgumentType
-from ._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
+from ._worker_runtime_host_peer import HostPeerLink
+from ._worker_runtime_host_servicer import (
+    AgentPlacement,
+    ClientSendStats,
+    GrpcWorkerAgentRuntimeHostServicer,
+    SendQueueOverflow,
+)
 
 try:
     import grpc
@@ -17,14 +24,75 @@
 
 
 class GrpcWorkerAgentRuntimeHost:
-    def __init__(self, address: str, extra_grpc_config: Optional[ChannelArgumentType] = None) -> None:
+    """A host that delivers messages between :class:`GrpcWorkerAgentRuntime` workers.
+
+    Args:
+        address (str): The address the host listens on, e.g., "localhost:50051", or "unix:/path/to/socket" to
+            listen on a Unix domain socket, which has a lower latency than loopback TCP for workers on the same machine.
+        extra_grpc_config (ChannelArgumentType, optional): Extra options of the gRPC server.
+        scale_out_agent_types (Mapping[str, Literal["key_hash", "least_loaded"]] | None, optional):
+            The agent types that can be registered by many workers, with the policy that places
+            the agents of the type on the workers.
+            See :class:`GrpcWorkerAgentRuntimeHostServicer`. Defaults to None.
+        peer_addresses (Sequence[str] | None, optional): The addresses of the peer hosts. Each host of a
+            multi-host deployment lists all the others as peers, and the workers connect to any host.
+            Defaults to None.
+        host_id (str | None, optional): The id of the host, unique among the peers. Defaults to the address.
+        message_batching (MessageBatching | None, optional): The batching and compression of the messages sent
+            to the workers that support it. See :class:`MessageBatching`. Defaults to None, i.e., no batching.
+        reconnect_grace_period (float, optional): The seconds the session of a disconnected worker is kept,
+            so that a worker that reconnects within the period keeps its agent types and subscriptions and
+            receives the messages sent to it while disconnected. Defaults to 0.0.
+        max_send_queue_size (int, optional): The maximum number of messages waiting to be sent to each worker.
+            Defaults to 0, i.e., unbounded.
+        send_queue_overflow (Literal["block", "drop_oldest", "disconnect"], optional): What to do when the queue
+            of a worker is full. See :class:`GrpcWorkerAgentRuntimeHostServicer`. Defaults to "block".
+
+    Example:
+
+        Run two hosts that forward messages to each other, e.g., in separate processes:
+
+        .. code-block:: python
+
+            host1 = GrpcWorkerAgentRuntimeHost(address="localhost:50051", peer_addresses=["localhost:50052"])
+            host2 = GrpcWorkerAgentRuntimeHost(address="localhost:50052", peer_addresses=["localhost:50051"])
+            host1.start()
+            host2.start()
+    """
+
+    def __init__(
+        self,
+        address: str,
+        extra_grpc_config: Optional[ChannelArgumentType] = None,
+        scale_out_agent_types: Mapping[str, AgentPlacement] | None = None,
+        peer_addresses: Sequence[str] | None = None,
+        host_id: str | None = None,
+        message_batching: MessageBatching | None = None,
+        reconnect_grace_period: float = 0.0,
+        max_send_queue_size: int = 0,
+        send_queue_overflow: SendQueueOverflow = "block",
+    ) -> None:
         self._server = grpc.aio.server(options=extra_grpc_config)
-        self._servicer = GrpcWorkerAgentRuntimeHostServicer()
+        self._servicer = GrpcWorkerAgentRuntimeHostServicer(
+            scale_out_agent_types=scale_out_agent_types,
+            message_batching=message_batching,
+            reconnect_grace_period=reconnect_grace_period,
+            max_send_queue_size=max_send_queue_size,
+            send_queue_overflow=send_queue_overflow,
+        )
+        self._peer_links: List[HostPeerLink] = [
+            HostPeerLink(self._servicer, host_id or address, peer_address, extra_grpc_config)
+            for peer_address in peer_addresses or []
+        ]
         agent_worker_pb2_grpc.add_AgentRpcServicer_to_server(self._servicer, self._server)
         self._server.add_insecure_port(address)
         self._address = address
         self._serve_task: asyncio.Task[None] | None = None
 
+    def client_send_stats(self) -> Mapping[str, ClientSendStats]:
+        """Get the state of the queue of the messages sent to each connected worker, by client id."""
+        return self._servicer.client_send_stats()
+
     async def _serve(self) -> None:
         await self._server.start()
         logger.info(f"Server started at {self._address}.")
@@ -35,11 +103,15 @@ def start(self) -> None:
         if self._serve_task is not None:
             raise RuntimeError("Host runtime is already started.")
         self._serve_task = asyncio.create_task(self._serve())
+        for link in self._peer_links:
+            link.start()
 
     async def stop(self, grace: int = 5) -> None:
         """Stop the server."""
         if self._serve_task is None:
             raise RuntimeError("Host runtime is not started.")
+        for link in self._peer_links:
+            await link.stop()
         await self._server.stop(grace=grace)
         self._serve_task.cancel()
         try:
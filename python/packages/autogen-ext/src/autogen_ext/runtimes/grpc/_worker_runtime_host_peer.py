@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Sequence, Tuple, cast
+
+from autogen_core import Subscription
+
+from ._constants import GRPC_IMPORT_ERROR_STR, PEER_CLIENT_ID_PREFIX
+from ._type_helpers import ChannelArgumentType
+from ._utils import subscription_to_proto
+from ._worker_runtime import QueueAsyncIterable
+
+try:
+    import grpc.aio
+except ImportError as e:
+    raise ImportError(GRPC_IMPORT_ERROR_STR) from e
+
+from .protos import agent_worker_pb2, agent_worker_pb2_grpc
+
+if TYPE_CHECKING:
+    from ._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
+    from .protos.agent_worker_pb2_grpc import AgentRpcAsyncStub
+
+logger = logging.getLogger("autogen_core")
+
+_Operation = Callable[["AgentRpcAsyncStub", Sequence[Tuple[str, str]]], Awaitable[Any]]
+
+
+class HostPeerLink:
+    """A connection from a host to a peer host, on which the host is a client of the peer.
+
+    The host registers the agent types and subscriptions of its own workers with the peer,
+    like a worker does. The peer then sends the requests and events for those agents to the
+    host over the link, and the host sends back the responses. The link reconnects when the
+    connection is lost, and registers the agent types and subscriptions again.
+
+    Args:
+        servicer (GrpcWorkerAgentRuntimeHostServicer): The servicer of the host.
+        host_id (str): The id of the host, unique among the peers, e.g., its address.
+        peer_address (str): The address of the peer host.
+        extra_grpc_config (ChannelArgumentType, optional): Extra options of the gRPC channel.
+        retry_interval (float, optional): The seconds to wait before reconnecting. Defaults to 1.0.
+    """
+
+    def __init__(
+        self,
+        servicer: GrpcWorkerAgentRuntimeHostServicer,
+        host_id: str,
+        peer_address: str,
+        extra_grpc_config: Optional[ChannelArgumentType] = None,
+        retry_interval: float = 1.0,
+    ) -> None:
+        self._servicer = servicer
+        self._peer_address = peer_address
+        self._extra_grpc_config = extra_grpc_config
+        self._retry_interval = retry_interval
+        self._metadata = [("client-id", PEER_CLIENT_ID_PREFIX + host_id)]
+        self._send_queue: asyncio.Queue[agent_worker_pb2.Message] = asyncio.Queue()
+        self._operations: asyncio.Queue[_Operation] = asyncio.Queue()
+        self._connected = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def link_id(self) -> str:
+        """The id of the link among the connections of the host."""
+        return f"link:{self._peer_address}"
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def start(self) -> None:
+        if self._task is not None:
+            raise RuntimeError("Peer link is already started.")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def send(self, message: agent_worker_pb2.Message) -> None:
+        await self._send_queue.put(message)
+
+    def register_agent(self, agent_type: str) -> None:
+        """Register an agent type of a worker of the host with the peer."""
+        self._enqueue(
+            lambda stub, metadata: stub.RegisterAgent(
+                agent_worker_pb2.RegisterAgentTypeRequest(type=agent_type), metadata=metadata
+            )
+        )
+
+    def add_subscription(self, subscription: Subscription) -> None:
+        """Add a subscription of a worker of the host to the peer."""
+        request = agent_worker_pb2.AddSubscriptionRequest(subscription=subscription_to_proto(subscription))
+        self._enqueue(lambda stub, metadata: stub.AddSubscription(request, metadata=metadata))
+
+    def remove_subscription(self, subscription_id: str) -> None:
+        """Remove a subscription of a worker of the host from the peer."""
+        request = agent_worker_pb2.RemoveSubscriptionRequest(id=subscription_id)
+        self._enqueue(lambda stub, metadata: stub.RemoveSubscription(request, metadata=metadata))
+
+    def _enqueue(self, operation: _Operation) -> None:
+        # Operations are dropped while disconnected, as the peer removes the registrations of a
+        # disconnected host, and they are registered again on reconnection.
+        if self._connected:
+            self._operations.put_nowait(operation)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with grpc.aio.insecure_channel(self._peer_address, options=self._extra_grpc_config) as channel:
+                    await self._serve(channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Connection to peer host {self._peer_address} failed: {e}")
+            finally:
+                self._connected = False
+                self._servicer._remove_peer_link(self)  # type: ignore[reportPrivateUsage]
+            await asyncio.sleep(self._retry_interval)
+
+    async def _serve(self, channel: grpc.aio.Channel) -> None:  # type: ignore
+        from grpc.aio import StreamStreamCall
+
+        stub: AgentRpcAsyncStub = agent_worker_pb2_grpc.AgentRpcStub(channel)  # type: ignore
+        # Messages and operations queued for a previous connection are stale.
+        self._send_queue = asyncio.Queue()
+        self._operations = asyncio.Queue()
+        stream: StreamStreamCall[agent_worker_pb2.Message, agent_worker_pb2.Message] = stub.OpenChannel(  # type: ignore
+            QueueAsyncIterable(self._send_queue), metadata=self._metadata
+        )
+        await stream.wait_for_connection()
+        self._connected = True
+        logger.info(f"Connected to peer host {self._peer_address}.")
+        # Register the agent types and subscriptions of the workers of the host, before any later change.
+        self._servicer._add_peer_link(self)  # type: ignore[reportPrivateUsage]
+        operations_task = asyncio.create_task(self._process_operations(stub))
+        try:
+            while True:
+                message = cast(agent_worker_pb2.Message, await stream.read())  # type: ignore
+                if message == grpc.aio.EOF:  # type: ignore
+                    break
+                await self._servicer._receive_peer_message(self.link_id, message)  # type: ignore[reportPrivateUsage]
+        finally:
+            operations_task.cancel()
+
+    async def _process_operations(self, stub: AgentRpcAsyncStub) -> None:
+        while True:
+            operation = await self._operations.get()
+            try:
+                await operation(stub, self._metadata)
+            except grpc.aio.AioRpcError as e:
+                logger.error(f"Failed to update peer host {self._peer_address}: {e.details()}")
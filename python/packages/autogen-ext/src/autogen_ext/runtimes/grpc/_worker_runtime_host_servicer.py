@@ -1,17 +1,50 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
+import time
 from abc import ABC, abstractmethod
 from asyncio import Future, Task
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Sequence, Set, Tuple, TypeVar
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from autogen_core import TopicId
 from autogen_core._agent_id import AgentId
 from autogen_core._runtime_impl_helpers import SubscriptionManager
-
+from google.protobuf import any_pb2
+
+from . import _constants
+from ._batching import (
+    CAPABILITY_BATCH,
+    MessageBatching,
+    capabilities_metadata,
+    decode_batch,
+    next_batch,
+    parse_capabilities,
+)
 from ._constants import GRPC_IMPORT_ERROR_STR
-from ._utils import subscription_from_proto, subscription_to_proto
+from ._utils import get_sequence_number, subscription_from_proto, subscription_to_proto, trace_message
 
 try:
     import grpc
@@ -20,10 +53,31 @@
 
 from .protos import agent_worker_pb2, agent_worker_pb2_grpc, cloudevent_pb2
 
+if TYPE_CHECKING:
+    from ._worker_runtime_host_peer import HostPeerLink
+
 logger = logging.getLogger("autogen_core")
 event_logger = logging.getLogger("autogen_core.events")
 
 ClientConnectionId = str
+AgentPlacement = Literal["key_hash", "least_loaded"]
+SendQueueOverflow = Literal["block", "drop_oldest", "disconnect"]
+
+
+@dataclass(frozen=True)
+class ClientSendStats:
+    """The state of the queue of the messages sent by the host to a client.
+
+    Args:
+        queued (int): The number of messages waiting to be sent.
+        dropped (int): The number of messages dropped because the queue was full.
+        lag (float): The seconds since the client last took a message while messages were waiting,
+            0.0 if no message is waiting.
+    """
+
+    queued: int
+    dropped: int
+    lag: float
 
 
 def metadata_to_dict(metadata: Sequence[Tuple[str, str]] | None) -> Dict[str, str]:
@@ -41,29 +95,78 @@ async def get_client_id_or_abort(context: grpc.aio.ServicerContext[Any, Any]) ->
     return client_id  # type: ignore
 
 
-SendT = TypeVar("SendT")
-ReceiveT = TypeVar("ReceiveT")
+SendT = TypeVar("SendT", bound=agent_worker_pb2.Message | agent_worker_pb2.ControlMessage)
+ReceiveT = TypeVar("ReceiveT", bound=agent_worker_pb2.Message | agent_worker_pb2.ControlMessage)
 
 
 class ChannelConnection(ABC, Generic[SendT, ReceiveT]):
-    def __init__(self, request_iterator: AsyncIterator[ReceiveT], client_id: str) -> None:
+    def __init__(
+        self,
+        request_iterator: AsyncIterator[ReceiveT],
+        client_id: str,
+        batching: MessageBatching | None = None,
+        peer_capabilities: Set[str] | None = None,
+        max_queue_size: int = 0,
+        overflow: SendQueueOverflow = "block",
+    ) -> None:
         self._request_iterator = request_iterator
         self._client_id = client_id
-        self._send_queue: asyncio.Queue[SendT] = asyncio.Queue()
+        self._send_queue: asyncio.Queue[SendT] = asyncio.Queue(maxsize=max_queue_size)
+        # The messages sent before the queued ones, e.g., the messages buffered while the client was disconnected.
+        self._backlog: Deque[SendT] = deque()
+        self._overflow = overflow
+        self._overflowed = False
+        # The task that takes the messages from the queue, i.e., the task of the call that sends them.
+        self._consumer: Task[Any] | None = None
+        self._dropped = 0
+        # The time since which the messages in the queue are waiting for the client.
+        self._waiting_since = time.monotonic()
+        # Messages are sent in batches if the client advertised it can decode them.
+        self._peer_capabilities = peer_capabilities or set()
+        self._batching = batching if CAPABILITY_BATCH in self._peer_capabilities else None
         self._receiving_task = asyncio.create_task(self._receive_messages(client_id, request_iterator))
 
     async def _receive_messages(self, client_id: ClientConnectionId, request_iterator: AsyncIterator[ReceiveT]) -> None:
         # Receive messages from the client and process them.
         async for message in request_iterator:
-            logger.info(f"Received message from client {client_id}: {message}")
-            await self._handle_message(message)
+            trace_message(logger, "Received", client_id, message)
+            batch = decode_batch(message) if isinstance(message, agent_worker_pb2.Message) else None
+            if batch is None:
+                await self._handle_message(message)
+                continue
+            for batched_message in batch:
+                await self._handle_message(cast(ReceiveT, batched_message))
 
     def __aiter__(self) -> AsyncIterator[SendT]:
         return self
 
+    @property
+    def overflowed(self) -> bool:
+        """Whether the queue overflowed with the "disconnect" policy, which ends the connection."""
+        return self._overflowed
+
+    @property
+    def stats(self) -> ClientSendStats:
+        queued = len(self._backlog) + self._send_queue.qsize()
+        lag = 0.0 if queued == 0 else time.monotonic() - self._waiting_since
+        return ClientSendStats(queued=queued, dropped=self._dropped, lag=lag)
+
     async def __anext__(self) -> SendT:
+        if self._overflowed:
+            raise StopAsyncIteration
+        if self._consumer is None:
+            self._consumer = asyncio.current_task()
+        if self._backlog:
+            self._waiting_since = time.monotonic()
+            return self._backlog.popleft()
         try:
-            return await self._send_queue.get()
+            if self._batching is not None:
+                send_queue = cast(asyncio.Queue[agent_worker_pb2.Message], self._send_queue)
+                message = cast(SendT, await next_batch(send_queue, self._batching, self._peer_capabilities))
+            else:
+                message = await self._send_queue.get()
+            self._waiting_since = time.monotonic()
+            return message
         except StopAsyncIteration:
             await self._receiving_task
             raise
@@ -76,7 +179,29 @@ async def __anext__(self) -> SendT:
     async def _handle_message(self, message: ReceiveT) -> None:
         pass
 
+    def send_first(self, messages: Iterable[SendT]) -> None:
+        """Send the messages before the queued messages, without waiting or applying the limit of the queue."""
+        self._backlog.extend(messages)
+
     async def send(self, message: SendT) -> None:
+        trace_message(logger, "Sending", self._client_id, message)
+        if self._send_queue.empty():
+            self._waiting_since = time.monotonic()
+        if self._send_queue.full():
+            if self._overflow == "drop_oldest":
+                self._send_queue.get_nowait()
+                self._dropped += 1
+            elif self._overflow == "disconnect":
+                if not self._overflowed:
+                    logger.warning(f"Send queue of client {self._client_id} is full, disconnecting the client.")
+                    self._overflowed = True
+                    # The call is waiting for the client to read a message, so it is cancelled rather than
+                    # ended on its next message.
+                    if self._consumer is not None:
+                        self._consumer.cancel()
+                self._dropped += 1
+                return
+        # With the "block" policy, wait until the client takes a message from the full queue.
         await self._send_queue.put(message)
 
 
@@ -86,30 +211,141 @@ def __init__(
         request_iterator: AsyncIterator[ReceiveT],
         client_id: str,
         handle_callback: Callable[[ReceiveT], Awaitable[None]],
+        batching: MessageBatching | None = None,
+        peer_capabilities: Set[str] | None = None,
+        max_queue_size: int = 0,
+        overflow: SendQueueOverflow = "block",
     ) -> None:
         self._handle_callback = handle_callback
-        super().__init__(request_iterator, client_id)
+        super().__init__(request_iterator, client_id, batching, peer_capabilities, max_queue_size, overflow)
 
     async def _handle_message(self, message: ReceiveT) -> None:
         await self._handle_callback(message)
 
 
+class _DetachedClient:
+    """The session of a worker that disconnected, kept for the reconnection grace period.
+    The messages sent to the worker are buffered and sent when it reconnects. If the buffer
+    overflows, the oldest messages are dropped, and the session is not resumed."""
+
+    def __init__(self, client_id: ClientConnectionId) -> None:
+        self.client_id = client_id
+        self.messages: Deque[agent_worker_pb2.Message] = deque(maxlen=_constants.DETACHED_CLIENT_BUFFER_SIZE)
+        self.dropped = 0
+        self.expiry_task: Task[None] | None = None
+
+    async def send(self, message: agent_worker_pb2.Message) -> None:
+        if len(self.messages) == self.messages.maxlen:
+            if self.dropped == 0:
+                logger.warning(
+                    f"The buffer of disconnected client {self.client_id} is full, dropping its oldest messages."
+                )
+            self.dropped += 1
+        self.messages.append(message)
+
+
+@dataclass(frozen=True)
+class _TopicRoute:
+    """The clients that host the recipients of the events of a topic, and the recipients on each client."""
+
+    client_recipients: Mapping[ClientConnectionId, Sequence[AgentId]]
+    # Whether a recipient is of a scale-out agent type, so the event names its recipients on each client.
+    scale_out: bool
+
+
+def _is_peer(client_id: ClientConnectionId) -> bool:
+    return client_id.startswith(_constants.PEER_CLIENT_ID_PREFIX)
+
+
+def _placement_score(client_id: ClientConnectionId, key: str) -> int:
+    digest = hashlib.blake2b(f"{client_id}/{key}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
 class GrpcWorkerAgentRuntimeHostServicer(agent_worker_pb2_grpc.AgentRpcServicer):
-    """A gRPC servicer that hosts message delivery service for agents."""
+    """A gRPC servicer that hosts message delivery service for agents.
+
+    Each agent type is registered by a single worker, unless it is listed in
+    `scale_out_agent_types`. Agent types listed there can be registered by many workers,
+    and the agents of the type are placed on the workers by the policy of the type:
+
+    - ``"key_hash"``: each agent key is placed on a worker with rendezvous hashing, so the
+      agent is sticky to a worker and only the keys of a worker that joins or leaves move.
+      Use it for agents that keep state.
+    - ``"least_loaded"``: each message is sent to the worker with the fewest pending requests.
+      Use it for stateless agents.
+
+    Hosts can be connected as peers with :class:`HostPeerLink`, each host being a client of
+    the others. A host registers the agent types and subscriptions of its own workers with its
+    peers, so the agent types and topics are partitioned by host, and messages are forwarded
+    to the peer of the recipient. Messages received from a peer are delivered to the workers
+    of the host only.
+
+    Args:
+        scale_out_agent_types (Mapping[str, Literal["key_hash", "least_loaded"]] | None, optional):
+            The agent types that can be registered by many workers, with their placement policy.
+            Defaults to None.
+        message_batching (MessageBatching | None, optional): The batching and compression of the messages
+            sent to the workers that support it. Defaults to None, i.e., no batching.
+        reconnect_grace_period (float, optional): The seconds the session of a disconnected worker is kept.
+            If the worker reconnects within the period, its agent types and subscriptions are kept, and the
+            messages sent to it while disconnected are delivered. If more messages were sent than the host
+            buffers, the oldest are dropped and the worker is told its session was not resumed, so that it
+            fails its pending requests. Defaults to 0.0, i.e., the session ends on disconnection.
+        max_send_queue_size (int, optional): The maximum number of messages waiting to be sent to each client.
+            Defaults to 0, i.e., unbounded.
+        send_queue_overflow (Literal["block", "drop_oldest", "disconnect"], optional): What to do when a message
+            is sent to a client whose queue is full: wait for the client to take a message, drop the oldest
+            message of the queue, or disconnect the client. With a bounded queue, at most `max_send_queue_size`
+            messages of each client are delivered at a time, so with "block" a slow client also stops the host
+            from reading the messages of the clients that send to it. Defaults to "block".
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        scale_out_agent_types: Mapping[str, AgentPlacement] | None = None,
+        message_batching: MessageBatching | None = None,
+        reconnect_grace_period: float = 0.0,
+        max_send_queue_size: int = 0,
+        send_queue_overflow: SendQueueOverflow = "block",
+    ) -> None:
+        self._scale_out_agent_types: Dict[str, AgentPlacement] = dict(scale_out_agent_types or {})
+        self._max_send_queue_size = max_send_queue_size
+        self._send_queue_overflow: SendQueueOverflow = send_queue_overflow
+        self._message_batching = message_batching
+        self._reconnect_grace_period = reconnect_grace_period
+        self._detached_clients: Dict[ClientConnectionId, _DetachedClient] = {}
+        # The sequence number of the last message received from each worker, for the most recent workers.
+        self._sequence_numbers: OrderedDict[ClientConnectionId, int] = OrderedDict()
         self._data_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]
         ] = {}
         self._control_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage]
         ] = {}
+        # The lock serializes the updates of the registrations. The lists of client ids are replaced
+        # rather than changed, so that messages are routed without the lock.
         self._agent_type_to_client_id_lock = asyncio.Lock()
-        self._agent_type_to_client_id: Dict[str, ClientConnectionId] = {}
+        self._agent_type_to_client_ids: Dict[str, List[ClientConnectionId]] = {}
+        # The routes of the events of each topic, by topic and whether peer hosts are excluded.
+        # The table is replaced with an empty one when the agent types or subscriptions change.
+        self._topic_routes: Dict[Tuple[TopicId, bool], _TopicRoute] = {}
         self._pending_responses: Dict[ClientConnectionId, Dict[str, Future[Any]]] = {}
+        # The client that receives the chunks of a state sent to an agent, by sender and rpc id,
+        # so that all the chunks go to the client placed for the first one.
+        self._state_transfer_client_ids: Dict[Tuple[ClientConnectionId, str], ClientConnectionId] = {}
+        # The state requests forwarded to each client that it did not respond to yet, by rpc id,
+        # so that the requesters get an error rather than waiting when the client disconnects.
+        self._pending_control_requests: Dict[ClientConnectionId, Dict[str, agent_worker_pb2.ControlMessage]] = {}
         self._background_tasks: Set[Task[Any]] = set()
         self._subscription_manager = SubscriptionManager()
         self._client_id_to_subscription_id_mapping: Dict[ClientConnectionId, set[str]] = {}
+        # The clients of each subscription, and the ids of the subscriptions that the workers of
+        # a scale-out agent type added for an existing subscription.
+        self._subscription_id_to_client_ids: Dict[str, Set[ClientConnectionId]] = {}
+        self._subscription_id_aliases: Dict[str, str] = {}
+        # The connected links to peer hosts, by link id.
+        self._peer_links: Dict[str, HostPeerLink] = {}
 
     async def OpenChannel(  # type: ignore
         self,
@@ -117,27 +353,98 @@ async def OpenChannel(  # type: ignore
         context: grpc.aio.ServicerContext[agent_worker_pb2.Message, agent_worker_pb2.Message],
     ) -> AsyncIterator[agent_worker_pb2.Message]:
         client_id = await get_client_id_or_abort(context)
+        # Exchange the capabilities of the channel, e.g., batching, with the client.
+        peer_capabilities = parse_capabilities(context.invocation_metadata())  # type: ignore
+        # Tell the client whether its session is resumed and the last message received from it,
+        # so that it sends again only the messages that were not received.
+        initial_metadata = [capabilities_metadata()]
+        detached = self._detached_clients.get(client_id)
+        if detached is not None and detached.dropped == 0:
+            initial_metadata.append((_constants.SESSION_METADATA_KEY, _constants.SESSION_RESUMED))
+        elif detached is not None:
+            # Dropped messages may include responses, so the client fails its pending requests as for a new session.
+            logger.warning(
+                f"Dropped {detached.dropped} messages to client {client_id} while it was disconnected, "
+                "not resuming its session."
+            )
+        if client_id in self._sequence_numbers:
+            initial_metadata.append((_constants.LAST_SEQUENCE_NUMBER_KEY, str(self._sequence_numbers[client_id])))
+
+        # With bounded send queues, the messages of the client being delivered are limited, so that the
+        # reading of its messages waits for a full queue, rather than the detached delivery tasks.
+        in_flight = asyncio.Semaphore(self._max_send_queue_size) if self._max_send_queue_size > 0 else None
 
         async def handle_callback(message: agent_worker_pb2.Message) -> None:
-            await self._receive_message(client_id, message)
+            await self._receive_message(client_id, message, in_flight)
 
         connection = CallbackChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message](
-            request_iterator, client_id, handle_callback=handle_callback
+            request_iterator,
+            client_id,
+            handle_callback=handle_callback,
+            batching=self._message_batching,
+            peer_capabilities=peer_capabilities,
+            max_queue_size=self._max_send_queue_size,
+            overflow=self._send_queue_overflow,
         )
+        # The session is taken from the detached clients and the connection registered without yielding,
+        # so that a message sent to the client meanwhile is either buffered or queued, not lost.
+        detached = self._detached_clients.pop(client_id, None)
+        if detached is not None:
+            if detached.expiry_task is not None:
+                detached.expiry_task.cancel()
+            connection.send_first(detached.messages)
         self._data_connections[client_id] = connection
-        logger.info(f"Client {client_id} connected.")
 
         try:
-            async for message in connection:
-                yield message
+            await context.send_initial_metadata(initial_metadata)  # type: ignore
+            logger.info(f"Client {client_id} connected.")
+            try:
+                async for message in connection:
+                    yield message
+            except asyncio.CancelledError:
+                if not connection.overflowed:
+                    raise
+            if connection.overflowed:
+                await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "The send queue of the client is full.")
         finally:
-            # Clean up the client connection.
-            del self._data_connections[client_id]
-            # Cancel pending requests sent to this client.
-            for future in self._pending_responses.pop(client_id, {}).values():
-                future.cancel()
-            # Remove the client id from the agent type to client id mapping.
-            await self._on_client_disconnect(client_id)
+            # Clean up the client connection, unless the client already reconnected.
+            if self._data_connections.get(client_id) is connection:
+                del self._data_connections[client_id]
+                if self._reconnect_grace_period > 0 and not _is_peer(client_id):
+                    detached = _DetachedClient(client_id)
+                    detached.expiry_task = asyncio.create_task(self._expire_detached_client(client_id, detached))
+                    self._background_tasks.add(detached.expiry_task)
+                    detached.expiry_task.add_done_callback(self._background_tasks.discard)
+                    self._detached_clients[client_id] = detached
+                else:
+                    await self._end_session(client_id)
+
+    async def _expire_detached_client(self, client_id: ClientConnectionId, detached: _DetachedClient) -> None:
+        await asyncio.sleep(self._reconnect_grace_period)
+        if self._detached_clients.get(client_id) is detached:
+            del self._detached_clients[client_id]
+            logger.info(f"Client {client_id} did not reconnect, ending its session.")
+            await self._end_session(client_id)
+
+    async def _end_session(self, client_id: ClientConnectionId) -> None:
+        # Cancel pending requests sent to this client.
+        for future in self._pending_responses.pop(client_id, {}).values():
+            future.cancel()
+        # Remove the client id from the agent type to client id mapping.
+        await self._on_client_disconnect(client_id)
+
+    def client_send_stats(self) -> Dict[ClientConnectionId, ClientSendStats]:
+        """Get the state of the queue of the messages sent to each connected client, e.g., to find slow clients."""
+        return {client_id: connection.stats for client_id, connection in self._data_connections.items()}
+
+    def _get_data_connection(
+        self, client_id: ClientConnectionId
+    ) -> ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message] | HostPeerLink | _DetachedClient | None:
+        return (
+            self._data_connections.get(client_id)
+            or self._peer_links.get(client_id)
+            or self._detached_clients.get(client_id)
+        )
 
     async def OpenControlChannel(  # type: ignore
         self,
@@ -159,84 +466,221 @@ async def handle_callback(message: agent_worker_pb2.ControlMessage) -> None:
             async for message in connection:
                 yield message
         finally:
-            # Clean up the client connection.
-            del self._control_connections[client_id]
+            # Clean up the client connection, unless the client already reconnected.
+            if self._control_connections.get(client_id) is connection:
+                del self._control_connections[client_id]
+                for message in self._pending_control_requests.pop(client_id, {}).values():
+                    await self._reply_control_error(message, f"Client {client_id} disconnected.")
 
     async def _on_client_disconnect(self, client_id: ClientConnectionId) -> None:
         async with self._agent_type_to_client_id_lock:
-            agent_types = [agent_type for agent_type, id_ in self._agent_type_to_client_id.items() if id_ == client_id]
-            for agent_type in agent_types:
-                logger.info(f"Removing agent type {agent_type} from agent type to client id mapping")
-                del self._agent_type_to_client_id[agent_type]
-            for sub_id in self._client_id_to_subscription_id_mapping.get(client_id, set()):
-                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {id}")
+            for agent_type, client_ids in list(self._agent_type_to_client_ids.items()):
+                if client_id not in client_ids:
+                    continue
+                logger.info(f"Removing client {client_id} from the clients of agent type {agent_type}")
+                remaining_client_ids = [id_ for id_ in client_ids if id_ != client_id]
+                if remaining_client_ids:
+                    self._agent_type_to_client_ids[agent_type] = remaining_client_ids
+                else:
+                    del self._agent_type_to_client_ids[agent_type]
+            for transfer_key in [key for key in self._state_transfer_client_ids if key[0] == client_id]:
+                del self._state_transfer_client_ids[transfer_key]
+            for sub_id in self._client_id_to_subscription_id_mapping.pop(client_id, set()):
+                if not self._release_subscription(sub_id, client_id):
+                    # The subscription is still used by other workers of a scale-out agent type.
+                    continue
+                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {sub_id}")
                 try:
                     await self._subscription_manager.remove_subscription(sub_id)
                 # Catch and ignore if the subscription does not exist.
                 except ValueError:
                     continue
+                if not _is_peer(client_id):
+                    for link in self._peer_links.values():
+                        link.remove_subscription(sub_id)
+            # Reset the routes once the subscriptions are removed: events published while the removal was
+            # awaited may have cached routes that still include the client.
+            self._topic_routes = {}
         logger.info(f"Client {client_id} disconnected successfully")
 
+    def _get_client_id(self, agent_id: AgentId, local_only: bool = False) -> ClientConnectionId | None:
+        """Get the client that hosts the agent, according to the placement policy of its type.
+        If `local_only` is True, peer hosts are not considered."""
+        client_ids = self._agent_type_to_client_ids.get(agent_id.type)
+        if client_ids and local_only:
+            client_ids = [client_id for client_id in client_ids if not _is_peer(client_id)]
+        if not client_ids:
+            return None
+        if len(client_ids) == 1:
+            return client_ids[0]
+        if self._scale_out_agent_types.get(agent_id.type) == "least_loaded":
+            return min(client_ids, key=lambda client_id: len(self._pending_responses.get(client_id, {})))
+        return max(client_ids, key=lambda client_id: _placement_score(client_id, agent_id.key))
+
+    def _release_subscription(self, subscription_id: str, client_id: ClientConnectionId) -> bool:
+        """Remove the client from the clients of the subscription.
+        Returns whether the subscription has no clients left and should be removed."""
+        client_ids = self._subscription_id_to_client_ids.get(subscription_id)
+        if client_ids is not None:
+            client_ids.discard(client_id)
+            if client_ids:
+                return False
+            del self._subscription_id_to_client_ids[subscription_id]
+        for alias, id_ in list(self._subscription_id_aliases.items()):
+            if id_ == subscription_id:
+                del self._subscription_id_aliases[alias]
+        return True
+
+    def _add_peer_link(self, link: HostPeerLink) -> None:
+        """Add a connected peer link, and register the agent types and subscriptions of the workers with the peer."""
+        self._peer_links[link.link_id] = link
+        for agent_type, client_ids in self._agent_type_to_client_ids.items():
+            if any(not _is_peer(client_id) for client_id in client_ids):
+                link.register_agent(agent_type)
+        subscription_ids: Set[str] = set()
+        for client_id, ids in self._client_id_to_subscription_id_mapping.items():
+            if not _is_peer(client_id):
+                subscription_ids.update(ids)
+        for subscription in self._subscription_manager.subscriptions:
+            if subscription.id in subscription_ids:
+                link.add_subscription(subscription)
+
+    def _remove_peer_link(self, link: HostPeerLink) -> None:
+        self._peer_links.pop(link.link_id, None)
+
+    async def _receive_peer_message(self, link_id: str, message: agent_worker_pb2.Message) -> None:
+        """Handle a message that a peer host sent on a link, which is for the workers of this host."""
+        oneofcase = message.WhichOneof("message")
+        match oneofcase:
+            case "request":
+                task = asyncio.create_task(self._process_request(message.request, link_id, local_only=True))
+            case "cloudEvent":
+                task = asyncio.create_task(self._process_event(message.cloudEvent, local_only=True))
+            case _:
+                logger.warning(f"Unexpected message from peer link {link_id}: {oneofcase}")
+                return
+        self._background_tasks.add(task)
+        task.add_done_callback(self._raise_on_exception)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _raise_on_exception(self, task: Task[Any]) -> None:
         exception = task.exception()
         if exception is not None:
             raise exception
 
-    async def _receive_message(self, client_id: ClientConnectionId, message: agent_worker_pb2.Message) -> None:
-        logger.info(f"Received message from client {client_id}: {message}")
+    async def _receive_message(
+        self,
+        client_id: ClientConnectionId,
+        message: agent_worker_pb2.Message,
+        in_flight: asyncio.Semaphore | None = None,
+    ) -> None:
+        sequence_number = get_sequence_number(message, remove=True)
+        if sequence_number is not None:
+            # Drop the messages sent again by a reconnected client that were already received.
+            if sequence_number <= self._sequence_numbers.get(client_id, 0):
+                logger.debug(f"Dropping message {sequence_number} of client {client_id}, which was already received.")
+                return
+            self._sequence_numbers[client_id] = sequence_number
+            self._sequence_numbers.move_to_end(client_id)
+            if len(self._sequence_numbers) > _constants.MAX_TRACKED_CLIENTS:
+                self._sequence_numbers.popitem(last=False)
         oneofcase = message.WhichOneof("message")
+        if oneofcase is None:
+            logger.warning("Received empty message")
+            return
+        if in_flight is not None:
+            # Wait for a message of the client to be delivered, which stops reading from the client.
+            await in_flight.acquire()
         match oneofcase:
             case "request":
                 request: agent_worker_pb2.RpcRequest = message.request
                 task = asyncio.create_task(self._process_request(request, client_id))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._raise_on_exception)
-                task.add_done_callback(self._background_tasks.discard)
             case "response":
                 response: agent_worker_pb2.RpcResponse = message.response
                 task = asyncio.create_task(self._process_response(response, client_id))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._raise_on_exception)
-                task.add_done_callback(self._background_tasks.discard)
-            case "cloudEvent":
+            case _:
                 task = asyncio.create_task(self._process_event(message.cloudEvent))
-                self._background_tasks.add(task)
-                task.add_done_callback(self._raise_on_exception)
-                task.add_done_callback(self._background_tasks.discard)
-            case None:
-                logger.warning("Received empty message")
+        self._background_tasks.add(task)
+        task.add_done_callback(self._raise_on_exception)
+        task.add_done_callback(self._background_tasks.discard)
+        if in_flight is not None:
+            task.add_done_callback(lambda _: in_flight.release())
 
     async def _receive_control_message(
         self, client_id: ClientConnectionId, message: agent_worker_pb2.ControlMessage
     ) -> None:
-        logger.info(f"Received message from client {client_id}: {message}")
         destination = message.destination
+        is_chunk = message.rpc_id.endswith(_constants.STATE_CHUNK_RPC_ID_SUFFIX)
         if destination.startswith("agentid="):
             agent_id = AgentId.from_str(destination[len("agentid=") :])
-            target_client_id = self._agent_type_to_client_id.get(agent_id.type)
+            # The workers of a "least_loaded" agent type can change between the chunks of a state,
+            # so the chunks and the final message go to the client placed for the first chunk.
+            transfer_key = (client_id, message.rpc_id.removesuffix(_constants.STATE_CHUNK_RPC_ID_SUFFIX))
+            if is_chunk:
+                target_client_id = self._state_transfer_client_ids.get(transfer_key) or self._get_client_id(agent_id)
+                if target_client_id is not None:
+                    self._state_transfer_client_ids[transfer_key] = target_client_id
+            else:
+                target_client_id = self._state_transfer_client_ids.pop(transfer_key, None) or self._get_client_id(
+                    agent_id
+                )
             if target_client_id is None:
                 logger.error(f"Agent client id not found for agent type {agent_id.type}.")
+                await self._reply_control_error(message, f"Agent type {agent_id.type} not found.")
                 return
         elif destination.startswith("clientid="):
             target_client_id = destination[len("clientid=") :]
+            # The client responded to a state request forwarded to it.
+            self._pending_control_requests.get(client_id, {}).pop(message.rpc_id, None)
         else:
             logger.error(f"Invalid destination {destination}")
+            await self._reply_control_error(message, f"Invalid destination {destination}.")
             return
 
         target_send_queue = self._control_connections.get(target_client_id)
         if target_send_queue is None:
             logger.error(f"Client {target_client_id} not found, failed to deliver message.")
+            await self._reply_control_error(message, f"Client {target_client_id} not found.")
             return
+        if destination.startswith("agentid=") and not is_chunk and message.HasField("respond_to"):
+            self._pending_control_requests.setdefault(target_client_id, {})[message.rpc_id] = message
         await target_send_queue.send(message)
 
-    async def _process_request(self, request: agent_worker_pb2.RpcRequest, client_id: ClientConnectionId) -> None:
+    async def _reply_control_error(self, message: agent_worker_pb2.ControlMessage, error: str) -> None:
+        """Reply with an error to a state request that cannot be delivered, so that the requester does not wait."""
+        if not message.HasField("respond_to") or not message.respond_to.startswith("clientid="):
+            return
+        if message.rpcMessage.Is(agent_worker_pb2.SaveStateRequest.DESCRIPTOR):
+            response: agent_worker_pb2.SaveStateResponse | agent_worker_pb2.LoadStateResponse = (
+                agent_worker_pb2.SaveStateResponse(error=error)
+            )
+        elif message.rpcMessage.Is(agent_worker_pb2.LoadStateRequest.DESCRIPTOR):
+            response = agent_worker_pb2.LoadStateResponse(error=error)
+        else:
+            return
+        # Chunks of a request are not answered, only its final message.
+        if message.rpc_id.endswith(_constants.STATE_CHUNK_RPC_ID_SUFFIX):
+            return
+        respond_to_queue = self._control_connections.get(message.respond_to[len("clientid=") :])
+        if respond_to_queue is None:
+            return
+        rpc_message = any_pb2.Any()
+        rpc_message.Pack(response)
+        await respond_to_queue.send(
+            agent_worker_pb2.ControlMessage(
+                rpc_id=message.rpc_id, destination=message.respond_to, rpcMessage=rpc_message
+            )
+        )
+
+    async def _process_request(
+        self, request: agent_worker_pb2.RpcRequest, client_id: ClientConnectionId, local_only: bool = False
+    ) -> None:
         # Deliver the message to a client given the target agent type.
-        async with self._agent_type_to_client_id_lock:
-            target_client_id = self._agent_type_to_client_id.get(request.target.type)
+        target_client_id = self._get_client_id(AgentId(request.target.type, request.target.key), local_only)
         if target_client_id is None:
             logger.error(f"Agent {request.target.type} not found, failed to deliver message.")
             return
-        target_send_queue = self._data_connections.get(target_client_id)
+        target_send_queue = self._get_data_connection(target_client_id)
         if target_send_queue is None:
             logger.error(f"Client {target_client_id} not found, failed to deliver message.")
             return
@@ -257,7 +701,7 @@ async def _wait_and_send_response(
     ) -> None:
         response = await future
         message = agent_worker_pb2.Message(response=response)
-        send_queue = self._data_connections.get(client_id)
+        send_queue = self._get_data_connection(client_id)
         if send_queue is None:
             logger.error(f"Client {client_id} not found, failed to send response message.")
             return
@@ -265,24 +709,68 @@ async def _wait_and_send_response(
 
     async def _process_response(self, response: agent_worker_pb2.RpcResponse, client_id: ClientConnectionId) -> None:
         # Setting the result of the future will send the response back to the original sender.
-        future = self._pending_responses[client_id].pop(response.request_id)
+        future = self._pending_responses.get(client_id, {}).pop(response.request_id, None)
+        if future is None or future.done():
+            # The request was dropped when the session of the client ended, or it was answered already.
+            logger.warning(f"Received a response to an unknown request {response.request_id} from client {client_id}.")
+            return
         future.set_result(response)
 
-    async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
+    async def _process_event(self, event: cloudevent_pb2.CloudEvent, local_only: bool = False) -> None:
         topic_id = TopicId(type=event.type, source=event.source)
+        if _constants.RECIPIENTS_ATTR in event.attributes:
+            # A peer host placed the recipients of agent types that run on many workers.
+            placed_recipients = set(json.loads(event.attributes[_constants.RECIPIENTS_ATTR].ce_string))
+            route = await self._route_topic(topic_id, local_only, placed_recipients)
+        else:
+            route = self._topic_routes.get((topic_id, local_only)) or await self._route_topic(topic_id, local_only)
+        # Deliver the event to clients concurrently, so that a slow client does not delay the others.
+        sends: List[Awaitable[None]] = []
+        scale_out = route.scale_out
+        for client_id, client_agent_ids in route.client_recipients.items():
+            send_queue = self._get_data_connection(client_id)
+            if send_queue is None:
+                logger.error(f"Client {client_id} not found, failed to deliver event.")
+                continue
+            if scale_out:
+                # The workers of a scale-out agent type subscribe to the same topics, so the event
+                # names the recipients placed on each client, which delivers it to those only.
+                client_event = cloudevent_pb2.CloudEvent()
+                client_event.CopyFrom(event)
+                client_event.attributes[_constants.RECIPIENTS_ATTR].ce_string = json.dumps(
+                    [str(agent_id) for agent_id in client_agent_ids]
+                )
+                sends.append(send_queue.send(agent_worker_pb2.Message(cloudEvent=client_event)))
+            else:
+                sends.append(send_queue.send(agent_worker_pb2.Message(cloudEvent=event)))
+        await asyncio.gather(*sends)
+
+    async def _route_topic(
+        self, topic_id: TopicId, local_only: bool, placed_recipients: Set[str] | None = None
+    ) -> _TopicRoute:
+        """Get the clients of the recipients of the events of a topic, and cache the route unless it
+        depends on the event, i.e., on the recipients placed by a peer host or on the load of the clients."""
+        # Registrations that change while the route is computed replace this table, which drops the route.
+        routes = self._topic_routes
         recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
-        # Get the client ids of the recipients.
-        async with self._agent_type_to_client_id_lock:
-            client_ids: Set[ClientConnectionId] = set()
-            for recipient in recipients:
-                client_id = self._agent_type_to_client_id.get(recipient.type)
-                if client_id is not None:
-                    client_ids.add(client_id)
-                else:
-                    logger.error(f"Agent {recipient.type} and its client not found for topic {topic_id}.")
-        # Deliver the event to clients.
-        for client_id in client_ids:
-            await self._data_connections[client_id].send(agent_worker_pb2.Message(cloudEvent=event))
+        if placed_recipients is not None:
+            recipients = [recipient for recipient in recipients if str(recipient) in placed_recipients]
+        cacheable = placed_recipients is None and len(routes) < _constants.MAX_CACHED_TOPIC_ROUTES
+        client_recipients: Dict[ClientConnectionId, List[AgentId]] = {}
+        scale_out = False
+        for recipient in dict.fromkeys(recipients):
+            client_id = self._get_client_id(recipient, local_only)
+            if client_id is not None:
+                client_recipients.setdefault(client_id, []).append(recipient)
+                scale_out = scale_out or recipient.type in self._scale_out_agent_types
+                cacheable = cacheable and self._scale_out_agent_types.get(recipient.type) != "least_loaded"
+            else:
+                logger.error(f"Agent {recipient.type} and its client not found for topic {topic_id}.")
+                cacheable = False
+        route = _TopicRoute(client_recipients=client_recipients, scale_out=scale_out)
+        if cacheable:
+            routes[(topic_id, local_only)] = route
+        return route
 
     async def RegisterAgent(  # type: ignore
         self,
@@ -294,14 +782,19 @@ async def RegisterAgent(  # type: ignore
         client_id = await get_client_id_or_abort(context)
 
         async with self._agent_type_to_client_id_lock:
-            if request.type in self._agent_type_to_client_id:
-                existing_client_id = self._agent_type_to_client_id[request.type]
+            client_ids = self._agent_type_to_client_ids.get(request.type, [])
+            if client_ids and request.type not in self._scale_out_agent_types and client_id not in client_ids:
+                existing_client_id = client_ids[0]
                 await context.abort(
                     grpc.StatusCode.INVALID_ARGUMENT,
                     f"Agent type {request.type} already registered with client {existing_client_id}.",
                 )
-            else:
-                self._agent_type_to_client_id[request.type] = client_id
+            elif client_id not in client_ids:
+                self._agent_type_to_client_ids[request.type] = [*client_ids, client_id]
+                self._topic_routes = {}
+                if not _is_peer(client_id) and not any(not _is_peer(id_) for id_ in client_ids):
+                    for link in self._peer_links.values():
+                        link.register_agent(request.type)
 
         return agent_worker_pb2.RegisterAgentTypeResponse()
 
@@ -315,12 +808,35 @@ async def AddSubscription(  # type: ignore
         client_id = await get_client_id_or_abort(context)
 
         subscription = subscription_from_proto(request.subscription)
+        subscription_id = subscription.id
+        client_subscription_ids = self._client_id_to_subscription_id_mapping.get(client_id, set())
+        if self._subscription_id_aliases.get(subscription_id, subscription_id) in client_subscription_ids:
+            # The client added the subscription again, e.g., after a reconnection.
+            return agent_worker_pb2.AddSubscriptionResponse()
         try:
             await self._subscription_manager.add_subscription(subscription)
-            subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
-            subscription_ids.add(subscription.id)
         except ValueError as e:
-            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            # The workers of a scale-out agent type share the subscriptions of the type.
+            existing = next(
+                (
+                    sub
+                    for sub in self._subscription_manager.subscriptions
+                    if sub == subscription and getattr(sub, "agent_type", None) in self._scale_out_agent_types
+                ),
+                None,
+            )
+            if existing is None:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            else:
+                subscription_id = existing.id
+                if subscription.id != existing.id:
+                    self._subscription_id_aliases[subscription.id] = existing.id
+        self._client_id_to_subscription_id_mapping.setdefault(client_id, set()).add(subscription_id)
+        self._subscription_id_to_client_ids.setdefault(subscription_id, set()).add(client_id)
+        self._topic_routes = {}
+        if not _is_peer(client_id):
+            for link in self._peer_links.values():
+                link.add_subscription(subscription)
         return agent_worker_pb2.AddSubscriptionResponse()
 
     async def RemoveSubscription(  # type: ignore
@@ -330,8 +846,15 @@ async def RemoveSubscription(  # type: ignore
             agent_worker_pb2.RemoveSubscriptionRequest, agent_worker_pb2.RemoveSubscriptionResponse
         ],
     ) -> agent_worker_pb2.RemoveSubscriptionResponse:
-        _client_id = await get_client_id_or_abort(context)
-        await self._subscription_manager.remove_subscription(request.id)
+        client_id = await get_client_id_or_abort(context)
+        subscription_id = self._subscription_id_aliases.pop(request.id, request.id)
+        self._client_id_to_subscription_id_mapping.get(client_id, set()).discard(subscription_id)
+        if self._release_subscription(subscription_id, client_id):
+            await self._subscription_manager.remove_subscription(subscription_id)
+            self._topic_routes = {}
+            if not _is_peer(client_id):
+                for link in self._peer_links.values():
+                    link.remove_subscription(request.id)
         return agent_worker_pb2.RemoveSubscriptionResponse()
 
     async def GetSubscriptions(  # type: ignore
@@ -1,9 +1,11 @@
+import asyncio
+import json
 import re
-from typing import Any, Literal, Optional, Type
+from typing import Any, AsyncGenerator, Literal, Optional, Type
 
 import httpx
 from autogen_core import CancellationToken, Component
-from autogen_core.tools import BaseTool
+from autogen_core.tools import BaseStreamTool
 from json_schema_to_pydantic import create_model
 from pydantic import BaseModel, Field
 from typing_extensions import Self
@@ -53,9 +55,35 @@ class HttpToolConfig(BaseModel):
     """
     The type of response to return from the tool.
     """
+    timeout: Optional[float] = 5.0
+    """
+    The timeout in seconds for connecting, reading, writing and acquiring a connection from the pool.
+    None disables the timeout.
+    """
+    max_connections: Optional[int] = 100
+    """
+    The maximum number of concurrent connections held by the tool's connection pool.
+    """
+    max_keepalive_connections: Optional[int] = 20
+    """
+    The maximum number of idle connections kept alive for reuse.
+    """
+    http2: bool = False
+    """
+    Whether to use HTTP/2 if the server supports it. Requires the :code:`h2` package.
+    """
+    retries: int = 0
+    """
+    The number of times to retry a request that fails to connect.
+    """
+    stream: bool = False
+    """
+    Whether to stream the response body, yielding text chunks as they are received
+    before the full response is returned.
+    """
 
 
-class HttpTool(BaseTool[BaseModel, Any], Component[HttpToolConfig]):
+class HttpTool(BaseStreamTool[BaseModel, Any, Any], Component[HttpToolConfig]):
     """A wrapper for using an HTTP server as a tool.
 
     Args:
@@ -73,6 +101,19 @@ class HttpTool(BaseTool[BaseModel, Any], Component[HttpToolConfig]):
             Path parameters must also be included in the schema and must be strings.
         return_type (Literal["text", "json"], optional): The type of response to return from the tool.
             Defaults to "text".
+        timeout (float, optional): The timeout in seconds for each phase of a request. Defaults to 5.
+            Set to None to disable the timeout.
+        max_connections (int, optional): The maximum number of concurrent connections. Defaults to 100.
+        max_keepalive_connections (int, optional): The maximum number of idle connections kept alive
+            for reuse. Defaults to 20.
+        http2 (bool, optional): Whether to use HTTP/2 when the server supports it. Requires the
+            :code:`h2` package. Defaults to False.
+        retries (int, optional): The number of times to retry a request that fails to connect. Defaults to 0.
+        stream (bool, optional): Whether to stream the response body. When enabled, :meth:`run_stream`
+            yields text chunks as they are received, followed by the full response. Defaults to False.
+
+    The tool keeps a pooled HTTP client that is reused across calls, so repeated calls to the
+    same server share connections. The client is created on first use and released by :meth:`close`.
 
     .. note::
         This tool requires the :code:`http-tool` extra for the :code:`autogen-ext` package.
@@ -148,6 +189,12 @@ def __init__(
         scheme: Literal["http", "https"] = "http",
         method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "POST",
         return_type: Literal["text", "json"] = "text",
+        timeout: Optional[float] = 5.0,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        http2: bool = False,
+        retries: int = 0,
+        stream: bool = False,
     ) -> None:
         self.server_params = HttpToolConfig(
             name=name,
@@ -160,6 +207,12 @@ def __init__(
             headers=headers,
             json_schema=json_schema,
             return_type=return_type,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+            retries=retries,
+            stream=stream,
         )
 
         # Use regex to find all path parameters, we will need those later to template the path
@@ -174,6 +227,9 @@ def __init__(
 
         super().__init__(input_model, base_return_type, name, description)
 
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def _to_config(self) -> HttpToolConfig:
         copied_config = self.server_params.model_copy()
         return copied_config
@@ -183,15 +239,56 @@ def _from_config(cls, config: HttpToolConfig) -> Self:
         copied_config = config.model_copy().model_dump()
         return cls(**copied_config)
 
-    async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> Any:
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it on first use.
+
+        The connections of a client are bound to the event loop they were opened on,
+        so a new client is created if the tool is used from a different loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and self._client_loop is not None and not self._client.is_closed:
+                self._close_stale_client(self._client, self._client_loop)
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self.server_params.max_connections,
+                    max_keepalive_connections=self.server_params.max_keepalive_connections,
+                ),
+                http2=self.server_params.http2,
+                retries=self.server_params.retries,
+            )
+            self._client = httpx.AsyncClient(transport=transport, timeout=self.server_params.timeout)
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    def _close_stale_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a client of another event loop on that loop. The connections of a client
+        of a closed loop cannot be closed, and are released when the client is garbage collected."""
+        if loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(loop.create_task, client.aclose())
+        except RuntimeError:
+            # The loop was closed in the meantime.
+            pass
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client. A new client is created if the tool is used again."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            self._client_loop = None
+            await client.aclose()
+
+    async def run_stream(self, args: BaseModel, cancellation_token: CancellationToken) -> AsyncGenerator[Any, None]:
         """Execute the HTTP tool with the given arguments.
 
         Args:
             args: The validated input arguments
             cancellation_token: Token for cancelling the operation
 
-        Returns:
-            The response body from the HTTP call in JSON format
+        Yields:
+            The text chunks of the response body as they are received if streaming is enabled,
+            followed by the response body in the configured return type
 
         Raises:
             Exception: If tool execution fails
@@ -211,23 +308,31 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
             port=self.server_params.port,
             path=path,
         )
-        async with httpx.AsyncClient() as client:
-            match self.server_params.method:
-                case "GET":
-                    response = await client.get(url, headers=self.server_params.headers, params=model_dump)
-                case "PUT":
-                    response = await client.put(url, headers=self.server_params.headers, json=model_dump)
-                case "DELETE":
-                    response = await client.delete(url, headers=self.server_params.headers, params=model_dump)
-                case "PATCH":
-                    response = await client.patch(url, headers=self.server_params.headers, json=model_dump)
-                case _:  # Default case POST
-                    response = await client.post(url, headers=self.server_params.headers, json=model_dump)
+        client = self._get_client()
+        method = self.server_params.method or "POST"
+        # GET and DELETE send the arguments as query parameters, other methods as a JSON body.
+        if method in ("GET", "DELETE"):
+            request = client.build_request(method, url, headers=self.server_params.headers, params=model_dump)
+        else:
+            request = client.build_request(method, url, headers=self.server_params.headers, json=model_dump)
+
+        response = await client.send(request, stream=self.server_params.stream)
+        if self.server_params.stream:
+            try:
+                chunks: list[str] = []
+                async for chunk in response.aiter_text():
+                    chunks.append(chunk)
+                    yield chunk
+            finally:
+                await response.aclose()
+            text = "".join(chunks)
+        else:
+            text = response.text
 
         match self.server_params.return_type:
             case "text":
-                return response.text
+                yield text
             case "json":
-                return response.json()
+                yield json.loads(text)
             case _:
                 raise ValueError(f"Invalid return type: {self.server_params.return_type}")
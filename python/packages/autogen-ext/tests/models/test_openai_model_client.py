@@ -500,6 +500,19 @@ async def run(self, args: MyArgs, cancellation_token: CancellationToken) -> MyRe
     assert converted_tool_schema[0] == converted_tool_schema[1]
 
 
+def test_convert_tools_reuses_cached_tool_param() -> None:
+    def my_function(arg: str) -> str:
+        return arg
+
+    tool = FunctionTool(my_function, description="Function tool.")
+
+    first = convert_tools([tool])
+    second = convert_tools([tool])
+
+    assert first[0] is second[0]
+    assert first[0] == convert_tools([tool.schema])[0]
+
+
 @pytest.mark.asyncio
 async def test_json_mode(monkeypatch: pytest.MonkeyPatch) -> None:
     model = "gpt-4.1-nano-2025-04-14"
@@ -1,7 +1,9 @@
 import asyncio
+import itertools
 import logging
 import os
-from typing import Any, List
+from pathlib import Path
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Mapping, Tuple, cast
 
 import pytest
 from autogen_core import (
@@ -17,10 +19,11 @@
     TypeSubscription,
     default_subscription,
     event,
+    rpc,
     try_get_known_serializers_for_type,
     type_subscription,
 )
-from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost, MessageBatching
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -84,6 +87,917 @@ async def test_agent_types_must_be_unique_multiple_workers() -> None:
     await host.stop()
 
 
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_scale_out_agent_type_multiple_workers() -> None:
+    host_address = "localhost:50062"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, scale_out_agent_types={"name1": "key_hash"})
+    host.start()
+
+    publisher = GrpcWorkerAgentRuntime(host_address=host_address)
+    await publisher.start()
+    publisher.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    workers: List[GrpcWorkerAgentRuntime] = []
+    for _ in range(2):
+        worker = GrpcWorkerAgentRuntime(host_address=host_address)
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        await worker.register_factory(
+            type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+        )
+        await worker.add_subscription(TypeSubscription("default", "name1"))
+        workers.append(worker)
+
+    keys = [f"key{i}" for i in range(20)]
+    for key in keys:
+        await publisher.publish_message(MessageType(), topic_id=TopicId("default", key))
+    await asyncio.sleep(2)
+
+    # Each agent runs on one of the workers and receives each message once.
+    calls_per_worker = [0, 0]
+    first_worker_calls: Dict[str, int] = {}
+    for key in keys:
+        calls = [
+            (await worker.try_get_underlying_agent_instance(AgentId("name1", key), LoopbackAgent)).num_calls
+            for worker in workers
+        ]
+        assert sorted(calls) == [0, 1]
+        calls_per_worker[calls.index(1)] += 1
+        first_worker_calls[key] = calls[0]
+    assert all(calls > 0 for calls in calls_per_worker)
+
+    # When a worker leaves, its agents are placed on the remaining worker.
+    await workers[1].stop()
+    await asyncio.sleep(1)
+    for key in keys:
+        await publisher.publish_message(MessageType(), topic_id=TopicId("default", key))
+    await asyncio.sleep(2)
+    for key in keys:
+        agent = await workers[0].try_get_underlying_agent_instance(AgentId("name1", key), LoopbackAgent)
+        assert agent.num_calls == first_worker_calls[key] + 1
+
+    await workers[0].stop()
+    await publisher.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_peer_hosts() -> None:
+    host1_address = "localhost:50063"
+    host2_address = "localhost:50064"
+    host1 = GrpcWorkerAgentRuntimeHost(address=host1_address, peer_addresses=[host2_address])
+    host2 = GrpcWorkerAgentRuntimeHost(address=host2_address, peer_addresses=[host1_address])
+    host1.start()
+    host2.start()
+
+    # Each worker connects to a different host.
+    worker1 = GrpcWorkerAgentRuntime(host_address=host1_address)
+    await worker1.start()
+    worker1.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    worker1.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+
+    worker2 = GrpcWorkerAgentRuntime(host_address=host2_address)
+    await worker2.start()
+    worker2.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    worker2.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.add_subscription(TypeSubscription("default", "name2"))
+
+    # Let the hosts connect to each other.
+    await asyncio.sleep(2)
+
+    # A published message is delivered to the agents of both hosts once.
+    await worker1.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(2)
+    worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 1
+    worker2_agent = await worker2.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+    assert worker2_agent.num_calls == 1
+
+    # A direct message is forwarded to the host of the recipient and the response is returned.
+    response = await worker2.send_message(ContentMessage(content="Hello!"), recipient=AgentId("name1", "default"))
+    assert response == ContentMessage(content="Hello!")
+    assert worker1_agent.num_calls == 2
+
+    await worker1.stop()
+    await worker2.stop()
+    await host1.stop()
+    await host2.stop()
+
+
+class StatefulAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent with a state.")
+        self.data = ""
+
+    async def save_state(self) -> Mapping[str, Any]:
+        return {"data": self.data}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        self.data = state["data"]
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_remote_agent_state() -> None:
+    host_address = "localhost:50065"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker1.start()
+    await worker1.register_factory(
+        type=AgentType("stateful"), agent_factory=lambda: StatefulAgent(), expected_class=StatefulAgent
+    )
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker2.start()
+    # Transfer the states in small chunks.
+    worker1._state_chunk_size = 16  # type: ignore[reportPrivateUsage]
+    worker2._state_chunk_size = 16  # type: ignore[reportPrivateUsage]
+
+    # Load and save the state of an agent of another worker.
+    data = "x" * 100
+    await worker2.agent_load_state(AgentId("stateful", "a"), {"data": data})
+    agent = await worker1.try_get_underlying_agent_instance(AgentId("stateful", "a"), StatefulAgent)
+    assert agent.data == data
+    agent.data = "y" * 32
+    assert await worker2.agent_save_state(AgentId("stateful", "a")) == {"data": "y" * 32}
+
+    # The worker saves and loads the states of its own agents.
+    assert await worker1.save_state() == {"stateful/a": {"data": "y" * 32}}
+    await worker1.load_state({"stateful/a": {"data": "z"}, "stateful/b": {"data": "w"}})
+    assert agent.data == "z"
+    assert await worker2.agent_save_state(AgentId("stateful", "b")) == {"data": "w"}
+
+    # The state of an agent of an unknown type cannot be saved.
+    with pytest.raises(RuntimeError):
+        await worker2.agent_save_state(AgentId("unknown", "a"))
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_remote_agent_state_chunks_go_to_one_worker() -> None:
+    host_address = "localhost:50077"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, scale_out_agent_types={"stateful": "least_loaded"})
+    host.start()
+
+    workers: List[GrpcWorkerAgentRuntime] = []
+    for _ in range(2):
+        worker = GrpcWorkerAgentRuntime(host_address=host_address)
+        await worker.start()
+        await worker.register_factory(
+            type=AgentType("stateful"), agent_factory=lambda: StatefulAgent(), expected_class=StatefulAgent
+        )
+        workers.append(worker)
+    sender = GrpcWorkerAgentRuntime(host_address=host_address)
+    await sender.start()
+    sender._state_chunk_size = 16  # type: ignore[reportPrivateUsage]
+
+    # The least loaded worker changes between the chunks of the state.
+    servicer = host._servicer  # type: ignore[reportPrivateUsage]
+    placements = itertools.cycle(list(servicer._agent_type_to_client_ids["stateful"]))  # type: ignore[reportPrivateUsage]
+    servicer._get_client_id = lambda agent_id, local_only=False: next(placements)  # type: ignore
+
+    data = "x" * 100
+    await sender.agent_load_state(AgentId("stateful", "a"), {"data": data})
+    agents = [
+        await worker.try_get_underlying_agent_instance(AgentId("stateful", "a"), StatefulAgent) for worker in workers
+    ]
+    assert sorted(agent.data for agent in agents) == ["", data]
+
+    await sender.stop()
+    for worker in workers:
+        await worker.stop()
+    await host.stop()
+
+
+class BlockingStateAgent(RoutedAgent):
+    def __init__(self, release: asyncio.Event) -> None:
+        super().__init__("An agent that saves its state once released.")
+        self._release = release
+
+    async def save_state(self) -> Mapping[str, Any]:
+        await self._release.wait()
+        return {}
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_remote_agent_state_worker_disconnects() -> None:
+    host_address = "localhost:50084"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    proxy = TcpProxy(50084)
+    await proxy.start(50085)
+
+    # The first worker connects through the proxy, and its agent does not respond to state requests.
+    release = asyncio.Event()
+    worker1 = GrpcWorkerAgentRuntime(host_address="localhost:50085", reconnect=False)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+    await worker1.register_factory(
+        type=AgentType("blocking"),
+        agent_factory=lambda: BlockingStateAgent(release),
+        expected_class=BlockingStateAgent,
+    )
+
+    # Without a response, the request fails after the timeout.
+    worker2._control_request_timeout = 0.5  # type: ignore[reportPrivateUsage]
+    with pytest.raises(RuntimeError):
+        await worker2.agent_save_state(AgentId("blocking", "a"))
+
+    # The host fails the request when the worker of the agent disconnects.
+    worker2._control_request_timeout = 60.0  # type: ignore[reportPrivateUsage]
+    save_task = asyncio.create_task(worker2.agent_save_state(AgentId("blocking", "b")))
+    await asyncio.sleep(0.5)
+    proxy.drop_connections()
+    with pytest.raises(RuntimeError, match="disconnected"):
+        await asyncio.wait_for(save_task, timeout=5)
+
+    release.set()
+    await worker1.stop()
+    await worker2.stop()
+    await proxy.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_agent_state_follows_placement() -> None:
+    host_address = "localhost:50083"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, scale_out_agent_types={"stateful": "key_hash"})
+    host.start()
+
+    workers: List[GrpcWorkerAgentRuntime] = []
+    for _ in range(2):
+        worker = GrpcWorkerAgentRuntime(host_address=host_address)
+        await worker.start()
+        await worker.register_factory(
+            type=AgentType("stateful"), agent_factory=lambda: StatefulAgent(), expected_class=StatefulAgent
+        )
+        workers.append(worker)
+
+    # The states loaded through the first worker go to the workers the host places the agents on.
+    servicer = host._servicer  # type: ignore[reportPrivateUsage]
+    placed_workers: List[GrpcWorkerAgentRuntime] = []
+    for i in range(8):
+        agent_id = AgentId("stateful", f"key{i}")
+        await workers[0].agent_load_state(agent_id, {"data": str(i)})
+        client_id = servicer._get_client_id(agent_id)  # type: ignore[reportPrivateUsage]
+        placed_worker = next(w for w in workers if w._host_connection.client_id == client_id)  # type: ignore
+        agent = await placed_worker.try_get_underlying_agent_instance(agent_id, StatefulAgent)
+        assert agent.data == str(i)
+        assert await workers[0].agent_save_state(agent_id) == {"data": str(i)}
+        placed_workers.append(placed_worker)
+    assert workers[1] in placed_workers
+
+    for worker in workers:
+        await worker.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_message_batching() -> None:
+    host_address = "localhost:50066"
+    batching = MessageBatching(window=0.01, compression="gzip", compression_min_bytes=256)
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, message_batching=batching)
+    host.start()
+
+    # The first worker batches the messages it sends, the second does not.
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address, message_batching=batching)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.add_subscription(TypeSubscription("default", "name2"))
+
+    # Events published together are batched by the first worker and by the host.
+    await asyncio.gather(
+        *[worker1.publish_message(MessageType(), topic_id=TopicId("default", "default")) for _ in range(20)]
+    )
+    await asyncio.sleep(2)
+    worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    worker2_agent = await worker2.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 20
+    assert worker2_agent.num_calls == 20
+
+    # Large messages are compressed, in both directions.
+    content = "Hello! " * 1000
+    response = await worker1.send_message(ContentMessage(content=content), recipient=AgentId("name2", "default"))
+    assert response == ContentMessage(content=content)
+    response = await worker2.send_message(ContentMessage(content=content), recipient=AgentId("name1", "default"))
+    assert response == ContentMessage(content=content)
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_host_ignores_unknown_response(caplog: pytest.LogCaptureFixture) -> None:
+    from autogen_ext.runtimes.grpc._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
+    from autogen_ext.runtimes.grpc.protos import agent_worker_pb2
+
+    # A response to a request that is not pending, e.g., of a client whose session ended, is logged and dropped.
+    servicer = GrpcWorkerAgentRuntimeHostServicer()
+    with caplog.at_level(logging.WARNING):
+        await servicer._process_response(agent_worker_pb2.RpcResponse(request_id="1"), "client")  # type: ignore[reportPrivateUsage]
+    assert "unknown request 1" in caplog.text
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_host_resumes_session_without_losing_messages() -> None:
+    from autogen_ext.runtimes.grpc._worker_runtime_host_servicer import (
+        GrpcWorkerAgentRuntimeHostServicer,
+        _DetachedClient,  # pyright: ignore[reportPrivateUsage]
+    )
+    from autogen_ext.runtimes.grpc.protos import agent_worker_pb2
+
+    class _Context:
+        def __init__(self) -> None:
+            self.sending_metadata = asyncio.Event()
+            self.metadata_sent = asyncio.Event()
+
+        def invocation_metadata(self) -> List[Tuple[str, str]]:
+            return [("client-id", "client")]
+
+        async def send_initial_metadata(self, metadata: Any) -> None:
+            self.sending_metadata.set()
+            await self.metadata_sent.wait()
+
+    async def idle_client() -> AsyncIterator[agent_worker_pb2.Message]:
+        await asyncio.Event().wait()
+        yield agent_worker_pb2.Message()
+
+    def message(request_id: str) -> agent_worker_pb2.Message:
+        return agent_worker_pb2.Message(request=agent_worker_pb2.RpcRequest(request_id=request_id))
+
+    # The client reconnects while the host buffers a message for it.
+    servicer = GrpcWorkerAgentRuntimeHostServicer(reconnect_grace_period=10.0)
+    detached = _DetachedClient("client")
+    await detached.send(message("buffered"))
+    servicer._detached_clients["client"] = detached  # pyright: ignore[reportPrivateUsage]
+    context = _Context()
+    stream = cast(
+        AsyncGenerator[agent_worker_pb2.Message, None],
+        servicer.OpenChannel(idle_client(), context),  # type: ignore[arg-type]
+    )
+    first = asyncio.create_task(stream.__anext__())
+
+    # A message sent while the host tells the client its session is resumed is queued after the buffered ones.
+    await context.sending_metadata.wait()
+    connection = servicer._get_data_connection("client")  # pyright: ignore[reportPrivateUsage]
+    assert connection is not None and connection is not detached
+    await connection.send(message("sent"))
+    context.metadata_sent.set()
+    assert (await first).request.request_id == "buffered"
+    assert (await stream.__anext__()).request.request_id == "sent"
+
+    await stream.aclose()
+    for task in list(servicer._background_tasks):  # pyright: ignore[reportPrivateUsage]
+        task.cancel()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_send_queue_overflow() -> None:
+    from autogen_ext.runtimes.grpc._worker_runtime_host_servicer import CallbackChannelConnection
+    from autogen_ext.runtimes.grpc.protos import agent_worker_pb2
+
+    async def idle_client() -> AsyncIterator[agent_worker_pb2.Message]:
+        await asyncio.Event().wait()
+        yield agent_worker_pb2.Message()
+
+    async def handle(message: agent_worker_pb2.Message) -> None:
+        pass
+
+    def message(request_id: str) -> agent_worker_pb2.Message:
+        return agent_worker_pb2.Message(request=agent_worker_pb2.RpcRequest(request_id=request_id))
+
+    # The oldest messages are dropped for a slow client.
+    connection = CallbackChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message](
+        idle_client(), "client", handle, max_queue_size=2, overflow="drop_oldest"
+    )
+    for i in range(3):
+        await connection.send(message(str(i)))
+    await asyncio.sleep(0.1)
+    stats = connection.stats
+    assert stats.queued == 2
+    assert stats.dropped == 1
+    assert stats.lag >= 0.1
+    assert (await connection.__anext__()).request.request_id == "1"
+
+    # A client that keeps up has no lag, and the host reports the stats of each worker.
+    host_address = "localhost:50070"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, max_send_queue_size=16, send_queue_overflow="disconnect")
+    host.start()
+    worker = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker.start()
+    worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker.add_subscription(TypeSubscription("default", "name1"))
+    for _ in range(10):
+        await worker.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(1)
+    stats_by_client = host.client_send_stats()
+    assert len(stats_by_client) == 1
+    stats = next(iter(stats_by_client.values()))
+    assert stats.queued == 0
+    assert stats.dropped == 0
+    assert stats.lag == 0.0
+
+    await worker.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_topic_routes_follow_registrations() -> None:
+    host_address = "localhost:50072"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+    topic_id = TopicId("default", "default")
+
+    # The route of the topic is cached by the first event.
+    await worker1.publish_message(MessageType(), topic_id=topic_id)
+    await asyncio.sleep(0.5)
+
+    # A new subscriber receives the events published after it subscribed.
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.add_subscription(TypeSubscription("default", "name2"))
+    await worker1.publish_message(MessageType(), topic_id=topic_id)
+    await asyncio.sleep(0.5)
+    worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    worker2_agent = await worker2.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 2
+    assert worker2_agent.num_calls == 1
+
+    # The events are no longer routed to a disconnected worker, and another worker can take its agent type.
+    await worker2.stop()
+    await asyncio.sleep(0.5)
+    worker3 = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker3.start()
+    worker3.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker3.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker3.add_subscription(TypeSubscription("default", "name2"))
+    await worker1.publish_message(MessageType(), topic_id=topic_id)
+    await asyncio.sleep(0.5)
+    worker3_agent = await worker3.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 3
+    assert worker3_agent.num_calls == 1
+
+    await worker1.stop()
+    await worker3.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_unix_domain_socket(tmp_path: Path) -> None:
+    host_address = f"unix:{tmp_path / 'host.sock'}"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.add_subscription(TypeSubscription("default", "name2"))
+
+    response = await worker1.send_message(ContentMessage(content="Hello!"), recipient=AgentId("name2", "default"))
+    assert response == ContentMessage(content="Hello!")
+    await worker2.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(0.5)
+    worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 1
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_payload_deserialization_offload() -> None:
+    host_address = "localhost:50073"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address, deserialization_offload_threshold=1024)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.add_subscription(TypeSubscription("default", "name2"))
+
+    # Large payloads are deserialized in a worker thread, small payloads on the event loop.
+    content = "Hello! " * 1000
+    response = await worker1.send_message(ContentMessage(content=content), recipient=AgentId("name2", "default"))
+    assert response == ContentMessage(content=content)
+    response = await worker1.send_message(ContentMessage(content="Hello!"), recipient=AgentId("name2", "default"))
+    assert response == ContentMessage(content="Hello!")
+    stats = worker2.payload_decoding_stats
+    assert stats.decoded == 2
+    assert stats.offloaded == 1
+    assert stats.seconds > 0
+
+    # The payload of an event is not deserialized by the worker of its sender, which has no other recipient.
+    await worker1.publish_message(
+        MessageType(), topic_id=TopicId("default", "default"), sender=AgentId("name1", "default")
+    )
+    await asyncio.sleep(0.5)
+    worker2_agent = await worker2.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+    assert worker2_agent.num_calls == 3
+    assert worker1.payload_decoding_stats.skipped == 1
+    assert worker1.payload_decoding_stats.decoded == 2
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+class TcpProxy:
+    """Forward the connections to a port, and drop them to simulate a network failure,
+    or pause forwarding to the clients to simulate clients that stop reading."""
+
+    def __init__(self, target_port: int) -> None:
+        self._target_port = target_port
+        self._writers: List[asyncio.StreamWriter] = []
+        self._server: asyncio.Server | None = None
+        self._forwarding_to_clients = asyncio.Event()
+        self._forwarding_to_clients.set()
+
+    async def start(self, port: int) -> None:
+        self._server = await asyncio.start_server(self._handle, "localhost", port)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        target_reader, target_writer = await asyncio.open_connection("localhost", self._target_port)
+        self._writers.extend([writer, target_writer])
+
+        async def pipe(source: asyncio.StreamReader, destination: asyncio.StreamWriter, to_client: bool) -> None:
+            try:
+                while data := await source.read(65536):
+                    if to_client:
+                        await self._forwarding_to_clients.wait()
+                    destination.write(data)
+                    await destination.drain()
+            except ConnectionError:
+                pass
+            finally:
+                destination.close()
+
+        await asyncio.gather(pipe(reader, target_writer, False), pipe(target_reader, writer, True))
+
+    def pause_clients(self) -> None:
+        self._forwarding_to_clients.clear()
+
+    def resume_clients(self) -> None:
+        self._forwarding_to_clients.set()
+
+    def drop_connections(self) -> None:
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def stop(self) -> None:
+        self.drop_connections()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_send_queue_overflow_disconnects_worker() -> None:
+    host_address = "localhost:50075"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, max_send_queue_size=4, send_queue_overflow="disconnect")
+    host.start()
+    proxy = TcpProxy(50075)
+    await proxy.start(50076)
+
+    # The first worker connects through the proxy, the second sends it events.
+    worker1 = GrpcWorkerAgentRuntime(host_address="localhost:50076", reconnect=False)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+    assert len(host.client_send_stats()) == 2
+
+    # The first worker stops reading, so the host cannot send it the events, and its queue overflows.
+    proxy.pause_clients()
+    content = "Hello! " * 10000
+    for _ in range(500):
+        await worker2.publish_message(ContentMessage(content=content), topic_id=TopicId("default", "default"))
+        if len(host.client_send_stats()) == 1:
+            break
+    await asyncio.sleep(0.5)
+    assert len(host.client_send_stats()) == 1
+
+    proxy.resume_clients()
+    await worker1.stop()
+    await worker2.stop()
+    await proxy.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_send_queue_block_pauses_sender() -> None:
+    host_address = "localhost:50078"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, max_send_queue_size=4, send_queue_overflow="block")
+    host.start()
+    proxy = TcpProxy(50078)
+    await proxy.start(50079)
+
+    # The first worker connects through the proxy, the second sends it events.
+    worker1 = GrpcWorkerAgentRuntime(host_address="localhost:50079")
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+
+    # The first worker stops reading, so the host stops reading the events of the second worker
+    # rather than holding them in delivery tasks.
+    proxy.pause_clients()
+    content = "Hello! " * 10000
+    for _ in range(300):
+        await worker2.publish_message(ContentMessage(content=content), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(1)
+    assert len(host._servicer._background_tasks) <= 4  # type: ignore[reportPrivateUsage]
+
+    # No event is dropped once the first worker reads again.
+    proxy.resume_clients()
+    agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    for _ in range(100):
+        if agent.num_calls == 300:
+            break
+        await asyncio.sleep(0.1)
+    assert agent.num_calls == 300
+
+    await worker1.stop()
+    await worker2.stop()
+    await proxy.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_worker_reconnect_resumes_session() -> None:
+    host_address = "localhost:50067"
+    proxy_address = "localhost:50068"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, reconnect_grace_period=10.0)
+    host.start()
+    proxy = TcpProxy(50067)
+    await proxy.start(50068)
+
+    # The first worker connects through the proxy.
+    worker1 = GrpcWorkerAgentRuntime(host_address=proxy_address, reconnect=True, replay_buffer_size=16)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker2.add_subscription(TypeSubscription("default", "name2"))
+    response = await worker2.send_message(ContentMessage(content="Hello!"), recipient=AgentId("name1", "default"))
+    assert response == ContentMessage(content="Hello!")
+
+    # The connection of the first worker is lost.
+    proxy.drop_connections()
+    # The host keeps the messages to the first worker, which sends its messages once reconnected.
+    response_task = asyncio.create_task(
+        worker2.send_message(ContentMessage(content="Again!"), recipient=AgentId("name1", "default"))
+    )
+    await worker1.publish_message(MessageType(), topic_id=TopicId("default", "default"))
+    response = await asyncio.wait_for(response_task, timeout=10)
+    assert response == ContentMessage(content="Again!")
+    worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 2
+    await asyncio.sleep(1)
+    worker2_agent = await worker2.try_get_underlying_agent_instance(AgentId("name2", "default"), LoopbackAgent)
+    assert worker2_agent.num_calls == 1
+
+    await worker1.stop()
+    await worker2.stop()
+    await proxy.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_worker_replay_buffer_trimmed_on_response() -> None:
+    host_address = "localhost:50082"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address, reconnect=True, replay_buffer_size=16)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+
+    # The messages sent before a request are no longer kept once the host forwards its response.
+    for i in range(3):
+        response = await worker1.send_message(ContentMessage(content=str(i)), recipient=AgentId("name2", "default"))
+        assert response == ContentMessage(content=str(i))
+    assert worker1._host_connection is not None  # type: ignore[reportPrivateUsage]
+    assert len(worker1._host_connection._replay_buffer) == 0  # type: ignore[reportPrivateUsage]
+    assert not worker1._host_connection._replay_request_sequence_numbers  # type: ignore[reportPrivateUsage]
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+class SlowLoopbackAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that responds after a delay.")
+
+    @event
+    async def on_event(self, message: ContentMessage, ctx: MessageContext) -> None:
+        pass
+
+    @rpc
+    async def on_request(self, message: ContentMessage, ctx: MessageContext) -> ContentMessage:
+        await asyncio.sleep(1)
+        return message
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_worker_reconnect_after_buffer_overflow(monkeypatch: pytest.MonkeyPatch) -> None:
+    from autogen_ext.runtimes.grpc import _constants
+
+    monkeypatch.setattr(_constants, "DETACHED_CLIENT_BUFFER_SIZE", 2)
+    host_address = "localhost:50080"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, reconnect_grace_period=10.0)
+    host.start()
+    proxy = TcpProxy(50080)
+    await proxy.start(50081)
+
+    # The first worker connects through the proxy.
+    worker1 = GrpcWorkerAgentRuntime(host_address="localhost:50081", reconnect=True, replay_buffer_size=16)
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    for worker in (worker1, worker2):
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: SlowLoopbackAgent(), expected_class=SlowLoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+    await worker2.register_factory(
+        type=AgentType("name2"), agent_factory=lambda: SlowLoopbackAgent(), expected_class=SlowLoopbackAgent
+    )
+
+    # The first worker is disconnected while it waits for a response, which the host buffers.
+    response_task = asyncio.create_task(
+        worker1.send_message(ContentMessage(content="Hello!"), recipient=AgentId("name2", "default"))
+    )
+    await asyncio.sleep(0.5)
+    await proxy.stop()
+    await asyncio.sleep(1)
+
+    # More events are sent to the first worker than the host buffers, so the response is dropped.
+    for _ in range(3):
+        await worker2.publish_message(ContentMessage(content="Event"), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(0.5)
+
+    # The session is not resumed, so the request fails rather than waiting forever.
+    proxy = TcpProxy(50080)
+    await proxy.start(50081)
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(response_task, timeout=10)
+
+    await worker1.stop()
+    await worker2.stop()
+    await proxy.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_worker_reconnect_after_host_restart() -> None:
+    host_address = "localhost:50069"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address, reconnect=True)
+    await worker1.start()
+    worker1.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await worker1.register_factory(
+        type=AgentType("name1"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+    await worker1.add_subscription(TypeSubscription("default", "name1"))
+
+    # The worker registers its agent type and subscriptions with the new host.
+    await host.stop()
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    await asyncio.sleep(3)
+
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker2.start()
+    worker2.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    response = await worker2.send_message(ContentMessage(content="Hello!"), recipient=AgentId("name1", "default"))
+    assert response == ContentMessage(content="Hello!")
+    await worker2.publish_message(ContentMessage(content="Hello!"), topic_id=TopicId("default", "default"))
+    await asyncio.sleep(1)
+    worker1_agent = await worker1.try_get_underlying_agent_instance(AgentId("name1", "default"), LoopbackAgent)
+    assert worker1_agent.num_calls == 2
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_worker_stops_while_host_unreachable() -> None:
+    host_address = "localhost:50074"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    worker = GrpcWorkerAgentRuntime(host_address=host_address, reconnect=True)
+    await worker.start()
+
+    # The worker keeps trying to reconnect to the stopped host until it is stopped.
+    await host.stop()
+    await asyncio.sleep(2)
+    await asyncio.wait_for(worker.stop(), timeout=5)
+    await asyncio.sleep(0.1)
+    # The calls of the failed reconnection attempts are cancelled.
+    assert not [
+        task for task in asyncio.all_tasks() if "_consume_request_iterator" in repr(task.get_coro()) and not task.done()
+    ]
+
+
 @pytest.mark.grpc
 @pytest.mark.asyncio
 async def test_register_receives_publish() -> None:
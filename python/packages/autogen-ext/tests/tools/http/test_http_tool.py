@@ -1,9 +1,12 @@
+import asyncio
 import json
 import logging
+import threading
 
 import httpx
 import pytest
 from autogen_core import CancellationToken, Component, ComponentModel
+from autogen_core.tools import StaticWorkbench
 from autogen_ext.tools.http import HttpTool
 from pydantic import ValidationError
 
@@ -205,3 +208,81 @@ def test_config_deserialization(test_config: ComponentModel) -> None:
     assert tool.server_params.scheme == test_config.config["scheme"]
     assert tool.server_params.method == test_config.config["method"]
     assert tool.server_params.headers == test_config.config["headers"]
+
+
+@pytest.mark.asyncio
+async def test_client_is_pooled(test_config: ComponentModel, test_server: None) -> None:
+    tool = HttpTool.load_component(test_config)
+
+    await tool.run_json({"query": "test query", "value": 1}, CancellationToken())
+    client = tool._client  # pyright: ignore[reportPrivateUsage]
+    assert client is not None
+    await tool.run_json({"query": "test query", "value": 2}, CancellationToken())
+    assert tool._client is client  # pyright: ignore[reportPrivateUsage]
+
+    # Closing the tool releases the client, and a new one is created on the next call.
+    await tool.close()
+    assert client.is_closed
+    result = await tool.run_json({"query": "test query", "value": 3}, CancellationToken())
+    assert json.loads(result)["result"] == "Received: test query with value 3"
+    assert tool._client is not client  # pyright: ignore[reportPrivateUsage]
+    await tool.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_client_is_closed(test_config: ComponentModel, test_server: None) -> None:
+    tool = HttpTool.load_component(test_config)
+    # Use the tool from an event loop in another thread.
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    try:
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                tool.run_json({"query": "test query", "value": 1}, CancellationToken()), loop
+            )
+        )
+        client = tool._client  # pyright: ignore[reportPrivateUsage]
+        assert client is not None
+
+        # The client of the other loop is closed on that loop when the tool is used from this loop.
+        await tool.run_json({"query": "test query", "value": 2}, CancellationToken())
+        assert tool._client is not client  # pyright: ignore[reportPrivateUsage]
+        for _ in range(50):
+            if client.is_closed:
+                break
+            await asyncio.sleep(0.01)
+        assert client.is_closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    await tool.close()
+
+
+@pytest.mark.asyncio
+async def test_workbench_stop_closes_client(test_config: ComponentModel, test_server: None) -> None:
+    tool = HttpTool.load_component(test_config)
+    workbench = StaticWorkbench([tool])
+    result = await workbench.call_tool("TestHttpTool", {"query": "test query", "value": 1})
+    assert not result.is_error
+    client = tool._client  # pyright: ignore[reportPrivateUsage]
+    assert client is not None
+    await workbench.stop()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_stream_response(test_config: ComponentModel, test_server: None) -> None:
+    config = test_config.model_copy(deep=True)
+    config.config["stream"] = True
+    config.config["return_type"] = "json"
+    config.config["retries"] = 2
+    tool = HttpTool.load_component(config)
+    assert tool.dump_component().config["stream"] is True
+
+    items = [item async for item in tool.run_json_stream({"query": "test query", "value": 42}, CancellationToken())]
+    assert len(items) >= 2
+    assert json.loads("".join(items[:-1])) == items[-1]
+    assert items[-1]["result"] == "Received: test query with value 42"
+    await tool.close()
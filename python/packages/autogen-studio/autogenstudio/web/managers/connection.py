@@ -15,6 +15,7 @@
     MultiModalMessage,
     StopMessage,
     TextMessage,
+    ToolCallExecutionChunkEvent,
     ToolCallExecutionEvent,
     ToolCallRequestEvent,
 )
@@ -373,7 +374,7 @@ def _format_message(self, message: Any) -> Optional[dict]:
                     "data": message.model_dump(),
                     "status": "complete",
                 }
-            elif isinstance(message, ModelClientStreamingChunkEvent):
+            elif isinstance(message, ModelClientStreamingChunkEvent | ToolCallExecutionChunkEvent):
                 return {"type": "message_chunk", "data": message.model_dump()}
 
             elif isinstance(
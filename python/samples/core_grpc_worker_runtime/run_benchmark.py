@@ -0,0 +1,92 @@
+"""Measure the throughput and latency of the worker-host message loop on a single machine.
+
+A host and two workers run in this process. One worker sends direct messages
+with a payload of the given size to an agent of the other worker, through the host,
+and the number of round trips per second and the latency of a round trip are reported
+for each address, e.g., a loopback TCP address and a Unix domain socket address:
+
+    python run_benchmark.py --address localhost:50051 unix:/tmp/autogen_benchmark.sock
+
+Run with `--log-level INFO` to include the cost of logging in the message loop."""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from dataclasses import dataclass
+from typing import List
+
+from autogen_core import AgentId, MessageContext, RoutedAgent, message_handler, try_get_known_serializers_for_type
+from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+
+
+@dataclass
+class Payload:
+    content: str
+
+
+class EchoAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("Echo Agent")
+
+    @message_handler
+    async def on_payload(self, message: Payload, ctx: MessageContext) -> Payload:
+        return message
+
+
+async def main(address: str, num_messages: int, payload_size: int, concurrency: int) -> None:
+    host = GrpcWorkerAgentRuntimeHost(address=address)
+    host.start()
+    sender = GrpcWorkerAgentRuntime(host_address=address)
+    receiver = GrpcWorkerAgentRuntime(host_address=address)
+    await sender.start()
+    await receiver.start()
+    sender.add_message_serializer(try_get_known_serializers_for_type(Payload))
+    receiver.add_message_serializer(try_get_known_serializers_for_type(Payload))
+    await EchoAgent.register(receiver, "echo", lambda: EchoAgent())
+
+    payload = Payload(content="x" * payload_size)
+    recipient = AgentId("echo", "default")
+    # Warm up the connections and the agent.
+    await sender.send_message(payload, recipient=recipient)
+
+    latencies: List[float] = []
+
+    async def send(count: int) -> None:
+        for _ in range(count):
+            sent = time.perf_counter()
+            await sender.send_message(payload, recipient=recipient)
+            latencies.append(time.perf_counter() - sent)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[send(num_messages // concurrency) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    total = num_messages // concurrency * concurrency
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(  # noqa: T201
+        f"{address}: {total} round trips of {payload_size} bytes with concurrency {concurrency}: "
+        f"{elapsed:.2f}s, {total / elapsed:.0f} round trips/s, "
+        f"latency p50 {percentiles[49] * 1000:.2f}ms, p99 {percentiles[98] * 1000:.2f}ms"
+    )
+
+    await sender.stop()
+    await receiver.stop()
+    await host.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the gRPC worker runtime over loopback.")
+    parser.add_argument("--address", nargs="+", default=["localhost:50051"], help="The addresses of the host.")
+    parser.add_argument("--num-messages", type=int, default=2000)
+    parser.add_argument("--payload-size", type=int, default=64 * 1024)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+    # Log to a null handler, so that the cost of formatting the records is measured without the cost of output.
+    logger = logging.getLogger("autogen_core")
+    logger.setLevel(args.log_level)
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    for address in args.address:
+        asyncio.run(main(address, args.num_messages, args.payload_size, args.concurrency))